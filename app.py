@@ -1,647 +1,1254 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, Listbox
-import db_manager  # Import our backend file
-
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Peer Tutoring Matching System")
-        self.geometry("1200x800") # Made window larger
-                # 🌈 --- Custom Style Setup ---
-        style = ttk.Style(self)
-        self.configure(bg="#EAF4FF")  # soft blue background
-
-        # Use a built-in theme as base
-        style.theme_use("clam")
-
-        # Notebook (Tabs)
-        style.configure("TNotebook", background="#EAF4FF", borderwidth=0)
-        style.configure("TNotebook.Tab", padding=[15, 8], font=("Helvetica", 12, "bold"))
-        style.map("TNotebook.Tab", background=[("selected", "#A5D8FF")])
-
-        # Frames and Labels
-        style.configure("TFrame", background="#EAF4FF")
-        style.configure("TLabelframe", background="#EAF4FF", font=("Helvetica", 11, "bold"))
-        style.configure("TLabelframe.Label", background="#EAF4FF", font=("Helvetica", 11, "bold"))
-
-        # Labels
-        style.configure("TLabel", background="#EAF4FF", font=("Helvetica", 10))
-
-        # Buttons
-        style.configure(
-            "TButton",
-            font=("Helvetica", 10, "bold"),
-            padding=6,
-            relief="flat",
-            background="#007ACC",
-            foreground="white"
-        )
-        style.map(
-            "TButton",
-            background=[("active", "#005A9E"), ("pressed", "#003E73")]
-        )
-
-
-                # --- Create Welcome Page ---
-        self.create_welcome_page()
-
-    def create_welcome_page(self):
-        """Display the initial welcome screen before showing the main app."""
-        self.welcome_frame = ttk.Frame(self, padding=50, style="TFrame")
-        self.welcome_frame.pack(fill=tk.BOTH, expand=True)
-        self.welcome_frame.configure(style="TFrame")
-
-
-        # Title
-        title_label = ttk.Label(
-            self.welcome_frame,
-            text="🎓 PEER TUTORING MATCHING SYSTEM 🎓",
-            font=("Helvetica", 26, "bold"),
-            anchor="center"
-        )
-        title_label.pack(pady=60)
-
-        # Team members
-        team_label = ttk.Label(
-            self.welcome_frame,
-            text="Developed by:\nMahith K Das (SRN: PES2UG23CS318)\nMaitreyi V Raghavan (SRN: PES2UG23CS319)",
-            font=("Helvetica", 16),
-            justify="center"
-        )
-        team_label.pack(pady=40)
-
-        # Continue button
-        continue_btn = ttk.Button(
-            self.welcome_frame,
-            text="Continue →",
-            command=self.show_main_app,
-            style="TButton"
-        )
-
-        continue_btn.pack(pady=30)
-
-    def show_main_app(self):
-        """Destroy welcome screen and load the main application tabs."""
-        self.welcome_frame.destroy()
-
-        # --- Create Tabs ---
-        self.notebook = ttk.Notebook(self)
-
-        self.tab_students = ttk.Frame(self.notebook, padding=10)
-        self.tab_teams = ttk.Frame(self.notebook, padding=10)
-        self.tab_sessions = ttk.Frame(self.notebook, padding=10)
-
-        self.notebook.add(self.tab_students, text="🎓 Student Management")
-        self.notebook.add(self.tab_teams, text="👥 Team Management")
-        self.notebook.add(self.tab_sessions, text="📘 Session Management")
-
-        self.notebook.pack(fill=tk.BOTH, expand=True)
-
-        # --- Status Bar ---
-        self.status_label = ttk.Label(self, text="Ready", relief=tk.SUNKEN, anchor="w")
-        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
-
-        # --- Create Tab Contents ---
-        self.create_student_tab()
-        self.create_team_tab()
-        self.create_session_tab()
-
-    # ===================================================================
-    # --- 1. STUDENT MANAGEMENT TAB ---
-    # ===================================================================
-    
-    def create_student_tab(self):
-        # --- Form Variables ---
-        self.student_form_vars = {
-            "name": tk.StringVar(), "email": tk.StringVar(),
-            "ph_no": tk.StringVar(), "dept": tk.StringVar(),
-            "year": tk.StringVar(), "role": tk.StringVar(value="mentee")
-        }
-        self.selected_student_id = None
-        
-        # --- Layout ---
-        main_frame = ttk.Frame(self.tab_students)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        tree_frame = ttk.Frame(main_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True)
-
-        # --- Student Table ---
-        columns = ("id", "name", "email", "phone", "dept", "year", "role")
-        self.student_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
-        for col in columns: self.student_tree.heading(col, text=col.title())
-        # Set column widths
-        self.student_tree.column("id", width=40, anchor="center")
-        self.student_tree.column("name", width=150)
-        self.student_tree.column("email", width=200)
-        self.student_tree.column("phone", width=100)
-        self.student_tree.column("dept", width=80)
-        self.student_tree.column("year", width=50, anchor="center")
-        self.student_tree.column("role", width=80)
-        
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.student_tree.yview)
-        self.student_tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.student_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.student_tree.bind("<<TreeviewSelect>>", self.on_student_select)
-
-        # --- Student Form ---
-        form_frame = ttk.LabelFrame(main_frame, text="Student Form", padding=15)
-        form_frame.pack(fill=tk.X, pady=10)
-        # Form fields
-        ttk.Label(form_frame, text="Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        ttk.Entry(form_frame, textvariable=self.student_form_vars["name"], width=40).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Label(form_frame, text="Email:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        ttk.Entry(form_frame, textvariable=self.student_form_vars["email"], width=40).grid(row=1, column=1, padx=5, pady=5)
-        ttk.Label(form_frame, text="Phone:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        ttk.Entry(form_frame, textvariable=self.student_form_vars["ph_no"], width=40).grid(row=2, column=1, padx=5, pady=5)
-        ttk.Label(form_frame, text="Dept:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
-
-        dept_options = ["CSE", "ECE", "Physics", "Chemistry", "Mathematics"]
-        self.dept_combobox = ttk.Combobox(
-            form_frame,
-            textvariable=self.student_form_vars["dept"],
-            values=dept_options,
-            state="readonly",
-            width=18
-        )
-        self.dept_combobox.grid(row=0, column=3, padx=5, pady=5)
-        self.dept_combobox.set("Select Department")
-
-        ttk.Label(form_frame, text="Year:").grid(row=1, column=2, padx=5, pady=5, sticky="w")
-
-        year_options = ["1", "2", "3", "4"]
-        self.year_combobox = ttk.Combobox(
-            form_frame,
-            textvariable=self.student_form_vars["year"],
-            values=year_options,
-            state="readonly",
-            width=18
-        )
-        self.year_combobox.grid(row=1, column=3, padx=5, pady=5)
-        self.year_combobox.set("Select Year")
-
-
-        ttk.Label(form_frame, text="Role:").grid(row=2, column=2, padx=5, pady=5, sticky="w")
-        ttk.Combobox(form_frame, textvariable=self.student_form_vars["role"], values=["mentee", "mentor"], state="readonly").grid(row=2, column=3, padx=5, pady=5)
-
-        # --- Button Frame ---
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=10)
-        ttk.Button(button_frame, text="Add Student", command=self.handle_add_student).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Update Student", command=self.handle_update_student).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Delete Student", command=self.handle_delete_student).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Clear Form", command=self.clear_student_form).pack(side=tk.LEFT, padx=5)
-        
-        # --- Initial Load ---
-        self.populate_student_list()
-
-    def populate_student_list(self):
-        for row in self.student_tree.get_children(): self.student_tree.delete(row)
-        students = db_manager.fetch_students()
-        if students:
-            for student in students:
-                self.student_tree.insert("", tk.END, values=(
-                    student['student_id'], student['name'], student['email'],
-                    student['ph_no'], student['dept'], student['year'], student['role']
-                ))
-            self.status_label.config(text=f"Loaded {len(students)} students.")
-        else: self.status_label.config(text="No students found.")
-
-    def on_student_select(self, event):
-        try:
-            selected_item = self.student_tree.selection()[0]
-            student = self.student_tree.item(selected_item, "values")
-            self.selected_student_id = student[0]
-            self.student_form_vars["name"].set(student[1])
-            self.student_form_vars["email"].set(student[2])
-            self.student_form_vars["ph_no"].set(student[3])
-            self.student_form_vars["dept"].set(student[4])
-            self.student_form_vars["year"].set(student[5])
-            self.student_form_vars["role"].set(student[6])
-            self.status_label.config(text=f"Selected student ID: {self.selected_student_id}")
-        except IndexError: pass
-
-    def clear_student_form(self):
-        for var in self.student_form_vars.values(): var.set("")
-        self.student_form_vars["role"].set("mentee")
-        self.selected_student_id = None
-        self.student_tree.selection_remove(self.student_tree.selection())
-        self.status_label.config(text="Form cleared.")
-
-    def handle_add_student(self):
-        data = {key: var.get() for key, var in self.student_form_vars.items()}
-        if not data["name"] or not data["email"]:
-            messagebox.showwarning("Validation Error", "Name and Email are required.")
-            return
-        if db_manager.add_student(data):
-            self.status_label.config(text="Student added!")
-            self.populate_student_list()
-            self.clear_student_form()
-            self.refresh_team_data() # Refresh team tab data
-        else: self.status_label.config(text="Failed to add student.")
-
-    def handle_update_student(self):
-        if self.selected_student_id is None:
-            messagebox.showwarning("Update Error", "Please select a student to update.")
-            return
-        data = {key: var.get() for key, var in self.student_form_vars.items()}
-        data["student_id"] = self.selected_student_id
-        if db_manager.update_student(data):
-            self.status_label.config(text="Student updated!")
-            self.populate_student_list()
-            self.clear_student_form()
-            self.refresh_team_data() # Refresh team tab data
-        else: self.status_label.config(text="Failed to update student.")
-
-    def handle_delete_student(self):
-        if self.selected_student_id is None:
-            messagebox.showwarning("Delete Error", "Please select a student to delete.")
-            return
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete student ID {self.selected_student_id}?"):
-            if db_manager.delete_student(self.selected_student_id):
-                self.status_label.config(text="Student deleted!")
-                self.populate_student_list()
-                self.clear_student_form()
-                self.refresh_team_data() # Refresh team tab data
-            else: self.status_label.config(text="Failed to delete student.")
-
-    # ===================================================================
-    # --- 2. TEAM MANAGEMENT TAB ---
-    # ===================================================================
-
-    def create_team_tab(self):
-        # --- Form Variables ---
-        self.team_name_var = tk.StringVar()
-        self.team_mentor_var = tk.StringVar()
-        self.selected_team_id = None
-        
-        # --- Store data for dropdowns ---
-        self.mentor_data = []
-        self.mentee_data = []
-
-        # --- Layout ---
-        main_frame = ttk.Frame(self.tab_teams)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # --- Top Frame: Team List & Members List ---
-        list_frame = ttk.Frame(main_frame)
-        list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Left: Team List
-        team_list_frame = ttk.LabelFrame(list_frame, text="All Teams")
-        team_list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        team_cols = ("id", "name", "mentor", "created")
-        self.team_tree = ttk.Treeview(team_list_frame, columns=team_cols, show="headings")
-        self.team_tree.heading("id", text="ID")
-        self.team_tree.heading("name", text="Team Name")
-        self.team_tree.heading("mentor", text="Mentor")
-        self.team_tree.heading("created", text="Created On")
-        self.team_tree.column("id", width=40, anchor="center")
-        self.team_tree.pack(fill=tk.BOTH, expand=True)
-        self.team_tree.bind("<<TreeviewSelect>>", self.on_team_select)
-
-        # Right: Team Members
-        member_list_frame = ttk.LabelFrame(list_frame, text="Team Members")
-        member_list_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
-        
-        member_cols = ("id", "name", "role")
-        self.member_tree = ttk.Treeview(member_list_frame, columns=member_cols, show="headings")
-        self.member_tree.heading("id", text="ID")
-        self.member_tree.heading("name", text="Name")
-        self.member_tree.heading("role", text="Role")
-        self.member_tree.column("id", width=40, anchor="center")
-        self.member_tree.pack(fill=tk.BOTH, expand=True)
-
-        # --- Bottom Frame: Forms ---
-        form_frame = ttk.Frame(main_frame)
-        form_frame.pack(fill=tk.X, pady=10)
-
-        # Left: Create Team
-        create_team_frame = ttk.LabelFrame(form_frame, text="Create New Team", padding=10)
-        create_team_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-
-        ttk.Label(create_team_frame, text="Team Name:").grid(row=0, column=0, sticky="w")
-        ttk.Entry(create_team_frame, textvariable=self.team_name_var, width=30).grid(row=0, column=1, pady=5)
-        
-        ttk.Label(create_team_frame, text="Select Mentor:").grid(row=1, column=0, sticky="w")
-        self.team_mentor_combo = ttk.Combobox(create_team_frame, textvariable=self.team_mentor_var, width=28, state="readonly")
-        self.team_mentor_combo.grid(row=1, column=1, pady=5)
-
-        ttk.Label(create_team_frame, text="Select Mentees (Ctrl+Click):").grid(row=2, column=0, sticky="w")
-        self.team_mentee_list = Listbox(create_team_frame, selectmode=tk.MULTIPLE, exportselection=False, height=5)
-        self.team_mentee_list.grid(row=2, column=1, pady=5)
-        
-        ttk.Button(create_team_frame, text="Create Team", command=self.handle_create_team).grid(row=3, column=0, columnspan=2, pady=10)
-
-        # Right: Add/Delete
-        actions_frame = ttk.LabelFrame(form_frame, text="Team Actions", padding=10)
-        actions_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        
-        ttk.Label(actions_frame, text="Note: Select a team from the list.").pack(pady=5)
-        ttk.Button(actions_frame, text="Delete Selected Team", command=self.handle_delete_team).pack(fill=tk.X, pady=5)
-        
-        # --- Initial Load ---
-        self.refresh_team_data()
-
-    def refresh_team_data(self):
-        """Helper to reload all data for the team tab."""
-        # Store mentors and mentees
-        self.mentor_data = db_manager.fetch_students_by_role('mentor')
-        self.mentee_data = db_manager.fetch_students_by_role('mentee')
-        
-        # Populate dropdowns
-        self.team_mentor_combo['values'] = [m['name'] for m in self.mentor_data]
-        
-        # Populate listbox
-        self.team_mentee_list.delete(0, tk.END)
-        for mentee in self.mentee_data:
-            self.team_mentee_list.insert(tk.END, mentee['name'])
-        
-        # Populate team list
-        self.populate_team_list()
-        
-        # Clear member list
-        for row in self.member_tree.get_children(): self.member_tree.delete(row)
-
-    def populate_team_list(self):
-        for row in self.team_tree.get_children(): self.team_tree.delete(row)
-        teams = db_manager.fetch_teams()
-        if teams:
-            for team in teams:
-                self.team_tree.insert("", tk.END, values=(
-                    team['team_id'], team['team_name'], 
-                    team['mentor_name'], team['creation_date']
-                ))
-
-    def on_team_select(self, event):
-        """When team is selected, show its members."""
-        try:
-            selected_item = self.team_tree.selection()[0]
-            team_values = self.team_tree.item(selected_item, "values")
-            self.selected_team_id = team_values[0]
-            self.status_label.config(text=f"Selected team ID: {self.selected_team_id}")
-            
-            # Populate member list
-            for row in self.member_tree.get_children(): self.member_tree.delete(row)
-            members = db_manager.fetch_team_members(self.selected_team_id)
-            for member in members:
-                self.member_tree.insert("", tk.END, values=(
-                    member['student_id'], member['name'], member['role']
-                ))
-        except IndexError: pass
-
-    def handle_create_team(self):
-        team_name = self.team_name_var.get()
-        mentor_name = self.team_mentor_var.get()
-        
-        if not team_name or not mentor_name:
-            messagebox.showwarning("Validation Error", "Team Name and Mentor are required.")
-            return
-
-        # Get mentor ID from name
-        mentor_id = None
-        for mentor in self.mentor_data:
-            if mentor['name'] == mentor_name:
-                mentor_id = mentor['student_id']
-                break
-        
-        # Get mentee IDs from listbox selection
-        selected_indices = self.team_mentee_list.curselection()
-        mentee_ids = [self.mentee_data[i]['student_id'] for i in selected_indices]
-        
-        if db_manager.create_team(team_name, mentor_id, mentee_ids):
-            self.status_label.config(text="Team created successfully!")
-            self.refresh_team_data()
-            self.team_name_var.set("")
-            self.team_mentor_var.set("")
-        else:
-            self.status_label.config(text="Failed to create team.")
-
-    def handle_delete_team(self):
-        if self.selected_team_id is None:
-            messagebox.showwarning("Delete Error", "Please select a team to delete.")
-            return
-            
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete this team?"):
-            if db_manager.delete_team(self.selected_team_id):
-                self.status_label.config(text="Team deleted!")
-                self.refresh_team_data()
-                self.selected_team_id = None
-            else:
-                self.status_label.config(text="Failed to delete team.")
-
-    # ===================================================================
-    # --- 3. SESSION MANAGEMENT TAB ---
-    # ===================================================================
-
-    def create_session_tab(self):
-        # --- Form Variables ---
-        self.session_subject_var = tk.StringVar()
-        self.session_datetime_var = tk.StringVar(value="YYYY-MM-DD HH:MM:SS")
-        self.session_duration_var = tk.StringVar(value="60")
-        self.session_mentor_var = tk.StringVar()
-        self.session_status_var = tk.StringVar()
-        self.selected_session_id = None
-
-        # --- Store data for dropdowns ---
-        self.subject_data = []
-        # We can re-use self.mentor_data and self.mentee_data
-
-        # --- Layout ---
-        main_frame = ttk.Frame(self.tab_sessions)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # --- Top Frame: Session List & Participants List ---
-        list_frame = ttk.Frame(main_frame)
-        list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Left: Session List
-        session_list_frame = ttk.LabelFrame(list_frame, text="All Sessions")
-        session_list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        session_cols = ("id", "subject", "datetime", "duration", "status")
-        self.session_tree = ttk.Treeview(session_list_frame, columns=session_cols, show="headings")
-        self.session_tree.heading("id", text="ID")
-        self.session_tree.heading("subject", text="Subject")
-        self.session_tree.heading("datetime", text="Date & Time")
-        self.session_tree.heading("duration", text="Duration (min)")
-        self.session_tree.heading("status", text="Status")
-        self.session_tree.column("id", width=40, anchor="center")
-        self.session_tree.column("datetime", width=150)
-        self.session_tree.pack(fill=tk.BOTH, expand=True)
-        self.session_tree.bind("<<TreeviewSelect>>", self.on_session_select)
-
-        # Right: Session Participants
-        participant_list_frame = ttk.LabelFrame(list_frame, text="Session Participants")
-        participant_list_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
-        
-        participant_cols = ("id", "name", "role")
-        self.participant_tree = ttk.Treeview(participant_list_frame, columns=participant_cols, show="headings")
-        self.participant_tree.heading("id", text="ID")
-        self.participant_tree.heading("name", text="Name")
-        self.participant_tree.heading("role", text="Role")
-        self.participant_tree.column("id", width=40, anchor="center")
-        self.participant_tree.pack(fill=tk.BOTH, expand=True)
-
-        # --- Bottom Frame: Forms ---
-        form_frame = ttk.Frame(main_frame)
-        form_frame.pack(fill=tk.X, pady=10)
-
-        # Left: Create Session
-        create_session_frame = ttk.LabelFrame(form_frame, text="Schedule New Session", padding=10)
-        create_session_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, anchor="n")
-
-        ttk.Label(create_session_frame, text="Subject:").grid(row=0, column=0, sticky="w", pady=2)
-        self.session_subject_combo = ttk.Combobox(create_session_frame, textvariable=self.session_subject_var, width=28, state="readonly")
-        self.session_subject_combo.grid(row=0, column=1, pady=2)
-        
-        ttk.Label(create_session_frame, text="Date/Time:").grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Entry(create_session_frame, textvariable=self.session_datetime_var, width=30).grid(row=1, column=1, pady=2)
-        
-        ttk.Label(create_session_frame, text="Duration (min):").grid(row=2, column=0, sticky="w", pady=2)
-        ttk.Entry(create_session_frame, textvariable=self.session_duration_var, width=30).grid(row=2, column=1, pady=2)
-
-        ttk.Label(create_session_frame, text="Select Mentor:").grid(row=3, column=0, sticky="w", pady=2)
-        self.session_mentor_combo = ttk.Combobox(create_session_frame, textvariable=self.session_mentor_var, width=28, state="readonly")
-        self.session_mentor_combo.grid(row=3, column=1, pady=2)
-
-        ttk.Label(create_session_frame, text="Select Mentees (Ctrl+Click):").grid(row=4, column=0, sticky="nw", pady=2)
-        self.session_mentee_list = Listbox(create_session_frame, selectmode=tk.MULTIPLE, exportselection=False, height=5)
-        self.session_mentee_list.grid(row=4, column=1, pady=2)
-        
-        ttk.Button(create_session_frame, text="Schedule Session", command=self.handle_schedule_session).grid(row=5, column=0, columnspan=2, pady=10)
-
-        # Right: Session Actions
-        actions_frame = ttk.LabelFrame(form_frame, text="Session Actions", padding=10)
-        actions_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, anchor="n")
-        
-        ttk.Label(actions_frame, text="Select a session from the list.").pack(pady=5)
-        ttk.Label(actions_frame, text="Set Status:").pack(pady=(10,0))
-        self.session_status_combo = ttk.Combobox(actions_frame, textvariable=self.session_status_var, values=["scheduled", "completed", "cancelled"], state="readonly")
-        self.session_status_combo.pack(pady=5, fill=tk.X)
-        ttk.Button(actions_frame, text="Update Status", command=self.handle_update_status).pack(fill=tk.X, pady=5)
-        
-        ttk.Button(actions_frame, text="Cancel (Delete) Session", command=self.handle_cancel_session).pack(fill=tk.X, pady=(15, 5))
-        
-        # --- Initial Load ---
-        self.refresh_session_data()
-
-    def refresh_session_data(self):
-        """Helper to reload all data for the session tab."""
-        # Store data
-        self.subject_data = db_manager.fetch_all_subjects()
-        # We re-use mentor/mentee data from team tab, but refresh just in case
-        self.mentor_data = db_manager.fetch_students_by_role('mentor')
-        self.mentee_data = db_manager.fetch_students_by_role('mentee')
-
-        # Populate dropdowns
-        self.session_subject_combo['values'] = [s['subject_name'] for s in self.subject_data]
-        self.session_mentor_combo['values'] = [m['name'] for m in self.mentor_data]
-        
-        # Populate listbox
-        self.session_mentee_list.delete(0, tk.END)
-        for mentee in self.mentee_data:
-            self.session_mentee_list.insert(tk.END, mentee['name'])
-        
-        # Populate session list
-        self.populate_session_list()
-        
-        # Clear participant list
-        for row in self.participant_tree.get_children(): self.participant_tree.delete(row)
-    
-    def populate_session_list(self):
-        for row in self.session_tree.get_children(): self.session_tree.delete(row)
-        sessions = db_manager.fetch_sessions()
-        if sessions:
-            for session in sessions:
-                self.session_tree.insert("", tk.END, values=(
-                    session['session_id'], session['subject_name'], 
-                    session['date_time'], session['duration'], session['status']
-                ))
-    
-    def on_session_select(self, event):
-        """When session is selected, show its participants and status."""
-        try:
-            selected_item = self.session_tree.selection()[0]
-            session_values = self.session_tree.item(selected_item, "values")
-            self.selected_session_id = session_values[0]
-            self.session_status_var.set(session_values[4])
-            self.status_label.config(text=f"Selected session ID: {self.selected_session_id}")
-            
-            # Populate participant list
-            for row in self.participant_tree.get_children(): self.participant_tree.delete(row)
-            participants = db_manager.fetch_session_participants(self.selected_session_id)
-            for p in participants:
-                self.participant_tree.insert("", tk.END, values=(
-                    p['student_id'], p['name'], p['role']
-                ))
-        except IndexError: pass
-
-    def handle_schedule_session(self):
-        subject_name = self.session_subject_var.get()
-        date_time = self.session_datetime_var.get()
-        duration = self.session_duration_var.get()
-        mentor_name = self.session_mentor_var.get()
-        
-        if not all([subject_name, date_time, duration, mentor_name]):
-            messagebox.showwarning("Validation Error", "All fields are required.")
-            return
-
-        # Get Subject ID
-        subject_id = next(s['subject_id'] for s in self.subject_data if s['subject_name'] == subject_name)
-        # Get Mentor ID
-        mentor_id = next(m['student_id'] for m in self.mentor_data if m['name'] == mentor_name)
-        # Get Mentee IDs
-        selected_indices = self.session_mentee_list.curselection()
-        mentee_ids = [self.mentee_data[i]['student_id'] for i in selected_indices]
-        # Convert list of IDs to comma-separated string for the stored procedure
-        mentee_ids_str = ",".join(map(str, mentee_ids))
-
-        if not mentee_ids_str:
-             messagebox.showwarning("Validation Error", "At least one mentee must be selected.")
-             return
-
-        if db_manager.schedule_session(subject_id, date_time, int(duration), mentor_id, mentee_ids_str):
-            self.status_label.config(text="Session scheduled successfully!")
-            self.refresh_session_data()
-        else:
-            self.status_label.config(text="Failed to schedule session.")
-            
-    def handle_update_status(self):
-        if self.selected_session_id is None:
-            messagebox.showwarning("Update Error", "Please select a session to update.")
-            return
-        
-        new_status = self.session_status_var.get()
-        if not new_status:
-            messagebox.showwarning("Update Error", "Please select a new status.")
-            return
-
-        if db_manager.update_session_status(self.selected_session_id, new_status):
-            self.status_label.config(text="Session status updated!")
-            self.refresh_session_data()
-            self.selected_session_id = None
-            self.session_status_var.set("")
-        else:
-            self.status_label.config(text="Failed to update status.")
-
-    def handle_cancel_session(self):
-        if self.selected_session_id is None:
-            messagebox.showwarning("Delete Error", "Please select a session to cancel.")
-            return
-            
-        if messagebox.askyesno("Confirm Cancel", "Are you sure you want to cancel (delete) this session?"):
-            if db_manager.cancel_session(self.selected_session_id):
-                self.status_label.config(text="Session cancelled (deleted).")
-                self.refresh_session_data()
-                self.selected_session_id = None
-                self.session_status_var.set("")
-            else:
-                self.status_label.config(text="Failed to cancel session.")
-
-# --- Run the App ---
-if __name__ == "__main__":
-    app = App()
-    app.mainloop()
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog, Listbox
+import db_manager  # Import our backend file
+import db_worker
+import export
+import feedback_analytics
+import feedback_buffer
+import matching
+import migrate
+import paged_tree
+import session_sweep
+import tree_sync
+
+# Pause after the last keystroke before the student search runs (ms)
+SEARCH_DELAY_MS = 300
+
+# How often the query statistics in the status bar / diagnostics window refresh (ms)
+TRACE_REFRESH_MS = 2000
+
+# Feedback Analytics "Group by" choices -> feedback_analytics dimension
+ANALYTICS_DIMENSIONS = {"Mentor": "mentor", "Subject": "subject", "Department": "dept"}
+
+class App(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Peer Tutoring Matching System")
+        self.geometry("1200x800") # Made window larger
+                # 🌈 --- Custom Style Setup ---
+        style = ttk.Style(self)
+        self.configure(bg="#EAF4FF")  # soft blue background
+
+        # Use a built-in theme as base
+        style.theme_use("clam")
+
+        # Notebook (Tabs)
+        style.configure("TNotebook", background="#EAF4FF", borderwidth=0)
+        style.configure("TNotebook.Tab", padding=[15, 8], font=("Helvetica", 12, "bold"))
+        style.map("TNotebook.Tab", background=[("selected", "#A5D8FF")])
+
+        # Frames and Labels
+        style.configure("TFrame", background="#EAF4FF")
+        style.configure("TLabelframe", background="#EAF4FF", font=("Helvetica", 11, "bold"))
+        style.configure("TLabelframe.Label", background="#EAF4FF", font=("Helvetica", 11, "bold"))
+
+        # Labels
+        style.configure("TLabel", background="#EAF4FF", font=("Helvetica", 10))
+
+        # Buttons
+        style.configure(
+            "TButton",
+            font=("Helvetica", 10, "bold"),
+            padding=6,
+            relief="flat",
+            background="#007ACC",
+            foreground="white"
+        )
+        style.map(
+            "TButton",
+            background=[("active", "#005A9E"), ("pressed", "#003E73")]
+        )
+
+
+        # --- Background DB worker (keeps the window responsive) ---
+        self.db = db_worker.DbWorker(self, on_busy_change=self.show_activity)
+
+        # --- Periodic sweep that completes past sessions (runs on the worker) ---
+        self.sweeper = session_sweep.SessionSweeper(interval=db_manager.SWEEP_INTERVAL)
+
+        # --- Feedback statistics, updated incrementally on each refresh ---
+        self.feedback_analytics = feedback_analytics.FeedbackAnalytics()
+
+        # --- Feedback is queued and written in batches (spooled to disk if the DB is down) ---
+        self.feedback_buffer = feedback_buffer.FeedbackBuffer()
+        self.feedback_buffer.start()
+
+                # --- Create Welcome Page ---
+        self.create_welcome_page()
+
+    def create_welcome_page(self):
+        """Display the initial welcome screen before showing the main app."""
+        self.welcome_frame = ttk.Frame(self, padding=50, style="TFrame")
+        self.welcome_frame.pack(fill=tk.BOTH, expand=True)
+        self.welcome_frame.configure(style="TFrame")
+
+
+        # Title
+        title_label = ttk.Label(
+            self.welcome_frame,
+            text="🎓 PEER TUTORING MATCHING SYSTEM 🎓",
+            font=("Helvetica", 26, "bold"),
+            anchor="center"
+        )
+        title_label.pack(pady=60)
+
+        # Team members
+        team_label = ttk.Label(
+            self.welcome_frame,
+            text="Developed by:\nMahith K Das (SRN: PES2UG23CS318)\nMaitreyi V Raghavan (SRN: PES2UG23CS319)",
+            font=("Helvetica", 16),
+            justify="center"
+        )
+        team_label.pack(pady=40)
+
+        # Continue button
+        continue_btn = ttk.Button(
+            self.welcome_frame,
+            text="Continue →",
+            command=self.show_main_app,
+            style="TButton"
+        )
+
+        continue_btn.pack(pady=30)
+
+    def show_main_app(self):
+        """Destroy welcome screen and load the main application tabs."""
+        self.welcome_frame.destroy()
+
+        # --- Create Tabs ---
+        self.notebook = ttk.Notebook(self)
+
+        self.tab_students = ttk.Frame(self.notebook, padding=10)
+        self.tab_teams = ttk.Frame(self.notebook, padding=10)
+        self.tab_sessions = ttk.Frame(self.notebook, padding=10)
+
+        self.notebook.add(self.tab_students, text="🎓 Student Management")
+        self.notebook.add(self.tab_teams, text="👥 Team Management")
+        self.notebook.add(self.tab_sessions, text="📘 Session Management")
+
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+
+        # --- Menu ---
+        menubar = tk.Menu(self)
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Feedback Analytics...", command=self.open_feedback_analytics)
+        tools_menu.add_command(label="Export Data...", command=self.open_export)
+        tools_menu.add_command(label="Database Diagnostics...", command=self.open_diagnostics)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        self.config(menu=menubar)
+        self.diagnostics_window = None
+        self.analytics_window = None
+
+        # --- Status Bar ---
+        status_frame = ttk.Frame(self)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_label = ttk.Label(status_frame, text="Ready", relief=tk.SUNKEN, anchor="w")
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.activity_label = ttk.Label(status_frame, text="", relief=tk.SUNKEN, anchor="e", width=36)
+        self.activity_label.pack(side=tk.RIGHT)
+        self.trace_label = ttk.Label(status_frame, text="", relief=tk.SUNKEN, anchor="e", width=34)
+        self.trace_label.pack(side=tk.RIGHT)
+        self.trace_label.bind("<Double-Button-1>", lambda e: self.open_diagnostics())
+        self.update_trace_label()
+
+        # --- Create Tab Contents ---
+        self.create_student_tab()
+        self.create_team_tab()
+        self.create_session_tab()
+
+        self.run_status_sweep()
+
+    def show_activity(self, labels):
+        """Shows in-flight database work in the right side of the status bar."""
+        if not hasattr(self, "activity_label"):
+            return
+        if not labels:
+            self.activity_label.config(text="")
+        elif len(labels) == 1:
+            self.activity_label.config(text=f"⏳ {labels[0]}...")
+        else:
+            self.activity_label.config(text=f"⏳ {labels[-1]}... (+{len(labels) - 1} more)")
+
+    def update_trace_label(self):
+        """Shows query count, p95 latency and slow queries in the status bar."""
+        s = db_manager.tracer.summary()
+        text = f"🛢 {s['queries']} queries"
+        if s['p95_ms'] is not None:
+            text += f" · p95 {s['p95_ms']:.0f} ms"
+        if s['slow']:
+            text += f" · {s['slow']} slow"
+        self.trace_label.config(text=text)
+        self.after(TRACE_REFRESH_MS, self.update_trace_label)
+
+    def run_status_sweep(self):
+        """Completes past sessions now and every SWEEP_INTERVAL seconds; refreshes the list if any changed."""
+        def done(rows):
+            if rows:
+                self.session_loader.refresh()
+        self.db.submit(self.sweeper.run_once, key="status_sweep", label="Updating session statuses",
+                       on_success=done, on_error=lambda e: None)  # counted in sweeper.metrics
+        self.after(int(self.sweeper.interval * 1000), self.run_status_sweep)
+
+    def show_task_error(self, error):
+        """Shows an error raised by a background db_manager call."""
+        if isinstance(error, db_manager.ValidationError):
+            messagebox.showwarning(error.title, str(error))
+        elif isinstance(error, db_manager.DatabaseError):
+            messagebox.showerror(error.title, str(error))
+        else:
+            messagebox.showerror("Database Error", f"Unexpected error: {error}")
+
+    def failed(self, status_text):
+        """Returns an on_error callback: status-bar message plus the error popup."""
+        def handle(error):
+            self.status_label.config(text=status_text)
+            self.show_task_error(error)
+        return handle
+
+    def failed_edit(self, status_text, loader):
+        """Like failed(), for versioned updates: after an edit conflict the list is re-read so the other change shows."""
+        def handle(error):
+            self.status_label.config(text=status_text)
+            self.show_task_error(error)
+            if isinstance(error, db_manager.ConcurrentUpdateError):
+                loader.refresh()
+        return handle
+
+    # ===================================================================
+    # --- FEEDBACK ANALYTICS WINDOW ---
+    # ===================================================================
+
+    def open_feedback_analytics(self):
+        """Opens (or raises) the window with rating statistics per mentor, subject or department."""
+        if self.analytics_window is not None and self.analytics_window.winfo_exists():
+            self.analytics_window.lift()
+            self.refresh_feedback_analytics()
+            return
+        win = tk.Toplevel(self)
+        win.title("Feedback Analytics")
+        win.geometry("980x480")
+        win.configure(bg="#EAF4FF")
+        self.analytics_window = win
+
+        top = ttk.Frame(win, padding=10)
+        top.pack(fill=tk.X)
+        ttk.Label(top, text="Group by:").pack(side=tk.LEFT)
+        self.analytics_dimension_var = tk.StringVar(value="Mentor")
+        dimension_combo = ttk.Combobox(top, textvariable=self.analytics_dimension_var,
+                                       values=list(ANALYTICS_DIMENSIONS), state="readonly", width=14)
+        dimension_combo.pack(side=tk.LEFT, padx=5)
+        dimension_combo.bind("<<ComboboxSelected>>", lambda e: self.show_feedback_analytics())
+        self.analytics_summary = ttk.Label(top, text="")
+        self.analytics_summary.pack(side=tk.LEFT, padx=15)
+
+        columns = ("name", "ratings", "avg", "moving", "recent", "trend", "s1", "s2", "s3", "s4", "s5")
+        tree = ttk.Treeview(win, columns=columns, show="headings")
+        headings = ("Name", "Ratings", "Average", f"Last {feedback_analytics.MOVING_WINDOW}",
+                    f"Last {feedback_analytics.TREND_DAYS} days", "Trend", "1★", "2★", "3★", "4★", "5★")
+        for col, text in zip(columns, headings):
+            tree.heading(col, text=text)
+            tree.column(col, width=70, anchor="e")
+        tree.column("name", width=240, anchor="w")
+        tree.column("recent", width=100, anchor="e")
+        tree.pack(fill=tk.BOTH, expand=True, padx=10)
+        # "" is the Treeview root's item id, so the no-department group needs another one
+        self.analytics_rows = tree_sync.TreeSync(
+            tree, lambda g: "(none)" if g['key'] == "" else g['key'],
+            lambda g: (g['label'], g['ratings'], g['average'], g['moving_average'],
+                       "" if g['trend_recent'] is None else g['trend_recent'],
+                       "" if g['trend'] is None else f"{g['trend']:+.2f}", *g['stars'])
+        )
+
+        button_frame = ttk.Frame(win, padding=10)
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh_feedback_analytics).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Recompute", command=lambda: self.refresh_feedback_analytics(reload=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=win.destroy).pack(side=tk.RIGHT)
+
+        self.show_feedback_analytics()
+        self.refresh_feedback_analytics()
+
+    def refresh_feedback_analytics(self, reload=False):
+        """Reads the feedback added since the last refresh (or all of it) in the background, then redraws."""
+        fn = self.feedback_analytics.reload if reload else self.feedback_analytics.refresh
+        self.db.submit(fn, key="feedback_analytics", label="Reading feedback",
+                       on_success=lambda _: self.show_feedback_analytics(),
+                       on_error=self.failed("Failed to load feedback."))
+
+    def show_feedback_analytics(self):
+        if self.analytics_window is None or not self.analytics_window.winfo_exists():
+            return
+        dimension = ANALYTICS_DIMENSIONS[self.analytics_dimension_var.get()]
+        self.analytics_rows.sync(self.feedback_analytics.summary(dimension))
+        overall = self.feedback_analytics.overall()
+        text = f"{overall['ratings']} ratings"
+        if overall['average'] is not None:
+            text += f", average {overall['average']}"
+        self.analytics_summary.config(text=text)
+
+    # ===================================================================
+    # --- EXPORT ---
+    # ===================================================================
+
+    def open_export(self):
+        """Streams sessions, participants, team members and feedback to CSV and columnar files."""
+        out_dir = filedialog.askdirectory(title="Export to folder", mustexist=False)
+        if not out_dir:
+            return
+        formats = export.DEFAULT_FORMATS + (("parquet",) if export.pyarrow is not None else ())
+
+        def done(results):
+            self.status_label.config(text=f"Exported {sum(r['rows'] for r in results)} rows to {out_dir}.")
+            messagebox.showinfo("Export Complete", "\n".join(
+                f"{r['table']}: {r['rows']} rows" for r in results) + f"\n\nFiles in {out_dir}")
+        self.db.submit(export.export_tables, out_dir, formats=formats, label="Exporting data",
+                       on_success=done, on_error=self.failed("Export failed."))
+
+    # ===================================================================
+    # --- DATABASE DIAGNOSTICS WINDOW ---
+    # ===================================================================
+
+    def open_diagnostics(self):
+        """Opens (or raises) the window with per-statement and per-function timings."""
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.lift()
+            return
+        win = tk.Toplevel(self)
+        win.title("Database Diagnostics")
+        win.geometry("1000x520")
+        win.configure(bg="#EAF4FF")
+        self.diagnostics_window = win
+
+        self.diag_summary = ttk.Label(win, text="", justify="left", padding=10)
+        self.diag_summary.pack(fill=tk.X)
+
+        tabs = ttk.Notebook(win)
+        tabs.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        stmt_frame = ttk.Frame(tabs)
+        columns = ("statement", "calls", "avg", "p95", "max", "fetch", "rows")
+        self.diag_statement_tree = ttk.Treeview(stmt_frame, columns=columns, show="headings")
+        headings = ("Statement", "Calls", "Avg ms", "p95 ms", "Max ms", "Fetch ms", "Rows")
+        for col, text in zip(columns, headings):
+            self.diag_statement_tree.heading(col, text=text)
+            self.diag_statement_tree.column(col, width=70, anchor="e")
+        self.diag_statement_tree.column("statement", width=520, anchor="w")
+        self.diag_statement_tree.pack(fill=tk.BOTH, expand=True)
+        tabs.add(stmt_frame, text="Statements")
+
+        func_frame = ttk.Frame(tabs)
+        columns = ("function", "calls", "avg", "p50", "p95", "max")
+        self.diag_function_tree = ttk.Treeview(func_frame, columns=columns, show="headings")
+        headings = ("Function", "Calls", "Avg ms", "p50 ms", "p95 ms", "Max ms")
+        for col, text in zip(columns, headings):
+            self.diag_function_tree.heading(col, text=text)
+            self.diag_function_tree.column(col, width=80, anchor="e")
+        self.diag_function_tree.column("function", width=260, anchor="w")
+        self.diag_function_tree.pack(fill=tk.BOTH, expand=True)
+        tabs.add(func_frame, text="Functions")
+
+        self.diag_statement_rows = tree_sync.TreeSync(
+            self.diag_statement_tree, lambda s: s['statement'],
+            lambda s: (s['statement'], s['count'], s['avg_ms'], s['p95_ms'], s['max_ms'], s['fetch_ms'], s['rows'])
+        )
+        self.diag_function_rows = tree_sync.TreeSync(
+            self.diag_function_tree, lambda f: f['function'],
+            lambda f: (f['function'], f['count'], f['avg_ms'], f['p50_ms'], f['p95_ms'], f['max_ms'])
+        )
+
+        button_frame = ttk.Frame(win, padding=10)
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Reset", command=self.reset_diagnostics).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=win.destroy).pack(side=tk.RIGHT)
+
+        self.refresh_diagnostics()
+
+    def refresh_diagnostics(self):
+        if self.diagnostics_window is None or not self.diagnostics_window.winfo_exists():
+            return
+        snap = db_manager.trace_stats()
+        pool = db_manager.pool_stats()
+        sweep = self.sweeper.snapshot()
+        feedback = self.feedback_buffer.snapshot()
+        totals = snap['totals']
+
+        def line(name, hist):
+            if not hist['count']:
+                return f"{name}: -"
+            return f"{name}: {hist['count']} × avg {hist['avg_ms']} ms, p95 {hist['p95_ms']} ms, max {hist['max_ms']} ms"
+
+        self.diag_summary.config(text="\n".join([
+            f"Database: {db_manager.backend.describe()}",
+            line("Connect (pool checkout)", totals['connect']),
+            line("Execute", totals['execute']),
+            line("Fetch", totals['fetch']) + f", {snap['rows']} rows",
+            f"Slow queries (> {snap['slow_ms']} ms): {snap['slow_queries']}"
+            + (f", logged to {snap['slow_log']}" if snap['slow_log'] else "")
+            + f"   Errors: {snap['errors']}",
+            f"Pool: {pool['in_use']} in use, {pool['idle']} idle of {pool['size']}; "
+            f"{pool['checkouts']} checkouts, {pool['waits']} waits, {pool['handshakes']} handshakes, "
+            f"{pool['reconnects']} reconnects",
+            f"Status sweep: {sweep['runs']} runs, {sweep['rows_touched']} sessions completed"
+            + (f", last at {sweep['last_run_at']:%H:%M:%S} ({sweep['last_rows']} rows, {sweep['last_seconds']}s)"
+               if sweep['last_run_at'] else "")
+            + (f", {sweep['errors']} errors (last: {sweep['last_error']})" if sweep['errors'] else ""),
+            f"Feedback buffer: {feedback['pending']} queued, {feedback['spooled']} spooled; "
+            f"{feedback['written']} written in {feedback['batches']} batches, {feedback['rejected']} rejected, "
+            f"{feedback['dead_lettered']} dead-lettered"
+            + (f", {feedback['errors']} errors (last: {feedback['last_error']})" if feedback['errors'] else ""),
+        ]))
+        self.diag_statement_rows.sync(snap['statements'])
+        functions = [dict(hist, function=name) for name, hist in snap['operations'].items()]
+        functions.sort(key=lambda f: f['avg_ms'] * f['count'], reverse=True)
+        self.diag_function_rows.sync(functions)
+        self.diagnostics_window.after(TRACE_REFRESH_MS, self.refresh_diagnostics)
+
+    def reset_diagnostics(self):
+        db_manager.tracer.reset()
+        self.diag_statement_rows.clear()
+        self.diag_function_rows.clear()
+
+    # ===================================================================
+    # --- 1. STUDENT MANAGEMENT TAB ---
+    # ===================================================================
+    
+    def create_student_tab(self):
+        # --- Form Variables ---
+        self.student_form_vars = {
+            "name": tk.StringVar(), "email": tk.StringVar(),
+            "ph_no": tk.StringVar(), "dept": tk.StringVar(),
+            "year": tk.StringVar(), "role": tk.StringVar(value="mentee")
+        }
+        self.selected_student_id = None
+        self.selected_student_version = None   # row version the form was filled from
+        
+        # --- Layout ---
+        main_frame = ttk.Frame(self.tab_students)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        dept_options = ["CSE", "ECE", "Physics", "Chemistry", "Mathematics"]
+
+        # --- Search Bar (runs server-side as you type) ---
+        self.student_search_vars = {
+            "text": tk.StringVar(), "dept": tk.StringVar(),
+            "year": tk.StringVar(), "role": tk.StringVar()
+        }
+        self.student_search_after = None
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(search_frame, text="🔍 Search name/email:").pack(side=tk.LEFT)
+        ttk.Entry(search_frame, textvariable=self.student_search_vars["text"], width=30).pack(side=tk.LEFT, padx=5)
+        ttk.Label(search_frame, text="Dept:").pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Combobox(search_frame, textvariable=self.student_search_vars["dept"], values=[""] + dept_options,
+                     width=12, state="readonly").pack(side=tk.LEFT, padx=5)
+        ttk.Label(search_frame, text="Year:").pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Combobox(search_frame, textvariable=self.student_search_vars["year"], values=["", "1", "2", "3", "4"],
+                     width=4, state="readonly").pack(side=tk.LEFT, padx=5)
+        ttk.Label(search_frame, text="Role:").pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Combobox(search_frame, textvariable=self.student_search_vars["role"], values=["", "mentor", "mentee"],
+                     width=8, state="readonly").pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_frame, text="Clear", command=self.clear_student_search).pack(side=tk.LEFT, padx=10)
+        for var in self.student_search_vars.values():
+            var.trace_add("write", lambda *args: self.schedule_student_search())
+
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+
+        # --- Student Table ---
+        columns = ("id", "name", "email", "phone", "dept", "year", "role")
+        self.student_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        for col in columns: self.student_tree.heading(col, text=col.title())
+        # Set column widths
+        self.student_tree.column("id", width=40, anchor="center")
+        self.student_tree.column("name", width=150)
+        self.student_tree.column("email", width=200)
+        self.student_tree.column("phone", width=100)
+        self.student_tree.column("dept", width=80)
+        self.student_tree.column("year", width=50, anchor="center")
+        self.student_tree.column("role", width=80)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.student_tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.student_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.student_tree.bind("<<TreeviewSelect>>", self.on_student_select)
+
+        # Rows are loaded page by page as the list is scrolled
+        self.student_loader = paged_tree.PagedTreeLoader(
+            self.student_tree, self.db, "students",
+            fetch_page=db_manager.fetch_students_page, count=db_manager.count_students,
+            row_key=lambda s: s['student_id'],
+            row_values=lambda s: (
+                s['student_id'], s['name'], s['email'],
+                s['ph_no'], s['dept'], s['year'], s['role']
+            ),
+            page_key=lambda s: s['student_id'],
+            scrollbar=scrollbar, page_size=db_manager.PAGE_SIZE,
+            on_loaded=self.show_student_count, on_error=self.show_task_error,
+            on_rows=self.keep_student_versions
+        )
+        # Row version of every loaded student, sent back with updates (optimistic concurrency)
+        self.student_versions = {}
+
+        # --- Student Form ---
+        form_frame = ttk.LabelFrame(main_frame, text="Student Form", padding=15)
+        form_frame.pack(fill=tk.X, pady=10)
+        # Form fields
+        ttk.Label(form_frame, text="Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        ttk.Entry(form_frame, textvariable=self.student_form_vars["name"], width=40).grid(row=0, column=1, padx=5, pady=5)
+        ttk.Label(form_frame, text="Email:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+        ttk.Entry(form_frame, textvariable=self.student_form_vars["email"], width=40).grid(row=1, column=1, padx=5, pady=5)
+        ttk.Label(form_frame, text="Phone:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        ttk.Entry(form_frame, textvariable=self.student_form_vars["ph_no"], width=40).grid(row=2, column=1, padx=5, pady=5)
+        ttk.Label(form_frame, text="Dept:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
+
+        self.dept_combobox = ttk.Combobox(
+            form_frame,
+            textvariable=self.student_form_vars["dept"],
+            values=dept_options,
+            state="readonly",
+            width=18
+        )
+        self.dept_combobox.grid(row=0, column=3, padx=5, pady=5)
+        self.dept_combobox.set("Select Department")
+
+        ttk.Label(form_frame, text="Year:").grid(row=1, column=2, padx=5, pady=5, sticky="w")
+
+        year_options = ["1", "2", "3", "4"]
+        self.year_combobox = ttk.Combobox(
+            form_frame,
+            textvariable=self.student_form_vars["year"],
+            values=year_options,
+            state="readonly",
+            width=18
+        )
+        self.year_combobox.grid(row=1, column=3, padx=5, pady=5)
+        self.year_combobox.set("Select Year")
+
+
+        ttk.Label(form_frame, text="Role:").grid(row=2, column=2, padx=5, pady=5, sticky="w")
+        ttk.Combobox(form_frame, textvariable=self.student_form_vars["role"], values=["mentee", "mentor"], state="readonly").grid(row=2, column=3, padx=5, pady=5)
+
+        # --- Button Frame ---
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+        ttk.Button(button_frame, text="Add Student", command=self.handle_add_student).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Update Student", command=self.handle_update_student).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Delete Student", command=self.handle_delete_student).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear Form", command=self.clear_student_form).pack(side=tk.LEFT, padx=5)
+        
+        # --- Initial Load ---
+        self.populate_student_list()
+
+    def populate_student_list(self):
+        self.student_loader.reload()
+
+    def student_search_filters(self):
+        """Current search box/filter values, or None when nothing is filtered."""
+        filters = {key: var.get().strip() for key, var in self.student_search_vars.items()}
+        return filters if any(filters.values()) else None
+
+    def schedule_student_search(self):
+        """Debounce: (re)start the timer on every change; the search runs once typing pauses."""
+        if self.student_search_after is not None:
+            self.after_cancel(self.student_search_after)
+        self.student_search_after = self.after(SEARCH_DELAY_MS, self.run_student_search)
+
+    def run_student_search(self):
+        self.student_search_after = None
+        filters = self.student_search_filters()
+        if filters is None:
+            self.student_loader.fetch_page = db_manager.fetch_students_page
+            self.student_loader.count = db_manager.count_students
+        else:
+            self.student_loader.fetch_page = (
+                lambda after, limit: db_manager.search_students(after_id=after, limit=limit, **filters))
+            self.student_loader.count = lambda: db_manager.count_search_results(**filters)
+        # Same worker keys as before, so results of superseded searches are dropped
+        self.student_loader.reload()
+
+    def clear_student_search(self):
+        for var in self.student_search_vars.values():
+            var.set("")
+
+    def show_student_count(self, loaded, total):
+        if loaded:
+            total_text = "?" if total is None else total
+            self.status_label.config(text=f"Loaded {loaded} of {total_text} students.")
+        elif total is not None: self.status_label.config(text="No students found.")
+        if self.student_search_filters() is not None and total is not None:
+            self.status_label.config(text=f"{total} students match the search (showing {loaded}).")
+
+    def keep_student_versions(self, rows, replaced):
+        if replaced:
+            self.student_versions = {}
+        for s in rows:
+            self.student_versions[s['student_id']] = s['version']
+
+    def on_student_select(self, event):
+        try:
+            selected_item = self.student_tree.selection()[0]
+            student = self.student_tree.item(selected_item, "values")
+            self.selected_student_id = student[0]
+            self.selected_student_version = self.student_versions.get(int(selected_item))
+            self.student_form_vars["name"].set(student[1])
+            self.student_form_vars["email"].set(student[2])
+            self.student_form_vars["ph_no"].set(student[3])
+            self.student_form_vars["dept"].set(student[4])
+            self.student_form_vars["year"].set(student[5])
+            self.student_form_vars["role"].set(student[6])
+            self.status_label.config(text=f"Selected student ID: {self.selected_student_id}")
+        except IndexError: pass
+
+    def clear_student_form(self):
+        for var in self.student_form_vars.values(): var.set("")
+        self.student_form_vars["role"].set("mentee")
+        self.selected_student_id = None
+        self.selected_student_version = None
+        self.student_tree.selection_remove(self.student_tree.selection())
+        self.status_label.config(text="Form cleared.")
+
+    def handle_add_student(self):
+        data = {key: var.get() for key, var in self.student_form_vars.items()}
+        if not data["name"] or not data["email"]:
+            messagebox.showwarning("Validation Error", "Name and Email are required.")
+            return
+        def done(result):
+            # The insert, the new row and the mentor/mentee lists came back from one unit of work
+            student = result['student']
+            # New IDs sort last, so only this one row needs to be shown (unless a search is active)
+            if self.student_search_filters() is None:
+                self.student_loader.row_added(student)
+            self.student_versions[student['student_id']] = student['version']
+            self.after_student_saved("Student added!", (result['mentor_lookup'], result['mentee_lookup']))
+            messagebox.showinfo("Success", f"Student '{data['name']}' added successfully!")
+        self.db.submit(db_manager.add_student_and_reload, data, label="Adding student",
+                       on_success=done, on_error=self.failed("Failed to add student."))
+
+    def after_student_saved(self, status_text, lookups=None):
+        """
+        Shared follow-up for add/update/delete student. `lookups` (mentor,
+        mentee) already re-read with the write are shown without another
+        query; a new student changes no team or session, so those lists stay.
+        """
+        self.status_label.config(text=status_text)
+        self.clear_student_form()
+        if lookups is not None:
+            self.mentor_lookup, self.mentee_lookup = lookups
+            self.fill_team_choices()
+            self.fill_session_choices()
+            return
+        # Both tabs re-read mentors/mentees; the student write already
+        # invalidated the cache, so this costs one query for both roles.
+        self.refresh_team_data()
+        self.refresh_session_data(sessions=False)
+
+    def handle_update_student(self):
+        if self.selected_student_id is None:
+            messagebox.showwarning("Update Error", "Please select a student to update.")
+            return
+        data = {key: var.get() for key, var in self.student_form_vars.items()}
+        data["student_id"] = self.selected_student_id
+        data["version"] = self.selected_student_version
+        def done(student):
+            # The row as stored (e.g. year as a number), so the list's next sync sees no change
+            self.student_versions[student['student_id']] = student['version']
+            self.student_loader.row_changed(student)
+            self.after_student_saved("Student updated!")
+        self.db.submit(db_manager.update_student_and_reload, data, label="Updating student", on_success=done,
+                       on_error=self.failed_edit("Failed to update student.", self.student_loader))
+
+    def handle_delete_student(self):
+        if self.selected_student_id is None:
+            messagebox.showwarning("Delete Error", "Please select a student to delete.")
+            return
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete student ID {self.selected_student_id}?"):
+            student_id = self.selected_student_id
+            def done(_):
+                self.student_loader.row_removed(student_id)
+                self.after_student_saved("Student deleted!")
+            self.db.submit(db_manager.delete_student, student_id, label="Deleting student",
+                           on_success=done, on_error=self.failed("Failed to delete student."))
+
+    # ===================================================================
+    # --- 2. TEAM MANAGEMENT TAB ---
+    # ===================================================================
+
+    def create_team_tab(self):
+        # --- Form Variables ---
+        self.team_name_var = tk.StringVar()
+        self.team_mentor_var = tk.StringVar()
+        self.selected_team_id = None
+        
+        # --- Store data for dropdowns (ref_cache.Lookup: by ID and by label) ---
+        self.mentor_lookup = None
+        self.mentee_lookup = None
+        self.team_mentees_shown = []  # rows currently in team_mentee_list
+
+        # --- Layout ---
+        main_frame = ttk.Frame(self.tab_teams)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # --- Top Frame: Team List & Members List ---
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        # Left: Team List
+        team_list_frame = ttk.LabelFrame(list_frame, text="All Teams")
+        team_list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+        
+        team_cols = ("id", "name", "mentor", "created")
+        self.team_tree = ttk.Treeview(team_list_frame, columns=team_cols, show="headings")
+        self.team_tree.heading("id", text="ID")
+        self.team_tree.heading("name", text="Team Name")
+        self.team_tree.heading("mentor", text="Mentor")
+        self.team_tree.heading("created", text="Created On")
+        self.team_tree.column("id", width=40, anchor="center")
+        team_scrollbar = ttk.Scrollbar(team_list_frame, orient=tk.VERTICAL, command=self.team_tree.yview)
+        team_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.team_tree.pack(fill=tk.BOTH, expand=True)
+        self.team_tree.bind("<<TreeviewSelect>>", self.on_team_select)
+
+        self.team_loader = paged_tree.PagedTreeLoader(
+            self.team_tree, self.db, "teams",
+            fetch_page=db_manager.fetch_teams_page, count=db_manager.count_teams,
+            row_key=lambda t: t['team_id'],
+            row_values=lambda t: (
+                t['team_id'], t['team_name'],
+                t['mentor_name'], t['creation_date']
+            ),
+            page_key=lambda t: t['team_name'],
+            scrollbar=team_scrollbar, page_size=db_manager.PAGE_SIZE,
+            on_error=self.show_task_error, on_rows=self.prefetch_team_members
+        )
+
+        # Right: Team Members
+        member_list_frame = ttk.LabelFrame(list_frame, text="Team Members")
+        member_list_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
+        
+        member_cols = ("id", "name", "role")
+        self.member_tree = ttk.Treeview(member_list_frame, columns=member_cols, show="headings")
+        self.member_tree.heading("id", text="ID")
+        self.member_tree.heading("name", text="Name")
+        self.member_tree.heading("role", text="Role")
+        self.member_tree.column("id", width=40, anchor="center")
+        self.member_tree.pack(fill=tk.BOTH, expand=True)
+        self.member_rows = tree_sync.TreeSync(
+            self.member_tree, lambda m: m['student_id'],
+            lambda m: (m['student_id'], m['name'], m['role'])
+        )
+
+        # --- Bottom Frame: Forms ---
+        form_frame = ttk.Frame(main_frame)
+        form_frame.pack(fill=tk.X, pady=10)
+
+        # Left: Create Team
+        create_team_frame = ttk.LabelFrame(form_frame, text="Create New Team", padding=10)
+        create_team_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+
+        ttk.Label(create_team_frame, text="Team Name:").grid(row=0, column=0, sticky="w")
+        ttk.Entry(create_team_frame, textvariable=self.team_name_var, width=30).grid(row=0, column=1, pady=5)
+        
+        ttk.Label(create_team_frame, text="Select Mentor:").grid(row=1, column=0, sticky="w")
+        self.team_mentor_combo = ttk.Combobox(create_team_frame, textvariable=self.team_mentor_var, width=28, state="readonly")
+        self.team_mentor_combo.grid(row=1, column=1, pady=5)
+
+        ttk.Label(create_team_frame, text="Select Mentees (Ctrl+Click):").grid(row=2, column=0, sticky="w")
+        self.team_mentee_list = Listbox(create_team_frame, selectmode=tk.MULTIPLE, exportselection=False, height=5)
+        self.team_mentee_list.grid(row=2, column=1, pady=5)
+        
+        ttk.Button(create_team_frame, text="Create Team", command=self.handle_create_team).grid(row=3, column=0, columnspan=2, pady=10)
+
+        # Right: Add/Delete
+        actions_frame = ttk.LabelFrame(form_frame, text="Team Actions", padding=10)
+        actions_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        
+        ttk.Label(actions_frame, text="Note: Select a team from the list.").pack(pady=5)
+        ttk.Button(actions_frame, text="Delete Selected Team", command=self.handle_delete_team).pack(fill=tk.X, pady=5)
+        ttk.Button(actions_frame, text="Auto-Match Mentees...", command=self.open_auto_match).pack(fill=tk.X, pady=(15, 5))
+        
+        # --- Initial Load ---
+        self.refresh_team_data()
+
+    def refresh_team_data(self):
+        """Helper to reload all data for the team tab."""
+        self.db.submit(db_manager.get_student_lookups, key="team_tab", label="Loading teams",
+                       on_success=self.fill_team_data, on_error=self.show_task_error)
+
+    def fill_team_data(self, result):
+        # Store mentors and mentees
+        self.mentor_lookup, self.mentee_lookup = result
+        self.fill_team_choices()
+        
+        # Populate team list (applies only new/changed/removed teams)
+        self.team_loader.refresh()
+        
+        # Clear member list (and drop any member load still in flight)
+        self.db.cancel("team_members")
+        self.member_rows.clear()
+
+    def fill_team_choices(self):
+        # Populate dropdowns (labels carry the ID, so equal names stay distinct)
+        self.team_mentor_combo['values'] = self.mentor_lookup.labels
+        
+        # Populate listbox (only changed entries are touched)
+        tree_sync.sync_listbox(self.team_mentee_list, self.team_mentees_shown, self.mentee_lookup.rows,
+                               lambda m: m['student_id'], self.mentee_lookup.label)
+        self.team_mentees_shown = self.mentee_lookup.rows
+
+    def prefetch_team_members(self, rows, replaced):
+        """Loads members of a freshly loaded page of teams in one query, into the member cache."""
+        if replaced:
+            rows = rows[:db_manager.PAGE_SIZE]  # after a refresh, only the top of the list is in view
+        team_ids = [t['team_id'] for t in rows]
+        if team_ids:
+            self.db.submit(db_manager.get_team_members, team_ids,
+                           key="team_member_prefetch", label="Loading team members",
+                           on_error=lambda e: None)  # not fatal: a click loads them instead
+
+    def on_team_select(self, event):
+        """When team is selected, show its members."""
+        try:
+            selected_item = self.team_tree.selection()[0]
+            team_values = self.team_tree.item(selected_item, "values")
+            self.selected_team_id = team_values[0]
+            self.status_label.config(text=f"Selected team ID: {self.selected_team_id}")
+            
+            # Usually prefetched with the page; otherwise load it (only the latest click wins)
+            team_id = int(selected_item)
+            members = db_manager.team_member_cache.peek(team_id)
+            if members is not None:
+                self.db.cancel("team_members")
+                self.fill_member_list(members)
+            else:
+                self.db.submit(db_manager.get_team_members, [team_id],
+                               key="team_members", label="Loading team members",
+                               on_success=lambda result: self.fill_member_list(result[team_id]),
+                               on_error=self.show_task_error)
+        except IndexError: pass
+
+    def fill_member_list(self, members):
+        self.member_rows.sync(members)
+
+    def handle_create_team(self):
+        team_name = self.team_name_var.get()
+        mentor_label = self.team_mentor_var.get()
+        
+        if not team_name or not mentor_label:
+            messagebox.showwarning("Validation Error", "Team Name and Mentor are required.")
+            return
+
+        # Get mentor ID from the selected label
+        mentor_id = self.mentor_lookup.id_for(mentor_label)
+        if mentor_id is None:
+            messagebox.showwarning("Validation Error", "Please pick the mentor again; the list has changed.")
+            return
+        
+        # Get mentee IDs from listbox selection
+        selected_indices = self.team_mentee_list.curselection()
+        mentee_ids = [self.team_mentees_shown[i]['student_id'] for i in selected_indices]
+        
+        def done(_):
+            self.status_label.config(text="Team created successfully!")
+            self.refresh_team_data()
+            self.team_name_var.set("")
+            self.team_mentor_var.set("")
+        self.db.submit(db_manager.create_team, team_name, mentor_id, mentee_ids, label="Creating team",
+                       on_success=done, on_error=self.failed("Failed to create team."))
+
+    def handle_delete_team(self):
+        if self.selected_team_id is None:
+            messagebox.showwarning("Delete Error", "Please select a team to delete.")
+            return
+            
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete this team?"):
+            def done(_):
+                self.status_label.config(text="Team deleted!")
+                self.refresh_team_data()
+                self.selected_team_id = None
+            self.db.submit(db_manager.delete_team, self.selected_team_id, label="Deleting team",
+                           on_success=done, on_error=self.failed("Failed to delete team."))
+
+    def open_auto_match(self):
+        """Dialog that proposes teams for all unassigned mentees and creates the chosen ones."""
+        win = tk.Toplevel(self)
+        win.title("Auto-Match Mentees")
+        win.geometry("900x500")
+        win.configure(bg="#EAF4FF")
+        win.transient(self)
+        self.match_window = win
+        self.match_proposals = {}
+
+        top = ttk.Frame(win, padding=10)
+        top.pack(fill=tk.X)
+        ttk.Label(top, text="Mentees per mentor:").pack(side=tk.LEFT)
+        self.match_capacity_var = tk.StringVar(value=str(matching.DEFAULT_CAPACITY))
+        ttk.Spinbox(top, from_=1, to=50, width=5, textvariable=self.match_capacity_var).pack(side=tk.LEFT, padx=5)
+        ttk.Button(top, text="Find Matches", command=self.run_auto_match).pack(side=tk.LEFT, padx=5)
+        self.match_summary = ttk.Label(top, text="")
+        self.match_summary.pack(side=tk.LEFT, padx=10)
+
+        cols = ("mentor", "count", "score", "mentees")
+        self.match_tree = ttk.Treeview(win, columns=cols, show="headings", selectmode="extended")
+        self.match_tree.heading("mentor", text="Mentor")
+        self.match_tree.heading("count", text="Mentees")
+        self.match_tree.heading("score", text="Avg Score")
+        self.match_tree.heading("mentees", text="Proposed Mentees")
+        self.match_tree.column("mentor", width=160)
+        self.match_tree.column("count", width=70, anchor="center")
+        self.match_tree.column("score", width=80, anchor="center")
+        self.match_tree.column("mentees", width=560)
+        self.match_tree.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        bottom = ttk.Frame(win, padding=10)
+        bottom.pack(fill=tk.X)
+        ttk.Button(bottom, text="Create Selected Teams", command=self.accept_auto_match).pack(side=tk.LEFT)
+        ttk.Button(bottom, text="Close", command=win.destroy).pack(side=tk.RIGHT)
+
+        self.run_auto_match()
+
+    def run_auto_match(self):
+        try:
+            capacity = int(self.match_capacity_var.get())
+        except ValueError:
+            messagebox.showwarning("Validation Error", "Mentees per mentor must be a number.", parent=self.match_window)
+            return
+        self.match_summary.config(text="Matching...")
+        self.db.submit(matching.propose_teams, capacity=capacity, key="auto_match", label="Matching mentees",
+                       on_success=self.show_match_result, on_error=self.show_task_error)
+
+    def show_match_result(self, result):
+        if not self.match_window.winfo_exists():
+            return
+        self.match_tree.delete(*self.match_tree.get_children())
+        self.match_proposals = {}
+        for team in result.teams:
+            iid = str(team.mentor_id)
+            self.match_proposals[iid] = team
+            self.match_tree.insert("", tk.END, iid=iid, values=(
+                team.mentor_name, len(team.mentees), f"{team.score:.1f}",
+                ", ".join(name for _, name, _ in team.mentees)
+            ))
+        self.match_tree.selection_set(list(self.match_proposals))
+        self.match_summary.config(text=result.summary())
+
+    def accept_auto_match(self):
+        chosen = [self.match_proposals[iid] for iid in self.match_tree.selection()]
+        if not chosen:
+            messagebox.showwarning("Auto-Match", "Select at least one proposed team.", parent=self.match_window)
+            return
+        teams = [(t.team_name(), t.mentor_id, t.mentee_ids) for t in chosen]
+
+        def done(result):
+            team_ids, problems = result
+            created = sum(1 for team_id in team_ids if team_id is not None)
+            self.status_label.config(text=f"{created} teams created by auto-match.")
+            self.refresh_team_data()
+            if self.match_window.winfo_exists():
+                self.match_window.destroy()
+            if problems:
+                messagebox.showwarning("Auto-Match", "\n".join(message for _, message in problems))
+        self.db.submit(db_manager.create_teams_bulk, teams, label="Creating teams",
+                       on_success=done, on_error=self.failed("Failed to create teams."))
+
+    # ===================================================================
+    # --- 3. SESSION MANAGEMENT TAB ---
+    # ===================================================================
+
+    def create_session_tab(self):
+        # --- Form Variables ---
+        self.session_subject_var = tk.StringVar()
+        self.session_datetime_var = tk.StringVar(value="YYYY-MM-DD HH:MM:SS")
+        self.session_duration_var = tk.StringVar(value="60")
+        self.session_mentor_var = tk.StringVar()
+        self.session_status_var = tk.StringVar()
+        self.selected_session_id = None
+        self.selected_session_version = None
+
+        # --- Store data for dropdowns ---
+        self.subject_lookup = None
+        # Mentor/mentee lookups are shared with the team tab
+        self.session_mentees_shown = []  # rows currently in session_mentee_list
+
+        # --- Layout ---
+        main_frame = ttk.Frame(self.tab_sessions)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # --- Top Frame: Session List & Participants List ---
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        # Left: Session List
+        session_list_frame = ttk.LabelFrame(list_frame, text="All Sessions")
+        session_list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+        
+        session_cols = ("id", "subject", "datetime", "duration", "status", "mentor", "participants", "rating")
+        self.session_tree = ttk.Treeview(session_list_frame, columns=session_cols, show="headings")
+        self.session_tree.heading("id", text="ID")
+        self.session_tree.heading("subject", text="Subject")
+        self.session_tree.heading("datetime", text="Date & Time")
+        self.session_tree.heading("duration", text="Duration (min)")
+        self.session_tree.heading("status", text="Status")
+        self.session_tree.heading("mentor", text="Mentor")
+        self.session_tree.heading("participants", text="People")
+        self.session_tree.heading("rating", text="Avg Rating")
+        self.session_tree.column("id", width=40, anchor="center")
+        self.session_tree.column("datetime", width=150)
+        self.session_tree.column("duration", width=90, anchor="center")
+        self.session_tree.column("participants", width=60, anchor="center")
+        self.session_tree.column("rating", width=80, anchor="center")
+        session_scrollbar = ttk.Scrollbar(session_list_frame, orient=tk.VERTICAL, command=self.session_tree.yview)
+        session_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.session_tree.pack(fill=tk.BOTH, expand=True)
+        self.session_tree.bind("<<TreeviewSelect>>", self.on_session_select)
+
+        self.session_loader = paged_tree.PagedTreeLoader(
+            self.session_tree, self.db, "sessions",
+            fetch_page=db_manager.fetch_session_overview_page, count=db_manager.count_sessions,
+            row_key=lambda s: s['session_id'],
+            row_values=lambda s: (
+                s['session_id'], s['subject_name'],
+                s['date_time'], s['duration'], s['status'],
+                s['mentor_name'] or "", s['participant_count'],
+                "" if s['avg_rating'] is None else f"{s['avg_rating']:.1f} ({s['feedback_count']})"
+            ),
+            page_key=lambda s: (s['date_time'], s['session_id']),
+            scrollbar=session_scrollbar, page_size=db_manager.PAGE_SIZE,
+            on_error=self.show_task_error, on_rows=self.keep_session_rows
+        )
+        # Participants and row version of every loaded session arrive with its page; clicks are served from here
+        self.session_participants = {}
+        self.session_versions = {}
+
+        # Right: Session Participants
+        participant_list_frame = ttk.LabelFrame(list_frame, text="Session Participants")
+        participant_list_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
+        
+        participant_cols = ("id", "name", "role")
+        self.participant_tree = ttk.Treeview(participant_list_frame, columns=participant_cols, show="headings")
+        self.participant_tree.heading("id", text="ID")
+        self.participant_tree.heading("name", text="Name")
+        self.participant_tree.heading("role", text="Role")
+        self.participant_tree.column("id", width=40, anchor="center")
+        self.participant_tree.pack(fill=tk.BOTH, expand=True)
+        self.participant_rows = tree_sync.TreeSync(
+            self.participant_tree, lambda p: p['student_id'],
+            lambda p: (p['student_id'], p['name'], p['role'])
+        )
+
+        # --- Bottom Frame: Forms ---
+        form_frame = ttk.Frame(main_frame)
+        form_frame.pack(fill=tk.X, pady=10)
+
+        # Left: Create Session
+        create_session_frame = ttk.LabelFrame(form_frame, text="Schedule New Session", padding=10)
+        create_session_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, anchor="n")
+
+        ttk.Label(create_session_frame, text="Subject:").grid(row=0, column=0, sticky="w", pady=2)
+        self.session_subject_combo = ttk.Combobox(create_session_frame, textvariable=self.session_subject_var, width=28, state="readonly")
+        self.session_subject_combo.grid(row=0, column=1, pady=2)
+        
+        ttk.Label(create_session_frame, text="Date/Time:").grid(row=1, column=0, sticky="w", pady=2)
+        ttk.Entry(create_session_frame, textvariable=self.session_datetime_var, width=30).grid(row=1, column=1, pady=2)
+        
+        ttk.Label(create_session_frame, text="Duration (min):").grid(row=2, column=0, sticky="w", pady=2)
+        ttk.Entry(create_session_frame, textvariable=self.session_duration_var, width=30).grid(row=2, column=1, pady=2)
+
+        ttk.Label(create_session_frame, text="Select Mentor:").grid(row=3, column=0, sticky="w", pady=2)
+        self.session_mentor_combo = ttk.Combobox(create_session_frame, textvariable=self.session_mentor_var, width=28, state="readonly")
+        self.session_mentor_combo.grid(row=3, column=1, pady=2)
+
+        ttk.Label(create_session_frame, text="Select Mentees (Ctrl+Click):").grid(row=4, column=0, sticky="nw", pady=2)
+        self.session_mentee_list = Listbox(create_session_frame, selectmode=tk.MULTIPLE, exportselection=False, height=5)
+        self.session_mentee_list.grid(row=4, column=1, pady=2)
+        
+        ttk.Button(create_session_frame, text="Schedule Session", command=self.handle_schedule_session).grid(row=5, column=0, columnspan=2, pady=10)
+
+        # Right: Session Actions
+        actions_frame = ttk.LabelFrame(form_frame, text="Session Actions", padding=10)
+        actions_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, anchor="n")
+        
+        ttk.Label(actions_frame, text="Select a session from the list.").pack(pady=5)
+        ttk.Label(actions_frame, text="Set Status:").pack(pady=(10,0))
+        self.session_status_combo = ttk.Combobox(actions_frame, textvariable=self.session_status_var, values=["scheduled", "completed", "cancelled"], state="readonly")
+        self.session_status_combo.pack(pady=5, fill=tk.X)
+        ttk.Button(actions_frame, text="Update Status", command=self.handle_update_status).pack(fill=tk.X, pady=5)
+        
+        ttk.Button(actions_frame, text="Cancel (Delete) Session", command=self.handle_cancel_session).pack(fill=tk.X, pady=(15, 5))
+
+        # Right: Session Feedback
+        feedback_frame = ttk.LabelFrame(form_frame, text="Session Feedback", padding=10)
+        feedback_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, anchor="n")
+
+        ttk.Label(feedback_frame, text="Rating (1-5):").grid(row=0, column=0, sticky="w", pady=2)
+        self.feedback_rating_var = tk.StringVar(value="5")
+        ttk.Spinbox(feedback_frame, from_=1, to=5, width=5, textvariable=self.feedback_rating_var).grid(row=0, column=1, sticky="w", pady=2)
+        ttk.Label(feedback_frame, text="Comment:").grid(row=1, column=0, sticky="w", pady=2)
+        self.feedback_comment_var = tk.StringVar()
+        ttk.Entry(feedback_frame, textvariable=self.feedback_comment_var, width=30).grid(row=1, column=1, pady=2)
+        self.feedback_anonymous_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(feedback_frame, text="Anonymous", variable=self.feedback_anonymous_var).grid(row=2, column=1, sticky="w", pady=2)
+        ttk.Button(feedback_frame, text="Submit Feedback", command=self.handle_submit_feedback).grid(row=3, column=0, columnspan=2, pady=10)
+
+        # --- Initial Load ---
+        self.refresh_session_data()
+
+    def refresh_session_data(self, sessions=True):
+        """Helper to reload all data for the session tab (dropdowns only if sessions=False)."""
+        def load():
+            return (db_manager.get_subject_lookup(),) + db_manager.get_student_lookups()
+        self.db.submit(load, key="session_tab", label="Loading sessions",
+                       on_success=lambda result: self.fill_session_data(result, sessions),
+                       on_error=self.show_task_error)
+
+    def fill_session_data(self, result, sessions=True):
+        # Store data (mentor/mentee lists come from the same cache as the team tab)
+        self.subject_lookup, self.mentor_lookup, self.mentee_lookup = result
+
+        # Populate dropdowns
+        self.session_subject_combo['values'] = self.subject_lookup.labels
+        self.fill_session_choices()
+        
+        if sessions:
+            # Populate session list (applies only new/changed/removed sessions)
+            self.session_loader.refresh()
+            
+            # Clear participant list (and drop any participant load still in flight)
+            self.db.cancel("session_participants")
+            self.participant_rows.clear()
+    
+    def fill_session_choices(self):
+        self.session_mentor_combo['values'] = self.mentor_lookup.labels
+        
+        # Populate listbox (only changed entries are touched)
+        tree_sync.sync_listbox(self.session_mentee_list, self.session_mentees_shown, self.mentee_lookup.rows,
+                               lambda m: m['student_id'], self.mentee_lookup.label)
+        self.session_mentees_shown = self.mentee_lookup.rows
+
+    def keep_session_rows(self, rows, replaced):
+        if replaced:
+            self.session_participants = {}
+            self.session_versions = {}
+        for s in rows:
+            self.session_participants[s['session_id']] = s['participants']
+            self.session_versions[s['session_id']] = s['version']
+
+    def on_session_select(self, event):
+        """When session is selected, show its participants and status."""
+        try:
+            selected_item = self.session_tree.selection()[0]
+            session_values = self.session_tree.item(selected_item, "values")
+            self.selected_session_id = session_values[0]
+            self.selected_session_version = self.session_versions.get(int(selected_item))
+            self.session_status_var.set(session_values[4])
+            self.status_label.config(text=f"Selected session ID: {self.selected_session_id}")
+            
+            # Participants came with the session page; only fall back to a query if they didn't
+            participants = self.session_participants.get(int(selected_item))
+            if participants is not None:
+                self.db.cancel("session_participants")
+                self.fill_participant_list(participants)
+            else:
+                self.db.submit(db_manager.fetch_session_participants, self.selected_session_id,
+                               key="session_participants", label="Loading participants",
+                               on_success=self.fill_participant_list, on_error=self.show_task_error)
+        except IndexError: pass
+
+    def fill_participant_list(self, participants):
+        self.participant_rows.sync(participants)
+
+    def handle_schedule_session(self):
+        subject_label = self.session_subject_var.get()
+        date_time = self.session_datetime_var.get()
+        duration = self.session_duration_var.get()
+        mentor_label = self.session_mentor_var.get()
+        
+        if not all([subject_label, date_time, duration, mentor_label]):
+            messagebox.showwarning("Validation Error", "All fields are required.")
+            return
+
+        # Get Subject and Mentor IDs from the selected labels
+        subject_id = self.subject_lookup.id_for(subject_label)
+        mentor_id = self.mentor_lookup.id_for(mentor_label)
+        if subject_id is None or mentor_id is None:
+            messagebox.showwarning("Validation Error", "Please pick the subject and mentor again; the lists have changed.")
+            return
+        # Get Mentee IDs
+        selected_indices = self.session_mentee_list.curselection()
+        mentee_ids = [self.session_mentees_shown[i]['student_id'] for i in selected_indices]
+        if not mentee_ids:
+             messagebox.showwarning("Validation Error", "At least one mentee must be selected.")
+             return
+
+        # A batch of one: checked for double-booking, with the clashes reported back
+        request = {"subject_id": subject_id, "date_time": date_time, "duration": duration,
+                   "mentor_id": mentor_id, "mentee_ids": mentee_ids}
+
+        def done(report):
+            if report["scheduled"]:
+                self.status_label.config(text="Session scheduled successfully!")
+                self.refresh_session_data()
+            for c in report["conflicts"]:
+                clashes = ", ".join(f"student {sid} ({what})" for sid, _, _, what in c["clashes"][:3])
+                messagebox.showwarning("Scheduling Conflict", c["reason"] + (f" {clashes}" if clashes else ""))
+        self.db.submit(db_manager.schedule_sessions_bulk, [request],
+                       label="Scheduling session", on_success=done,
+                       on_error=self.failed("Failed to schedule session."))
+            
+    def handle_update_status(self):
+        if self.selected_session_id is None:
+            messagebox.showwarning("Update Error", "Please select a session to update.")
+            return
+        
+        new_status = self.session_status_var.get()
+        if not new_status:
+            messagebox.showwarning("Update Error", "Please select a new status.")
+            return
+
+        def done(_):
+            self.status_label.config(text="Session status updated!")
+            self.refresh_session_data()
+            self.selected_session_id = None
+            self.session_status_var.set("")
+        self.db.submit(db_manager.update_session_status, self.selected_session_id, new_status,
+                       self.selected_session_version, label="Updating session status", on_success=done,
+                       on_error=self.failed_edit("Failed to update status.", self.session_loader))
+
+    def handle_cancel_session(self):
+        if self.selected_session_id is None:
+            messagebox.showwarning("Delete Error", "Please select a session to cancel.")
+            return
+            
+        if messagebox.askyesno("Confirm Cancel", "Are you sure you want to cancel (delete) this session?"):
+            def done(_):
+                self.status_label.config(text="Session cancelled (deleted).")
+                self.refresh_session_data()
+                self.selected_session_id = None
+                self.session_status_var.set("")
+            self.db.submit(db_manager.cancel_session, self.selected_session_id, label="Cancelling session",
+                           on_success=done, on_error=self.failed("Failed to cancel session."))
+
+    def handle_submit_feedback(self):
+        if self.selected_session_id is None:
+            messagebox.showwarning("Feedback Error", "Please select a session to rate.")
+            return
+        try:
+            self.feedback_buffer.submit(self.selected_session_id, self.feedback_rating_var.get(),
+                                        self.feedback_comment_var.get(), self.feedback_anonymous_var.get())
+        except db_manager.ValidationError as e:
+            messagebox.showwarning("Validation Error", str(e))
+            return
+        # Written by the buffer's thread within feedback_buffer.FLUSH_INTERVAL seconds
+        self.status_label.config(text=f"Feedback for session {self.selected_session_id} queued.")
+        self.feedback_comment_var.set("")
+        self.feedback_anonymous_var.set(False)
+
+# --- Run the App ---
+if __name__ == "__main__":
+    if db_manager.backend.embedded:
+        # A new embedded database is created (with the sample data) and kept migrated
+        migrate.migrate(log=lambda message: None)
+    app = App()
+    app.mainloop()
+    app.db.shutdown()
+    app.feedback_buffer.close()
+    db_manager.close_pool()
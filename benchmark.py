@@ -0,0 +1,371 @@
+"""
+Benchmark harness for db_manager operations.
+
+Seeds a separate database (PeerTutoringBench by default) with synthetic data
+on the setup.sql schema plus all migrations, runs each operation repeatedly
+and writes p50/p95/p99 latency, throughput and server round trips per call
+to a JSON file so runs can be compared over time.
+
+Usage:
+    python benchmark.py --scale small              # 1k students
+    python benchmark.py --scale medium             # 100k students
+    python benchmark.py --scale large              # 1M students
+    python benchmark.py --students 5000 --reps 50 --output results.json
+    python benchmark.py --skip-seed                # reuse the already seeded database
+    python benchmark.py --explain                  # also run explain_check on the seeded data
+    python benchmark.py --backend sqlite           # in-process, on PeerTutoringBench.db
+
+Round trips are measured from the server's global `Questions` counter, so
+run it against a MySQL instance nobody else is using. The embedded SQLite
+backend has no server, so no round trips are reported there.
+"""
+import argparse
+import datetime
+import itertools
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+import db_manager
+import migrate
+
+SCALES = {"small": 1_000, "medium": 100_000, "large": 1_000_000}
+BENCH_DATABASE = "PeerTutoringBench"
+SEED_CHUNK = 5_000
+DEPTS = ["CSE", "ECE", "Physics", "Chemistry", "Mathematics"]
+SUBJECT_COUNT = 50
+MENTOR_EVERY = 10          # every 10th student is a mentor
+MENTEES_PER_TEAM = 5
+MENTEES_PER_SESSION = 2
+
+
+# --- Schema & Seeding ---
+
+def _is_mentor(student_id):
+    return student_id % MENTOR_EVERY == 1
+
+
+def schema_statements(path=None):
+    """The CREATE TABLE/TRIGGER/PROCEDURE/FUNCTION statements from the backend's setup.sql (no sample data)."""
+    with open(path or db_manager.backend.schema_file, encoding="utf-8") as f:
+        statements = migrate.split_statements(f.read())
+    wanted = ("CREATE TABLE", "CREATE TRIGGER", "CREATE PROCEDURE", "CREATE FUNCTION")
+    result = []
+    for statement in statements:
+        code = "\n".join(l for l in statement.splitlines() if not l.strip().startswith("--")).strip()
+        if code.upper().startswith(wanted):
+            result.append(code)
+    return result
+
+
+def create_schema(database):
+    """Drops and recreates the benchmark database, then applies setup.sql's schema and all migrations."""
+    use_database(database)
+    db_manager.backend.reset_database()
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        for statement in schema_statements():
+            cursor.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+    migrate.migrate(log=lambda msg: None)
+
+
+def use_database(database):
+    db_manager.configure_pool()  # drop connections to the previous database
+    db_manager.backend.use_database(database)
+    db_manager.reference_cache.invalidate_all()
+
+
+def _insert_chunks(cursor, conn, query, rows):
+    """executemany over any iterable of rows, one transaction per SEED_CHUNK rows."""
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, SEED_CHUNK))
+        if not chunk:
+            break
+        cursor.executemany(query, chunk)
+        conn.commit()
+
+
+def seed(students, rng, log=print):
+    """Fills the (empty) benchmark database. Returns a dict of row counts."""
+    conn = db_manager.get_db_connection()
+    counts = {}
+    try:
+        cursor = conn.cursor()
+        now = datetime.datetime.now().replace(microsecond=0)
+
+        log(f"  students: {students}")
+        _insert_chunks(cursor, conn, "INSERT INTO Student (name, email, ph_no, role, dept, year) "
+                       "VALUES (%s, %s, %s, %s, %s, %s)",
+                       ((f"Student {i}", f"s{i}@bench.edu", str(9_000_000_000 + i),
+                         "mentor" if _is_mentor(i) else "mentee", rng.choice(DEPTS), rng.randint(1, 4))
+                        for i in range(1, students + 1)))
+        counts["students"] = students
+
+        _insert_chunks(cursor, conn, "INSERT INTO Subject (subject_name, description) VALUES (%s, %s)",
+                       [(f"Subject {k}", "Synthetic subject") for k in range(1, SUBJECT_COUNT + 1)])
+        counts["subjects"] = SUBJECT_COUNT
+
+        mentors = [i for i in range(1, students + 1) if _is_mentor(i)]
+        mentees = [i for i in range(1, students + 1) if not _is_mentor(i)]
+
+        _insert_chunks(cursor, conn, "INSERT INTO StudentSubject (student_id, subject_id) VALUES (%s, %s)",
+                       ((i, rng.randint(1, SUBJECT_COUNT)) for i in range(1, students + 1)))
+
+        log(f"  teams: {len(mentors)}")
+        _insert_chunks(cursor, conn, "INSERT INTO Team (team_name, mentor_id, creation_date) VALUES (%s, %s, %s)",
+                       [(f"Team {m}", m, (now - datetime.timedelta(days=rng.randint(0, 365))).date())
+                        for m in mentors])
+        members = []
+        for team_id, mentor in enumerate(mentors, start=1):
+            members.append((team_id, mentor, "mentor"))
+            for mentee in rng.sample(mentees, min(MENTEES_PER_TEAM, len(mentees))):
+                members.append((team_id, mentee, "mentee"))
+        _insert_chunks(cursor, conn, "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)",
+                       members)
+        counts["teams"], counts["team_members"] = len(mentors), len(members)
+
+        sessions = max(1, students // 2)
+        log(f"  sessions: {sessions}")
+        session_rows, participants, feedback = [], [], []
+        for session_id in range(1, sessions + 1):
+            when = now + datetime.timedelta(minutes=rng.randint(-180 * 24 * 60, 60 * 24 * 60))
+            status = "completed" if when < now else "scheduled"
+            session_rows.append((rng.randint(1, SUBJECT_COUNT), when, rng.choice([30, 45, 60, 90]), status))
+            participants.append((session_id, rng.choice(mentors), "mentor"))
+            for mentee in rng.sample(mentees, min(MENTEES_PER_SESSION, len(mentees))):
+                participants.append((session_id, mentee, "mentee"))
+            if status == "completed":
+                feedback.append((session_id, rng.randint(1, 5), "Synthetic feedback", rng.random() < 0.3))
+        _insert_chunks(cursor, conn, "INSERT INTO MentorshipSession (subject_id, date_time, duration, status) "
+                       "VALUES (%s, %s, %s, %s)", session_rows)
+        _insert_chunks(cursor, conn, "INSERT INTO SessionParticipant (session_id, student_id, role) "
+                       "VALUES (%s, %s, %s)", participants)
+        _insert_chunks(cursor, conn, "INSERT INTO Feedback (session_id, rating, comment, anonymous) "
+                       "VALUES (%s, %s, %s, %s)", feedback)
+        counts.update(sessions=sessions, participants=len(participants), feedback=len(feedback))
+        conn.commit()
+
+        # The rows above bypass db_manager, so the leaderboard table has to be built here
+        counts["mentor_stats"] = db_manager.rebuild_mentor_stats()
+        log(f"  mentor stats: {counts['mentor_stats']}")
+        cursor.execute(db_manager.backend.analyze_sql(
+            ["Student", "Team", "TeamMember", "MentorshipSession", "SessionParticipant", "Feedback",
+             "MentorStats"]))
+        if cursor.with_rows:
+            cursor.fetchall()
+        conn.commit()
+    finally:
+        conn.close()
+    return counts
+
+
+# --- Measuring ---
+
+def server_questions():
+    """The server's global statement counter (used to count round trips); None without a server."""
+    if db_manager.backend.embedded:
+        return None
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Questions'")
+        return int(cursor.fetchone()[1])
+    finally:
+        conn.close()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def measure(fn, reps, warmup=1):
+    """Runs fn() `reps` times and returns latency/throughput/round-trip stats."""
+    for _ in range(warmup):
+        fn()
+    before = server_questions()
+    timings = []
+    started = time.perf_counter()
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    # The second SHOW STATUS is itself one question; don't bill it to fn.
+    questions = None if before is None else server_questions() - before - 1
+
+    timings.sort()
+    ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        "reps": reps,
+        "p50_ms": ms(percentile(timings, 50)),
+        "p95_ms": ms(percentile(timings, 95)),
+        "p99_ms": ms(percentile(timings, 99)),
+        "mean_ms": ms(sum(timings) / reps),
+        "max_ms": ms(timings[-1]),
+        "throughput_per_s": round(reps / elapsed, 2) if elapsed else None,
+        "round_trips_per_call": None if questions is None else round(questions / reps, 2),
+    }
+
+
+def treeview_population(rows_fn):
+    """
+    Returns a callable that fills a hidden Treeview the way the app does, or
+    None when no display is available.
+    """
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        import tree_sync
+        root = tk.Tk()
+        root.withdraw()
+    except Exception:
+        return None
+    columns = ("id", "name", "email", "phone", "dept", "year", "role")
+    tree = ttk.Treeview(root, columns=columns, show="headings")
+    rows = rows_fn()
+
+    def populate():
+        sync = tree_sync.TreeSync(
+            tree, lambda s: s['student_id'],
+            lambda s: (s['student_id'], s['name'], s['email'], s['ph_no'], s['dept'], s['year'], s['role'])
+        )
+        sync.sync(rows)
+        sync.clear()
+    return populate
+
+
+def build_operations(students, rng):
+    """Returns [(name, callable, reps_multiplier)] for everything that gets measured."""
+    mentors = [i for i in range(1, students + 1) if _is_mentor(i)]
+    mentees = [i for i in range(1, students + 1) if not _is_mentor(i)]
+    counter = {"n": 0}
+
+    def unique(prefix):
+        counter["n"] += 1
+        return f"{prefix} {time.time_ns()} {counter['n']}"
+
+    mid_id = students // 2
+    page = db_manager.PAGE_SIZE
+    ops = [
+        ("fetch_students_page", lambda: db_manager.fetch_students_page(rng.randint(0, max(0, students - page)), page), 1),
+        ("count_students", db_manager.count_students, 1),
+        ("fetch_students_by_role(mentor)", lambda: db_manager.fetch_students_by_role("mentor"), 0.2),
+        ("fetch_teams_page", lambda: db_manager.fetch_teams_page(None, page), 1),
+        ("fetch_team_members", lambda: db_manager.fetch_team_members(rng.randint(1, len(mentors))), 1),
+        ("fetch_sessions_page", lambda: db_manager.fetch_sessions_page(None, page), 1),
+        ("fetch_session_overview_page", lambda: db_manager.fetch_session_overview_page(None, page), 1),
+        ("fetch_session_participants", lambda: db_manager.fetch_session_participants(rng.randint(1, max(1, students // 2))), 1),
+        ("fetch_mentor_leaderboard", lambda: db_manager.fetch_mentor_leaderboard(50), 1),
+        ("create_team", lambda: db_manager.create_team(unique("Bench Team"), rng.choice(mentors),
+                                                       rng.sample(mentees, min(MENTEES_PER_TEAM, len(mentees)))), 1),
+        ("schedule_session", lambda: db_manager.schedule_session(rng.randint(1, SUBJECT_COUNT), datetime.datetime.now(),
+                                                                 60, rng.choice(mentors),
+                                                                 rng.sample(mentees, min(MENTEES_PER_SESSION, len(mentees)))), 1),
+        # Whole-table reads: what the UI did before pagination. Few reps; they get slow fast.
+        ("fetch_students (all)", db_manager.fetch_students, 0.05),
+        ("fetch_teams (all)", db_manager.fetch_teams, 0.05),
+        ("fetch_sessions (all)", db_manager.fetch_sessions, 0.05),
+    ]
+    populate = treeview_population(lambda: db_manager.fetch_students_page(mid_id, page))
+    if populate is not None:
+        ops.append(("treeview_population (1 page)", populate, 1))
+    return ops
+
+
+def run(args):
+    students = args.students or SCALES[args.scale]
+    rng = random.Random(args.seed)
+    log = print if not args.quiet else (lambda *a: None)
+
+    if args.backend:
+        db_manager.configure_backend(args.backend)
+    meta = {
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "students": students,
+        "reps": args.reps,
+        "backend": db_manager.backend.name,
+        "database": args.database,
+        "python": platform.python_version(),
+        "pool": dict(db_manager.POOL_SETTINGS),
+    }
+    if args.skip_seed:
+        use_database(args.database)
+    else:
+        log(f"Seeding {args.database} with {students} students ...")
+        t0 = time.perf_counter()
+        create_schema(args.database)
+        meta["row_counts"] = seed(students, rng, log)
+        meta["seed_seconds"] = round(time.perf_counter() - t0, 1)
+
+    results = {}
+    for name, fn, weight in build_operations(students, rng):
+        if args.only and not any(part in name for part in args.only):
+            continue
+        reps = max(3, int(args.reps * weight))
+        log(f"Running {name} x{reps} ...")
+        results[name] = measure(fn, reps)
+        r = results[name]
+        log(f"  p50 {r['p50_ms']} ms  p95 {r['p95_ms']} ms  p99 {r['p99_ms']} ms  "
+            f"{r['throughput_per_s']}/s"
+            + (f"  {r['round_trips_per_call']} round trips" if r['round_trips_per_call'] is not None else ""))
+    meta["pool_stats"] = db_manager.pool_stats()
+
+    report = {"meta": meta, "results": results}
+    if args.explain and db_manager.backend.embedded:
+        log("Skipping --explain: explain_check reads MySQL's EXPLAIN output.")
+    elif args.explain:
+        import explain_check
+        failures = explain_check.run_checks(log=log)
+        report["explain_failures"] = [{"query": label, "problems": problems}
+                                      for label, _, problems in failures]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark db_manager against a seeded database.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="preset size: small=1k, medium=100k, large=1M students")
+    parser.add_argument("--students", type=int, help="exact number of students (overrides --scale)")
+    parser.add_argument("--reps", type=int, default=100, help="repetitions per operation (default 100)")
+    parser.add_argument("--database", default=BENCH_DATABASE, help=f"database to (re)create (default {BENCH_DATABASE})")
+    parser.add_argument("--backend", choices=["mysql", "sqlite"],
+                        help="storage backend (default: db_manager.DB_BACKEND)")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the existing benchmark database")
+    parser.add_argument("--only", nargs="*", help="only run operations whose name contains one of these")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for synthetic data")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON report")
+    parser.add_argument("--explain", action="store_true", help="also run explain_check on the seeded data")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.database == "PeerTutoring":
+        parser.error("refusing to drop the application database; pick another --database")
+
+    try:
+        report = run(args)
+    except db_manager.DatabaseError as e:
+        print(e, file=sys.stderr)
+        return 2
+    finally:
+        db_manager.close_pool()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Bulk student import from CSV or JSON.
+
+Usage:
+    python bulk_import.py students.csv [--chunk-size 500] [--report errors.csv] [--dry-run]
+
+CSV files need a header row with the Student columns (name, email, ph_no,
+role, dept, year). JSON files may be a list of objects, or one object per
+line (.jsonl / .ndjson) which is streamed.
+
+Rows are read lazily, validated a chunk at a time with the same rules as the
+Student form, and each chunk is inserted in one transaction. Bad rows do not
+stop the import; they are collected into a per-row error report.
+"""
+import argparse
+import csv
+import json
+import sys
+
+import db_manager
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class ImportReport:
+    """Outcome of an import: counts plus one entry per rejected row."""
+
+    def __init__(self):
+        self.total = 0
+        self.inserted = 0
+        self.errors = []   # dicts: {"row": n, "email": ..., "error": ...}
+
+    def add_error(self, row_number, row, message):
+        self.errors.append({"row": row_number, "email": row.get("email", ""), "error": message})
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["row", "email", "error"])
+            writer.writeheader()
+            writer.writerows(self.errors)
+
+    def summary(self):
+        return f"{self.inserted} of {self.total} students imported, {len(self.errors)} rejected."
+
+
+# --- Reading ---
+
+def read_rows(path):
+    """
+    Yields raw student dicts from a .csv, .json or .jsonl/.ndjson file (JSON
+    elements that are not objects are yielded as they are). Raises ValueError
+    for an unsupported file type or malformed JSON.
+    """
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+    elif lower.endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as e:
+                        raise ValueError(f"{path}, line {number}: {e}") from e
+    elif lower.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{path} must hold a list of student objects.")
+        yield from data
+    else:
+        raise ValueError(f"Unsupported file type: {path} (use .csv, .json or .jsonl)")
+
+
+def normalize(raw):
+    """Trims values and fills defaults so rows look like the Student form's data."""
+    row = {col: raw.get(col) for col in db_manager.STUDENT_COLUMNS}
+    for col in ("name", "email", "ph_no", "dept", "role"):
+        row[col] = str(row[col]).strip() if row[col] is not None else ""
+    row["role"] = row["role"].lower() or "mentee"
+    row["dept"] = row["dept"] or None
+    try:
+        row["year"] = int(row["year"])
+    except (TypeError, ValueError):
+        pass  # validate_student reports it
+    return row
+
+
+def chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# --- Validation ---
+
+def validate_chunk(numbered_rows, seen_emails, seen_phones):
+    """
+    Validates a chunk of (row_number, row) pairs at once: per-row field checks,
+    duplicates within the file (seen_emails/seen_phones carry over between
+    chunks and are updated here), and one lookup for emails/phones that are
+    already registered. Returns (valid_pairs, [(row_number, row, message)]).
+    """
+    rejected = []
+    candidates = []
+    for number, row in numbered_rows:
+        error = db_manager.validate_student(row)
+        if not error and row["email"].lower() in seen_emails:
+            error = "This email appears more than once in the file."
+        if not error and row["ph_no"] in seen_phones:
+            error = "This phone number appears more than once in the file."
+        if error:
+            rejected.append((number, row, error))
+            continue
+        seen_emails.add(row["email"].lower())
+        seen_phones.add(row["ph_no"])
+        candidates.append((number, row))
+
+    existing_emails, existing_phones = db_manager.find_existing_contacts(
+        [row["email"] for _, row in candidates], [row["ph_no"] for _, row in candidates]
+    )
+    existing_emails = {e.lower() for e in existing_emails}
+
+    valid = []
+    for number, row in candidates:
+        if row["email"].lower() in existing_emails:
+            rejected.append((number, row, "This email is already registered."))
+        elif row["ph_no"] in existing_phones:
+            rejected.append((number, row, "This phone number is already registered."))
+        else:
+            valid.append((number, row))
+    return valid, rejected
+
+
+# --- Import ---
+
+def import_students(rows, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Imports an iterable of raw student dicts. Returns an ImportReport.
+    With dry_run=True rows are only validated.
+    """
+    report = ImportReport()
+    # Emails/phones from earlier chunks, so duplicates across chunks are caught too.
+    seen_emails, seen_phones = set(), set()
+
+    for chunk in chunked(enumerate(rows, start=1), chunk_size):
+        report.total += len(chunk)
+        numbered = []
+        for number, raw in chunk:
+            if isinstance(raw, dict):
+                numbered.append((number, normalize(raw)))
+            else:
+                report.add_error(number, {}, "Each row must be an object with the student fields.")
+        valid, rejected = validate_chunk(numbered, seen_emails, seen_phones)
+        for number, row, message in rejected:
+            report.add_error(number, row, message)
+
+        if dry_run or not valid:
+            continue
+        inserted, errors = db_manager.insert_students_batch([row for _, row in valid])
+        report.inserted += inserted
+        for index, message in errors:
+            number, row = valid[index]
+            report.add_error(number, row, message)
+
+    report.errors.sort(key=lambda e: e["row"])
+    return report
+
+
+def import_file(path, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """Imports students from a CSV/JSON file. Returns an ImportReport."""
+    return import_students(read_rows(path), chunk_size=chunk_size, dry_run=dry_run)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-import students from CSV or JSON.")
+    parser.add_argument("path", help="CSV, JSON or JSON-lines file with student rows")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows per insert transaction (default {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--report", help="write rejected rows to this CSV file")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, insert nothing")
+    args = parser.parse_args(argv)
+
+    try:
+        report = import_file(args.path, chunk_size=args.chunk_size, dry_run=args.dry_run)
+    except (db_manager.DatabaseError, ValueError, OSError) as e:
+        print(f"Import aborted: {e}", file=sys.stderr)
+        return 2
+    print(report.summary())
+    if args.report:
+        report.write_csv(args.report)
+        print(f"Error report written to {args.report}")
+    else:
+        for error in report.errors[:20]:
+            print(f"  row {error['row']} ({error['email']}): {error['error']}")
+        if len(report.errors) > 20:
+            print(f"  ... {len(report.errors) - 20} more (use --report to save them all)")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+Storage backends for db_manager.
+
+- MySQLBackend: the MySQL server described by db_manager.DB_CONFIG
+  (mysql.connector is only needed when this backend is used).
+- SQLiteBackend: an embedded SQLite file (or ":memory:") with the same
+  schema, for running the app offline and for in-process tests/benchmarks.
+  schema_sqlite.sql is its setup.sql and migrations/sqlite/ its migrations.
+
+db_manager's SQL is written for mysql.connector (%s / %(name)s placeholders,
+cursor(dictionary=True), SELECT ... FOR UPDATE, callproc). SQLiteConnection
+accepts the same calls and rewrites them for sqlite3, and registers the
+MySQL functions the schema uses (NOW, CURDATE, MentorSessionCount). The
+AddMentorshipSession procedure is implemented in Python and reached through
+cursor.callproc() as on MySQL.
+"""
+import datetime
+import decimal
+import functools
+import os
+import re
+import sqlite3
+
+try:
+    import mysql.connector
+except ImportError:  # only needed for the MySQL backend
+    mysql = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Exceptions raised by the drivers; db_manager catches these around every query.
+DRIVER_ERRORS = (sqlite3.Error,) if mysql is None else (mysql.connector.Error, sqlite3.Error)
+
+# Error codes are MySQL's numbers whatever the backend (see errno()).
+ER_NOT_NULL = 1048
+ER_DUP_ENTRY = 1062
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_FOREIGN_KEY = 1452
+ER_CHECK_CONSTRAINT = 3819
+CR_CONNECTION_ERROR = 2003
+
+
+def create(name, **settings):
+    """Returns the backend called `name` ("mysql" or "sqlite") built with these settings."""
+    backends = {"mysql": MySQLBackend, "sqlite": SQLiteBackend}
+    if name not in backends:
+        raise ValueError(f"Unknown database backend {name!r} (expected one of {', '.join(backends)}).")
+    return backends[name](**settings)
+
+
+# --- MySQL ---
+
+class MySQLBackend:
+    name = "mysql"
+    label = "MySQL"
+    embedded = False
+    schema_file = os.path.join(BASE_DIR, "setup.sql")
+    migrations_subdir = None
+    max_connections = None
+
+    def __init__(self, config):
+        self.config = config   # mysql.connector.connect() arguments (db_manager.DB_CONFIG)
+
+    def connect(self):
+        return self._driver().connect(**self.config)
+
+    @staticmethod
+    def _driver():
+        if mysql is None:
+            raise ImportError("The MySQL backend needs mysql-connector-python (pip install mysql-connector-python).")
+        return mysql.connector
+
+    def is_alive(self, raw):
+        return raw.is_connected()
+
+    def errno(self, e):
+        return getattr(e, "errno", None)
+
+    def student_text_filter(self, words):
+        """(condition, param) matching students whose name/email has a word starting with each of `words`."""
+        return "MATCH(name, email) AGAINST (%s IN BOOLEAN MODE)", " ".join(f"+{w}*" for w in words)
+
+    def analyze_sql(self, tables):
+        return "ANALYZE TABLE " + ", ".join(tables)
+
+    def use_database(self, database):
+        self.config["database"] = database
+
+    def reset_database(self):
+        """Drops and recreates the configured database, empty."""
+        database = self.config["database"]
+        server_config = {k: v for k, v in self.config.items() if k != "database"}
+        conn = self._driver().connect(**server_config)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+            cursor.execute(f"CREATE DATABASE `{database}`")
+        finally:
+            conn.close()
+
+    def describe(self):
+        return f"MySQL {self.config.get('host')}/{self.config.get('database')}"
+
+    def close(self):
+        """Nothing to release: every connection belongs to db_manager's pool."""
+
+
+# --- SQLite ---
+
+class SQLiteBackend:
+    name = "sqlite"
+    label = "SQLite"
+    embedded = True
+    schema_file = os.path.join(BASE_DIR, "schema_sqlite.sql")
+    migrations_subdir = "sqlite"
+
+    def __init__(self, path, timeout=10):
+        self.timeout = timeout     # seconds to wait for another connection's write lock
+        self._keeper = None        # keeps an in-memory database alive between pooled connections
+        self.use_database(path)
+
+    @property
+    def in_memory(self):
+        return self.path == ":memory:"
+
+    @property
+    def max_connections(self):
+        # Shared-cache in-memory databases fail instead of waiting on locks; use one connection.
+        return 1 if self.in_memory else None
+
+    def _open(self):
+        if self.in_memory:
+            target, uri = f"file:peer_tutoring_{id(self)}?mode=memory&cache=shared", True
+        else:
+            target, uri = self.path, False
+        return sqlite3.connect(target, uri=uri, timeout=self.timeout, detect_types=sqlite3.PARSE_DECLTYPES,
+                               check_same_thread=False)  # the pool hands connections between threads
+
+    def connect(self):
+        if self.in_memory and self._keeper is None:
+            self._keeper = self._open()
+        raw = self._open()
+        raw.execute("PRAGMA foreign_keys = ON")
+        if not self.in_memory:
+            raw.execute("PRAGMA journal_mode = WAL")  # readers don't wait for the writer
+        return SQLiteConnection(raw)
+
+    def is_alive(self, raw):
+        return raw.is_connected()
+
+    def errno(self, e):
+        """Maps a sqlite3 error to the MySQL error number db_manager checks for."""
+        if not isinstance(e, sqlite3.Error):
+            return getattr(e, "errno", None)
+        text = str(e)
+        if isinstance(e, sqlite3.IntegrityError):
+            if text.startswith("UNIQUE") or text.startswith("PRIMARY KEY"):
+                return ER_DUP_ENTRY
+            if text.startswith("CHECK"):
+                return ER_CHECK_CONSTRAINT
+            if text.startswith("FOREIGN KEY"):
+                return ER_FOREIGN_KEY
+            if text.startswith("NOT NULL"):
+                return ER_NOT_NULL
+        if isinstance(e, sqlite3.OperationalError):
+            if "locked" in text or "busy" in text:
+                return ER_LOCK_WAIT_TIMEOUT
+            if "unable to open" in text:
+                return CR_CONNECTION_ERROR
+        return None
+
+    def student_text_filter(self, words):
+        # StudentSearch is the FTS5 index from migrations/sqlite/004_student_search.sql
+        return ("student_id IN (SELECT rowid FROM StudentSearch WHERE StudentSearch MATCH %s)",
+                " ".join(f'"{w}"*' for w in words))
+
+    def analyze_sql(self, tables):
+        return "ANALYZE"
+
+    def use_database(self, database):
+        """`database` is a file path, a bare name (stored as <name>.db) or ":memory:"."""
+        if database != ":memory:" and not os.path.splitext(database)[1]:
+            database += ".db"
+        self.path = database
+        self.close()
+
+    def reset_database(self):
+        """Deletes the database file, or drops the in-memory database (close the pool first)."""
+        self.close()
+        if self.in_memory:
+            return
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def describe(self):
+        return f"SQLite {self.path}"
+
+    def close(self):
+        """Releases the in-memory database (file databases need nothing)."""
+        if self._keeper is not None:
+            self._keeper.close()
+            self._keeper = None
+
+
+# --- sqlite3 adapter with the mysql.connector calling conventions ---
+
+def _datetime_from_db(value):
+    try:
+        return datetime.datetime.fromisoformat(value.decode())
+    except ValueError:
+        return value.decode()
+
+def _date_from_db(value):
+    try:
+        return datetime.date.fromisoformat(value.decode()[:10])
+    except ValueError:
+        return value.decode()
+
+# DATETIME / DATE columns come back as datetime objects, as with mysql.connector
+sqlite3.register_converter("DATETIME", _datetime_from_db)
+sqlite3.register_converter("DATE", _date_from_db)
+
+
+def _to_db(value):
+    # Stored in the format MySQL prints, so text comparisons order correctly
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    return value
+
+def _adapt(params):
+    if params is None:
+        return ()
+    if isinstance(params, dict):
+        return {k: _to_db(v) for k, v in params.items()}
+    return [_to_db(v) for v in params]
+
+
+_FOR_UPDATE = re.compile(r"\s+FOR\s+UPDATE\b", re.IGNORECASE)
+_NAMED_PARAM = re.compile(r"%\((\w+)\)s")
+
+@functools.lru_cache(maxsize=1024)
+def _translate(sql, with_params):
+    """Returns (sqlite_sql, locks) for a MySQL statement. `locks` is True for SELECT ... FOR UPDATE."""
+    stripped = _FOR_UPDATE.sub("", sql)
+    locks = stripped != sql
+    if with_params:
+        stripped = _NAMED_PARAM.sub(r":\1", stripped).replace("%s", "?").replace("%%", "%")
+    return stripped, locks
+
+
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _curdate():
+    return datetime.date.today().isoformat()
+
+
+class SQLiteConnection:
+    """A sqlite3 connection that takes the same calls db_manager makes on a mysql.connector one."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._open = True
+        raw.create_function("NOW", 0, _now)
+        raw.create_function("CURDATE", 0, _curdate)
+        raw.create_function("MentorSessionCount", 1, self._mentor_session_count)
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SQLiteCursor(self, self._raw.cursor(), dictionary)
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def is_connected(self):
+        if not self._open:
+            return False
+        try:
+            self._raw.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        self._open = False
+        self._raw.close()
+
+    # --- Stored function / procedure equivalents ---
+
+    def _mentor_session_count(self, mentor_id):
+        """MentorSessionCount(p_mentor_id): completed sessions the student led."""
+        row = self._raw.execute("""
+            SELECT COUNT(*)
+            FROM SessionParticipant sp
+            JOIN MentorshipSession ms ON sp.session_id = ms.session_id
+            WHERE sp.student_id = ? AND sp.role = 'mentor' AND ms.status = 'completed'
+        """, (mentor_id,)).fetchone()
+        return row[0] if row else 0
+
+    def _add_mentorship_session(self, cursor, subject_id, date_time, duration, mentor_id, mentee_ids):
+        """AddMentorshipSession(subject, date_time, duration, mentor, '2,3'): session plus participants."""
+        cursor.execute("INSERT INTO MentorshipSession (subject_id, date_time, duration) VALUES (?, ?, ?)",
+                       _adapt((subject_id, date_time, duration)))
+        session_id = cursor.lastrowid
+        mentees = sorted({int(m) for m in str(mentee_ids or "").split(",") if m.strip()} - {int(mentor_id)})
+        cursor.executemany("INSERT INTO SessionParticipant (session_id, student_id, role) VALUES (?, ?, ?)",
+                           [(session_id, mentor_id, "mentor")] + [(session_id, m, "mentee") for m in mentees])
+
+
+class SQLiteCursor:
+    def __init__(self, conn, raw, dictionary):
+        self._conn = conn
+        self._raw = raw
+        self._dictionary = dictionary
+
+    def execute(self, operation, params=None):
+        sql, locks = _translate(operation, params is not None)
+        if locks and not self._conn.in_transaction:
+            # FOR UPDATE: take the write lock up front, like InnoDB's row locks
+            self._raw.execute("BEGIN IMMEDIATE")
+        self._raw.execute(sql, _adapt(params))
+
+    def executemany(self, operation, seq_params):
+        sql, _ = _translate(operation, True)
+        self._raw.executemany(sql, (_adapt(p) for p in seq_params))
+
+    def callproc(self, procname, args=()):
+        procedures = {"AddMentorshipSession": self._conn._add_mentorship_session}
+        if procname not in procedures:
+            raise sqlite3.OperationalError(f"no such procedure: {procname}")
+        procedures[procname](self._raw, *args)
+        return args
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip((d[0] for d in self._raw.description), row))
+
+    def fetchone(self):
+        return self._row(self._raw.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._row(r) for r in self._raw.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(r) for r in self._raw.fetchall()]
+
+    def __iter__(self):
+        return (self._row(r) for r in self._raw)
+
+    @property
+    def description(self):
+        return self._raw.description
+
+    @property
+    def with_rows(self):
+        return self._raw.description is not None
+
+    @property
+    def lastrowid(self):
+        return self._raw.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._raw.rowcount
+
+    def close(self):
+        self._raw.close()
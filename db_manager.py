@@ -1,457 +1,1729 @@
-import mysql.connector
-from tkinter import messagebox
-
-def get_db_connection():
-    """Establishes a connection to the MySQL database."""
-    try:
-        conn = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="maitreyi", # <-- IMPORTANT: CHANGE THIS
-            database="PeerTutoring"
-        )
-        return conn
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error connecting to MySQL: {e}")
-        return None
-
-# --- Student Management Functions ---
-
-def fetch_students():
-    """Fetches all students from the database."""
-    conn = get_db_connection()
-    if not conn:
-        return []
-        
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM Student ORDER BY student_id")
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching students: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
-
-def add_student(data):
-    """Adds a new student to the database. Data is a dictionary."""
-    conn = get_db_connection()
-    if not conn:
-        return False
-
-    # --- Basic Python-side validation first ---
-    # (Prevents DB errors before they happen)
-    if not data["name"].strip():
-        messagebox.showwarning("Validation Error", "Student name cannot be empty.")
-        return False
-
-    if "@" not in data["email"] or "." not in data["email"]:
-        messagebox.showwarning("Validation Error", "Please enter a valid email address.")
-        return False
-
-    ph = data["ph_no"].strip()
-    if not ph.isdigit() or len(ph) != 10:
-        messagebox.showwarning("Validation Error", "Phone number must be exactly 10 digits.")
-        return False
-
-    if data["year"] not in [1, 2, 3, 4]:
-        messagebox.showwarning("Validation Error", "Year must be between 1 and 4.")
-        return False
-
-    query = """
-    INSERT INTO Student (name, email, ph_no, role, dept, year) 
-    VALUES (%(name)s, %(email)s, %(ph_no)s, %(role)s, %(dept)s, %(year)s)
-    """
-
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, data)
-        conn.commit()
-        messagebox.showinfo("Success", f"Student '{data['name']}' added successfully!")
-        return True
-
-    except mysql.connector.Error as e:
-        conn.rollback()
-
-        # Handle common SQL errors
-        if e.errno == 1062:
-            # Duplicate entry
-            if "email" in str(e).lower():
-                messagebox.showerror("Duplicate Entry", "This email is already registered.")
-            elif "ph_no" in str(e).lower():
-                messagebox.showerror("Duplicate Entry", "This phone number is already registered.")
-            else:
-                messagebox.showerror("Duplicate Entry", "Duplicate value detected.")
-        elif e.errno == 3819:
-            # Check constraint violation
-            if "year" in str(e).lower():
-                messagebox.showerror("Input Error", "Year must be between 1 and 4.")
-            elif "ph_no" in str(e).lower():
-                messagebox.showerror("Input Error", "Phone number must have 10 digits.")
-            else:
-                messagebox.showerror("Input Error", "Input does not meet required conditions.")
-        else:
-            # Any other DB error
-            messagebox.showerror("Database Error", f"Unexpected error: {e}")
-
-        return False
-
-    finally:
-        if conn:
-            conn.close()
-def add_student(data):
-    """Adds a new student to the database. Data is a dictionary."""
-    conn = get_db_connection()
-    if not conn:
-        return False
-
-    # --- Basic Validation ---
-    if not data["name"].strip():
-        messagebox.showwarning("Validation Error", "Student name cannot be empty.")
-        return False
-
-    if "@" not in data["email"] or "." not in data["email"]:
-        messagebox.showwarning("Validation Error", "Please enter a valid email address.")
-        return False
-
-    ph = data["ph_no"].strip()
-    if not ph.isdigit() or len(ph) != 10:
-        messagebox.showwarning("Validation Error", "Phone number must be exactly 10 digits.")
-        return False
-
-    # ✅ Fixed year validation (convert to int first)
-    try:
-        year_value = int(data["year"])
-        if year_value not in [1, 2, 3, 4]:
-            messagebox.showwarning("Validation Error", "Year must be between 1 and 4.")
-            return False
-    except ValueError:
-        messagebox.showwarning("Validation Error", "Year must be a number between 1 and 4.")
-        return False
-
-    query = """
-    INSERT INTO Student (name, email, ph_no, role, dept, year) 
-    VALUES (%(name)s, %(email)s, %(ph_no)s, %(role)s, %(dept)s, %(year)s)
-    """
-
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, data)
-        conn.commit()
-        messagebox.showinfo("Success", f"Student '{data['name']}' added successfully!")
-        return True
-
-    except mysql.connector.Error as e:
-        conn.rollback()
-
-        if e.errno == 1062:
-            if "email" in str(e).lower():
-                messagebox.showerror("Duplicate Entry", "This email is already registered.")
-            elif "ph_no" in str(e).lower():
-                messagebox.showerror("Duplicate Entry", "This phone number is already registered.")
-            else:
-                messagebox.showerror("Duplicate Entry", "Duplicate value detected.")
-        elif e.errno == 3819:
-            if "year" in str(e).lower():
-                messagebox.showerror("Input Error", "Year must be between 1 and 4.")
-            elif "ph_no" in str(e).lower():
-                messagebox.showerror("Input Error", "Phone number must have 10 digits.")
-            else:
-                messagebox.showerror("Input Error", "Input does not meet required conditions.")
-        else:
-            messagebox.showerror("Database Error", f"Unexpected error: {e}")
-
-        return False
-
-    finally:
-        if conn:
-            conn.close()
-
-
-def update_student(data):
-    """Updates an existing student. Data is a dictionary including student_id."""
-    conn = get_db_connection()
-    if not conn:
-        return False
-        
-    query = """
-    UPDATE Student 
-    SET name=%(name)s, email=%(email)s, ph_no=%(ph_no)s, 
-        role=%(role)s, dept=%(dept)s, year=%(year)s
-    WHERE student_id = %(student_id)s
-    """
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, data)
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error updating student: {e}")
-        return False
-    finally:
-        if conn:
-            conn.close()
-
-def delete_student(student_id):
-    """Deletes a student from the database."""
-    conn = get_db_connection()
-    if not conn:
-        return False
-        
-    query = "DELETE FROM Student WHERE student_id = %s"
-    try:
-        cursor = conn.cursor()
-        cursor.execute(query, (student_id,))
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error deleting student: {e}")
-        return False
-    finally:
-        if conn:
-            conn.close()
-            
-# --- Helper Functions (for populating dropdowns) ---
-
-def fetch_students_by_role(role):
-    """Fetches students with a specific role."""
-    conn = get_db_connection()
-    if not conn: return []
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT student_id, name FROM Student WHERE role = %s ORDER BY name", (role,))
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching students: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-def fetch_all_subjects():
-    """Fetches all subjects."""
-    conn = get_db_connection()
-    if not conn: return []
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT subject_id, subject_name FROM Subject ORDER BY subject_name")
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching subjects: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-# --- Team Management Functions ---
-
-def fetch_teams():
-    """Fetches all teams with their mentor's name."""
-    conn = get_db_connection()
-    if not conn: return []
-    query = """
-    SELECT t.team_id, t.team_name, s.name as mentor_name, t.creation_date 
-    FROM Team t 
-    LEFT JOIN Student s ON t.mentor_id = s.student_id
-    ORDER BY t.team_name
-    """
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query)
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching teams: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-def fetch_team_members(team_id):
-    """Fetches all members (mentors and mentees) for a specific team."""
-    conn = get_db_connection()
-    if not conn: return []
-    query = """
-    SELECT s.student_id, s.name, tm.role 
-    FROM TeamMember tm 
-    JOIN Student s ON tm.student_id = s.student_id 
-    WHERE tm.team_id = %s
-    """
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, (team_id,))
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching team members: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-def create_team(team_name, mentor_id, mentee_ids_list):
-    """Creates a new team and adds a mentor and mentees."""
-    conn = get_db_connection()
-    if not conn: return False
-    
-    try:
-        cursor = conn.cursor()
-        # 1. Create the team
-        cursor.execute(
-            "INSERT INTO Team (team_name, mentor_id, creation_date) VALUES (%s, %s, CURDATE())",
-            (team_name, mentor_id)
-        )
-        team_id = cursor.lastrowid
-        
-        # 2. Add the mentor to TeamMember
-        cursor.execute(
-            "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, 'mentor')",
-            (team_id, mentor_id)
-        )
-        
-        # 3. Add all mentees to TeamMember
-        mentee_data = [(team_id, mentee_id, 'mentee') for mentee_id in mentee_ids_list]
-        if mentee_data:
-            cursor.executemany(
-                "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)",
-                mentee_data
-            )
-        
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error creating team: {e}")
-        return False
-    finally:
-        if conn: conn.close()
-
-def add_member_to_team(team_id, student_id, role):
-    """Adds a single new member to a team."""
-    conn = get_db_connection()
-    if not conn: return False
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)",
-            (team_id, student_id, role)
-        )
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        # Handle duplicate entry gracefully
-        if e.errno == 1062: # Duplicate key
-             messagebox.showwarning("Warning", "This student is already in the team.")
-        else:
-            messagebox.showerror("Database Error", f"Error adding member: {e}")
-        return False
-    finally:
-        if conn: conn.close()
-
-def delete_team(team_id):
-    """Deletes a team. TeamMembers are deleted by ON DELETE CASCADE."""
-    conn = get_db_connection()
-    if not conn: return False
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM Team WHERE team_id = %s", (team_id,))
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error deleting team: {e}")
-        return False
-    finally:
-        if conn: conn.close()
-
-# --- Mentorship Session Management Functions ---
-
-def fetch_sessions():
-    """Fetches all mentorship sessions with subject names."""
-    conn = get_db_connection()
-    if not conn: return []
-    query = """
-    SELECT ms.session_id, s.subject_name, ms.date_time, ms.duration, ms.status 
-    FROM MentorshipSession ms 
-    LEFT JOIN Subject s ON ms.subject_id = s.subject_id 
-    ORDER BY ms.date_time DESC
-    """
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query)
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching sessions: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-def fetch_session_participants(session_id):
-    """Fetches all participants for a specific session."""
-    conn = get_db_connection()
-    if not conn: return []
-    query = """
-    SELECT s.student_id, s.name, sp.role 
-    FROM SessionParticipant sp 
-    JOIN Student s ON sp.student_id = s.student_id 
-    WHERE sp.session_id = %s
-    """
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, (session_id,))
-        return cursor.fetchall()
-    except mysql.connector.Error as e:
-        messagebox.showerror("Database Error", f"Error fetching participants: {e}")
-        return []
-    finally:
-        if conn: conn.close()
-
-def schedule_session(subject_id, date_time, duration, mentor_id, mentee_ids_str):
-    """Calls the AddMentorshipSession stored procedure."""
-    conn = get_db_connection()
-    if not conn: return False
-    try:
-        cursor = conn.cursor()
-        args = (subject_id, date_time, duration, mentor_id, mentee_ids_str)
-        cursor.callproc('AddMentorshipSession', args)
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error scheduling session: {e}")
-        return False
-    finally:
-        if conn: conn.close()
-
-def update_session_status(session_id, status):
-    """Updates the status of a session."""
-    conn = get_db_connection()
-    if not conn: return False
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE MentorshipSession SET status = %s WHERE session_id = %s",
-            (status, session_id)
-        )
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error updating status: {e}")
-        return False
-    finally:
-        if conn: conn.close()
-
-def cancel_session(session_id):
-    """Deletes a session. Participants/Feedback are deleted by ON DELETE CASCADE."""
-    conn = get_db_connection()
-    if not conn: return False
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM MentorshipSession WHERE session_id = %s", (session_id,))
-        conn.commit()
-        return True
-    except mysql.connector.Error as e:
-        conn.rollback()
-        messagebox.showerror("Database Error", f"Error cancelling session: {e}")
-        return False
-    finally:
-        if conn: conn.close()
+"""
+Data-access layer for the Peer Tutoring database.
+
+This module has no UI dependencies: functions return plain data (lists of
+dicts, new IDs, True) and raise a DatabaseError subclass on failure, so it can
+be used from the Tk app, batch scripts, worker processes and benchmarks alike.
+"""
+import datetime
+import os
+import re
+import sys
+import threading
+import time
+
+import db_backend
+import db_pool
+import db_trace
+import interval_index
+import ref_cache
+
+# --- Connection Settings ---
+
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "maitreyi", # <-- IMPORTANT: CHANGE THIS
+    "database": "PeerTutoring",
+}
+
+# Storage backend: "mysql" (the server in DB_CONFIG) or "sqlite" (an embedded
+# database file at SQLITE_PATH, ":memory:" for a throwaway one). The
+# environment variables let the app run offline without editing this file.
+DB_BACKEND = os.environ.get("PEER_TUTORING_BACKEND", "mysql")
+SQLITE_PATH = os.environ.get("PEER_TUTORING_SQLITE", "peer_tutoring.db")
+
+# Pool tuning: how many connections to keep, how long an idle one may live (s),
+# and after how many idle seconds a connection is pinged before reuse.
+POOL_SETTINGS = {
+    "size": 5,
+    "max_idle": 300,
+    "ping_after": 5,
+    "checkout_timeout": 10,
+}
+
+# Rows per page for the *_page fetch functions (keyset pagination).
+PAGE_SIZE = 200
+
+# How long cached reference data (mentor/mentee lists, subjects) stays fresh, in seconds.
+REFERENCE_TTL = 300
+
+reference_cache = ref_cache.TTLCache(ttl=REFERENCE_TTL)
+
+# Team member lists kept in memory (by team_id); least recently used teams are dropped first.
+TEAM_MEMBER_CACHE_SIZE = 500
+
+team_member_cache = ref_cache.LRUCache(maxsize=TEAM_MEMBER_CACHE_SIZE)
+
+# Past 'scheduled' sessions are marked 'completed' by a periodic sweep
+# (see session_sweep.py): seconds between sweeps, and rows per transaction.
+SWEEP_INTERVAL = 60
+SWEEP_BATCH_SIZE = 5000
+
+# Rows fetched at a time when a whole table is streamed out (see export.py).
+EXPORT_CHUNK_SIZE = 5000
+
+# Statements taking longer than this (execute + fetch, in ms) go to the slow-query log.
+SLOW_QUERY_MS = 200
+SLOW_QUERY_LOG = "slow_queries.log"
+
+tracer = db_trace.Tracer(slow_ms=SLOW_QUERY_MS, slow_log=SLOW_QUERY_LOG)
+
+def _create_backend(name, **settings):
+    defaults = {"mysql": {"config": DB_CONFIG}, "sqlite": {"path": SQLITE_PATH}}
+    return db_backend.create(name, **dict(defaults.get(name, {}), **settings))
+
+backend = _create_backend(DB_BACKEND)
+
+_pool = None
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        settings = dict(POOL_SETTINGS)
+        if backend.max_connections:
+            settings["size"] = min(settings["size"], backend.max_connections)
+        _pool = db_pool.ConnectionPool(backend.connect, is_alive=backend.is_alive, **settings)
+    return _pool
+
+def configure_backend(name, **settings):
+    """
+    Switches the storage backend, e.g. configure_backend("sqlite", path=":memory:"),
+    and starts a fresh pool. Settings not given fall back to DB_CONFIG / SQLITE_PATH.
+    """
+    global backend
+    close_pool()
+    backend.close()
+    backend = _create_backend(name, **settings)
+    reference_cache.invalidate_all()
+    team_member_cache.invalidate_all()
+
+def configure_pool(**settings):
+    """Changes pool settings (size, max_idle, ...) and starts a fresh pool."""
+    global _pool
+    POOL_SETTINGS.update(settings)
+    if _pool is not None:
+        _pool.close_all()
+        _pool = None
+
+def pool_stats():
+    """Returns checkout/wait/handshake counters for the connection pool."""
+    return _get_pool().snapshot()
+
+def trace_stats():
+    """Returns connect/execute/fetch timings per statement and per function (see db_trace)."""
+    return tracer.snapshot()
+
+def close_pool():
+    """Closes all pooled connections (call on application exit)."""
+    global _pool
+    if _pool is not None:
+        _pool.close_all()
+        _pool = None
+
+# --- Errors ---
+
+class DatabaseError(Exception):
+    """Base class for all errors raised by db_manager. `title` suits a popup heading."""
+    title = "Database Error"
+
+class ConnectionFailedError(DatabaseError):
+    """The database could not be reached (or no pooled connection became free)."""
+
+class ValidationError(DatabaseError):
+    """Input was rejected by the Python-side checks before reaching the database."""
+    title = "Validation Error"
+
+class DuplicateEntryError(DatabaseError):
+    """A UNIQUE / PRIMARY KEY constraint was violated (MySQL errno 1062)."""
+    title = "Duplicate Entry"
+
+    def __init__(self, message, field=None):
+        super().__init__(message)
+        self.field = field
+
+class ConstraintViolationError(DatabaseError):
+    """A CHECK constraint was violated (MySQL errno 3819)."""
+    title = "Input Error"
+
+    def __init__(self, message, field=None):
+        super().__init__(message)
+        self.field = field
+
+class ConcurrentUpdateError(DatabaseError):
+    """
+    A compare-and-set update found the row changed (or deleted) since the
+    caller read it (see migrations/005_row_versions.sql). `current_version`
+    is None if the row is gone.
+    """
+    title = "Edit Conflict"
+
+    def __init__(self, message, current_version=None):
+        super().__init__(message)
+        self.current_version = current_version
+
+# MySQL client errors meaning "the server went away / can't be reached"
+_CONNECTION_ERRNOS = {2003, 2005, 2006, 2013, 2055}
+
+def _errno(e):
+    """The MySQL error number of a driver error (db_backend maps SQLite errors onto them)."""
+    return backend.errno(e)
+
+def _translate_error(e, context="Unexpected error"):
+    """Maps a driver error (db_backend.DRIVER_ERRORS) to the matching DatabaseError subclass."""
+    text = str(e).lower()
+    errno = _errno(e)
+    if errno == 1062:
+        # Duplicate entry
+        if "email" in text:
+            return DuplicateEntryError("This email is already registered.", "email")
+        if "ph_no" in text:
+            return DuplicateEntryError("This phone number is already registered.", "ph_no")
+        return DuplicateEntryError("Duplicate value detected.")
+    if errno == 3819:
+        # Check constraint violation
+        if "year" in text:
+            return ConstraintViolationError("Year must be between 1 and 4.", "year")
+        if "ph_no" in text:
+            return ConstraintViolationError("Phone number must have 10 digits.", "ph_no")
+        return ConstraintViolationError("Input does not meet required conditions.")
+    if errno in _CONNECTION_ERRNOS:
+        return ConnectionFailedError(f"Error connecting to {backend.label}: {e}")
+    return DatabaseError(f"{context}: {e}")
+
+def get_db_connection():
+    """
+    Checks out a pooled connection to the configured database. Call close() to return it.
+    Raises ConnectionFailedError if no connection can be made.
+
+    The connection is traced: its statements are timed and attributed to the
+    calling function (see db_trace). Inside a UnitOfWork block the block's
+    connection is returned instead, and close() leaves it checked out.
+    """
+    started = time.perf_counter()
+    shared = getattr(_unit_of_work, "conn", None)
+    conn = _BorrowedConnection(shared) if shared is not None else _checkout()
+    caller = sys._getframe(1)
+    while caller.f_code.co_name.startswith("_") and caller.f_back:
+        caller = caller.f_back  # attribute _count_rows etc. to the public function
+    return tracer.wrap(conn, time.perf_counter() - started, caller.f_code.co_name)
+
+def _checkout():
+    try:
+        return _get_pool().get()
+    except db_backend.DRIVER_ERRORS + (db_pool.PoolTimeoutError, ImportError) as e:
+        raise ConnectionFailedError(f"Error connecting to {backend.label}: {e}") from e
+
+# --- Unit of Work ---
+
+# The connection of the UnitOfWork block running on this thread, if any
+_unit_of_work = threading.local()
+
+class _BorrowedConnection:
+    """A UnitOfWork connection as handed to one db_manager call: close() keeps it checked out."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass  # returned to the pool when the UnitOfWork block ends
+
+    def discard(self):
+        pass  # the block's other calls still need it
+
+class UnitOfWork:
+    """
+    Runs several db_manager calls on one pooled connection:
+
+        with db_manager.UnitOfWork():
+            student_id = add_student(data)
+            student = fetch_student(student_id)
+
+    Every call made on this thread inside the block gets the block's
+    connection from get_db_connection(), so a write and the reads that
+    follow it cost one checkout instead of one each, and the reads are sure
+    to see the write. Each call still commits or rolls back its own
+    statements. A nested block shares the outer block's connection.
+    """
+
+    def __init__(self):
+        self._conn = None
+
+    def __enter__(self):
+        if getattr(_unit_of_work, "conn", None) is None:
+            self._conn = _unit_of_work.conn = _checkout()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._conn is not None:
+            _unit_of_work.conn = None
+            self._conn.close()  # the pool rolls back anything left uncommitted
+            self._conn = None
+        return False
+
+# --- Student Management Functions ---
+
+def fetch_students():
+    """Fetches all students from the database."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM Student ORDER BY student_id")
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching students") from e
+    finally:
+        conn.close()
+
+def fetch_student(student_id):
+    """Fetches one student (a dict, or None if there is no such student)."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM Student WHERE student_id = %s", (student_id,))
+        return cursor.fetchone()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching student") from e
+    finally:
+        conn.close()
+
+def fetch_students_page(after_id=0, limit=PAGE_SIZE):
+    """Fetches the next `limit` students with student_id greater than after_id."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(
+            "SELECT * FROM Student WHERE student_id > %s ORDER BY student_id LIMIT %s",
+            (after_id or 0, limit)
+        )
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching students") from e
+    finally:
+        conn.close()
+
+def count_students():
+    """Returns the total number of students."""
+    return _count_rows("Student", "students")
+
+def _count_rows(table, label):
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, f"Error counting {label}") from e
+    finally:
+        conn.close()
+
+# --- Student Search ---
+
+# Words at least this long use the FULLTEXT index (InnoDB's default innodb_ft_min_token_size)
+FULLTEXT_MIN_WORD = 3
+
+def _like_prefix(text):
+    """
+    Escapes LIKE wildcards so user text only matches literally, then adds the
+    trailing %. The escape character is "!" (ESCAPE '!'), which MySQL and
+    SQLite both read the same way.
+    """
+    return text.replace("!", "!!").replace("%", "!%").replace("_", "!_") + "%"
+
+def _student_search_filter(text="", dept=None, year=None, role=None, substring=False):
+    """Builds (WHERE conditions, params) for search_students / count_search_results."""
+    conditions, params = [], []
+    text = (text or "").strip()
+    words = re.findall(r"\w+", text)
+    if substring and text:
+        # Matches anywhere in the value, but has to scan every row
+        pattern = "%" + _like_prefix(text)
+        conditions.append("(name LIKE %s ESCAPE '!' OR email LIKE %s ESCAPE '!')")
+        params += [pattern, pattern]
+    elif "@" in text:
+        conditions.append("email LIKE %s ESCAPE '!'")
+        params.append(_like_prefix(text))
+    elif words and all(len(w) >= FULLTEXT_MIN_WORD for w in words):
+        condition, param = backend.student_text_filter(words)
+        conditions.append(condition)
+        params.append(param)
+    elif text:
+        conditions.append("(name LIKE %s ESCAPE '!' OR email LIKE %s ESCAPE '!')")
+        params += [_like_prefix(text), _like_prefix(text)]
+    if dept:
+        conditions.append("dept = %s")
+        params.append(dept)
+    if year:
+        conditions.append("year = %s")
+        params.append(int(year))
+    if role:
+        conditions.append("role = %s")
+        params.append(role)
+    return conditions, params
+
+def search_students(text="", dept=None, year=None, role=None, after_id=0, limit=PAGE_SIZE,
+                    substring=False):
+    """
+    Finds students page by page (keyset on student_id, like fetch_students_page).
+
+    `text` matches the start of any word in name or email (an email-looking
+    text matches the start of the email), served by the FULLTEXT and prefix
+    indexes from migration 004. With substring=True it matches anywhere in
+    name/email instead, which needs a full scan. dept, year and role are
+    exact filters; empty ones are ignored.
+    """
+    conditions, params = _student_search_filter(text, dept, year, role, substring)
+    conditions.append("student_id > %s")
+    params.append(after_id or 0)
+    query = f"SELECT * FROM Student WHERE {' AND '.join(conditions)} ORDER BY student_id LIMIT %s"
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params + [limit])
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error searching students") from e
+    finally:
+        conn.close()
+
+def count_search_results(text="", dept=None, year=None, role=None, substring=False):
+    """Number of students search_students() would return over all pages."""
+    conditions, params = _student_search_filter(text, dept, year, role, substring)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM Student {where}", params)
+        return cursor.fetchone()[0]
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error counting students") from e
+    finally:
+        conn.close()
+
+def validate_student(data):
+    """
+    Python-side checks run before touching the DB (mirrors the table's constraints).
+    Returns an error message, or None if the data looks valid.
+    """
+    if not str(data.get("name") or "").strip():
+        return "Student name cannot be empty."
+
+    email = str(data.get("email") or "")
+    if "@" not in email or "." not in email:
+        return "Please enter a valid email address."
+
+    ph = str(data.get("ph_no") or "").strip()
+    if not ph.isdigit() or len(ph) != 10:
+        return "Phone number must be exactly 10 digits."
+
+    # ✅ Fixed year validation (convert to int first)
+    try:
+        if int(data.get("year")) not in [1, 2, 3, 4]:
+            return "Year must be between 1 and 4."
+    except (TypeError, ValueError):
+        return "Year must be a number between 1 and 4."
+
+    if data.get("role") not in ("mentor", "mentee"):
+        return "Role must be 'mentor' or 'mentee'."
+
+    return None
+
+def add_student(data):
+    """Adds a new student to the database. Data is a dictionary. Returns the new student_id."""
+    # --- Basic Python-side validation first ---
+    # (Prevents DB errors before they happen)
+    error = validate_student(data)
+    if error:
+        raise ValidationError(error)
+
+    conn = get_db_connection()
+    query = """
+    INSERT INTO Student (name, email, ph_no, role, dept, year) 
+    VALUES (%(name)s, %(email)s, %(ph_no)s, %(role)s, %(dept)s, %(year)s)
+    """
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, data)
+        conn.commit()
+        _invalidate_student_lists()
+        return cursor.lastrowid  # new student_id
+
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e) from e
+
+    finally:
+        conn.close()
+
+def add_student_and_reload(data):
+    """
+    add_student() together with the reads that follow it in the app, as one
+    UnitOfWork: the new row (with its version) and the mentor/mentee lookups,
+    both roles read with a single query. One connection and three statements
+    instead of a connection per step. Returns a dict with student,
+    mentor_lookup and mentee_lookup.
+    """
+    with UnitOfWork():
+        student_id = add_student(data)
+        student = fetch_student(student_id)
+        mentor_lookup, mentee_lookup = get_student_lookups()
+    return {"student": student, "mentor_lookup": mentor_lookup, "mentee_lookup": mentee_lookup}
+
+# --- Bulk Student Import (used by bulk_import.py) ---
+
+STUDENT_COLUMNS = ("name", "email", "ph_no", "role", "dept", "year")
+
+def find_existing_contacts(emails, phones):
+    """Returns (emails, phones): the subsets of the given values already in Student."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        found_emails, found_phones = set(), set()
+        if emails:
+            marks = ", ".join(["%s"] * len(emails))
+            cursor.execute(f"SELECT email FROM Student WHERE email IN ({marks})", list(emails))
+            found_emails = {row[0] for row in cursor.fetchall()}
+        if phones:
+            marks = ", ".join(["%s"] * len(phones))
+            cursor.execute(f"SELECT ph_no FROM Student WHERE ph_no IN ({marks})", list(phones))
+            found_phones = {row[0] for row in cursor.fetchall()}
+        return found_emails, found_phones
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error checking existing students") from e
+    finally:
+        conn.close()
+
+def insert_students_batch(rows):
+    """
+    Inserts already-validated student dicts in one transaction with a single
+    multi-row INSERT. If the batch is rejected (e.g. a duplicate slipped in
+    since validation), falls back to row-by-row inserts to find the bad rows.
+
+    Returns (inserted_count, errors) where errors is a list of (index, message).
+    Raises DatabaseError for anything other than per-row constraint failures.
+    """
+    if not rows:
+        return 0, []
+    query = f"""
+    INSERT INTO Student ({", ".join(STUDENT_COLUMNS)}) 
+    VALUES ({", ".join(f"%({c})s" for c in STUDENT_COLUMNS)})
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(query, rows)
+            conn.commit()
+            _invalidate_student_lists()
+            return len(rows), []
+        except db_backend.DRIVER_ERRORS as e:
+            conn.rollback()
+            if _errno(e) not in (1062, 3819):
+                raise _translate_error(e, "Error importing students") from e
+
+        inserted, errors = 0, []
+        for index, row in enumerate(rows):
+            try:
+                cursor.execute(query, row)
+                inserted += 1
+            except db_backend.DRIVER_ERRORS as e:
+                if _errno(e) not in (1062, 3819):
+                    conn.rollback()
+                    raise _translate_error(e, "Error importing students") from e
+                errors.append((index, str(_translate_error(e))))
+        conn.commit()
+        if inserted:
+            _invalidate_student_lists()
+        return inserted, errors
+    finally:
+        conn.close()
+
+def update_student(data):
+    """
+    Updates an existing student. Data is a dictionary including student_id
+    and, normally, the `version` it was read at: the update then only
+    applies if nobody saved the student in the meantime, and raises
+    ConcurrentUpdateError otherwise. Returns the student's new version
+    (True if no version was given).
+    """
+    error = validate_student(data)
+    if error:
+        raise ValidationError(error)
+
+    conn = get_db_connection()
+    query = """
+    UPDATE Student 
+    SET name=%(name)s, email=%(email)s, ph_no=%(ph_no)s, 
+        role=%(role)s, dept=%(dept)s, year=%(year)s, version = version + 1
+    WHERE student_id = %(student_id)s
+    """
+    version = data.get("version")
+    try:
+        cursor = conn.cursor()
+        if version is None:
+            cursor.execute(query, data)
+        else:
+            cursor.execute(query + " AND version = %(version)s", dict(data, version=int(version)))
+            if cursor.rowcount == 0:
+                conn.rollback()
+                _raise_conflict(cursor, "Student", "student_id", data["student_id"], "student")
+        conn.commit()
+        _invalidate_student_lists()
+        return True if version is None else int(version) + 1
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error updating student") from e
+    finally:
+        conn.close()
+
+def update_student_and_reload(data):
+    """update_student() and a re-read of the row as stored (typed values, new version), as one UnitOfWork."""
+    with UnitOfWork():
+        update_student(data)
+        return fetch_student(data["student_id"])
+
+def delete_student(student_id):
+    """Deletes a student from the database."""
+    conn = get_db_connection()
+    query = "DELETE FROM Student WHERE student_id = %s"
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, (student_id,))
+        conn.commit()
+        _invalidate_student_lists()
+        return True
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error deleting student") from e
+    finally:
+        conn.close()
+            
+# --- Helper Functions (for populating dropdowns) ---
+
+def fetch_students_by_role(role):
+    """Fetches students with a specific role."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT student_id, name FROM Student WHERE role = %s ORDER BY name", (role,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching students") from e
+    finally:
+        conn.close()
+
+def fetch_students_by_roles(roles):
+    """Like fetch_students_by_role() for several roles in one query. Returns {role: rows}."""
+    conn = get_db_connection()
+    marks = ", ".join(["%s"] * len(roles))
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(f"SELECT student_id, name, role FROM Student WHERE role IN ({marks}) ORDER BY name",
+                       list(roles))
+        by_role = {role: [] for role in roles}
+        for row in cursor.fetchall():
+            by_role[row.pop('role')].append(row)
+        return by_role
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching students") from e
+    finally:
+        conn.close()
+
+def fetch_all_subjects():
+    """Fetches all subjects."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT subject_id, subject_name FROM Subject ORDER BY subject_name")
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching subjects") from e
+    finally:
+        conn.close()
+
+# --- Cached Reference Data (shared by the Team and Session tabs) ---
+
+def get_students_by_role(role):
+    """Like fetch_students_by_role(), but served from the reference cache."""
+    return reference_cache.get(("students_by_role", role), lambda: fetch_students_by_role(role))
+
+def get_all_subjects():
+    """Like fetch_all_subjects(), but served from the reference cache."""
+    return reference_cache.get("subjects", fetch_all_subjects)
+
+def get_student_lookup(role):
+    """Students of a role as a ref_cache.Lookup (by ID and by "Name (#id)" label), cached."""
+    return reference_cache.get(
+        ("student_lookup", role),
+        lambda: ref_cache.Lookup(get_students_by_role(role), "student_id", "name")
+    )
+
+def get_student_lookups():
+    """
+    (mentor lookup, mentee lookup) as get_student_lookup() returns them, but
+    when either has to be loaded both roles are read with one query.
+    """
+    loaded = {}
+    def rows_of(role):
+        if not loaded:
+            loaded.update(fetch_students_by_roles(("mentor", "mentee")))
+        return loaded[role]
+    return tuple(
+        reference_cache.get(
+            ("student_lookup", role),
+            lambda role=role: ref_cache.Lookup(
+                reference_cache.get(("students_by_role", role), lambda: rows_of(role)), "student_id", "name")
+        )
+        for role in ("mentor", "mentee")
+    )
+
+def get_subject_lookup():
+    """Subjects as a ref_cache.Lookup (subject names are unique, so labels are plain names), cached."""
+    return reference_cache.get(
+        "subject_lookup",
+        lambda: ref_cache.Lookup(get_all_subjects(), "subject_id", "subject_name", unique_names=True)
+    )
+
+def _invalidate_student_lists():
+    """Called after any student write; mentor/mentee lists must be re-read."""
+    reference_cache.invalidate(("students_by_role", "mentor"), ("students_by_role", "mentee"),
+                               ("student_lookup", "mentor"), ("student_lookup", "mentee"))
+    # Member lists show student names (and lose deleted students)
+    team_member_cache.invalidate_all()
+
+# --- Team Management Functions ---
+
+def fetch_teams():
+    """Fetches all teams with their mentor's name."""
+    conn = get_db_connection()
+    query = """
+    SELECT t.team_id, t.team_name, s.name as mentor_name, t.creation_date 
+    FROM Team t 
+    LEFT JOIN Student s ON t.mentor_id = s.student_id
+    ORDER BY t.team_name
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query)
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching teams") from e
+    finally:
+        conn.close()
+
+def fetch_teams_page(after_name=None, limit=PAGE_SIZE):
+    """Fetches the next `limit` teams ordered by name, after the team named after_name."""
+    conn = get_db_connection()
+    query = """
+    SELECT t.team_id, t.team_name, s.name as mentor_name, t.creation_date 
+    FROM Team t 
+    LEFT JOIN Student s ON t.mentor_id = s.student_id
+    {where}
+    ORDER BY t.team_name
+    LIMIT %s
+    """
+    if after_name is None:
+        where, params = "", ()
+    else:
+        where, params = "WHERE t.team_name > %s", (after_name,)
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query.format(where=where), params + (limit,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching teams") from e
+    finally:
+        conn.close()
+
+def count_teams():
+    """Returns the total number of teams."""
+    return _count_rows("Team", "teams")
+
+def fetch_team_members(team_id):
+    """Fetches all members (mentors and mentees) for a specific team."""
+    conn = get_db_connection()
+    query = """
+    SELECT s.student_id, s.name, tm.role 
+    FROM TeamMember tm 
+    JOIN Student s ON tm.student_id = s.student_id 
+    WHERE tm.team_id = %s
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, (team_id,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching team members") from e
+    finally:
+        conn.close()
+
+def fetch_members_for_teams(team_ids):
+    """Returns {team_id: [members]} for many teams with one query."""
+    result = {team_id: [] for team_id in team_ids}
+    if not result:
+        return result
+    conn = get_db_connection()
+    marks = ", ".join(["%s"] * len(result))
+    query = f"""
+    SELECT tm.team_id, s.student_id, s.name, tm.role 
+    FROM TeamMember tm 
+    JOIN Student s ON tm.student_id = s.student_id 
+    WHERE tm.team_id IN ({marks})
+    ORDER BY tm.team_id, tm.role, s.name
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, list(result))
+        for row in cursor.fetchall():
+            result[row.pop('team_id')].append(row)
+        return result
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching team members") from e
+    finally:
+        conn.close()
+
+def get_team_members(team_ids):
+    """Like fetch_members_for_teams(), but served from the team member cache where possible."""
+    return team_member_cache.get_many(team_ids, fetch_members_for_teams)
+
+def create_team(team_name, mentor_id, mentee_ids_list):
+    """Creates a new team and adds a mentor and mentees."""
+    conn = get_db_connection()
+    
+    try:
+        cursor = conn.cursor()
+        # 1. Create the team
+        cursor.execute(
+            "INSERT INTO Team (team_name, mentor_id, creation_date) VALUES (%s, %s, CURDATE())",
+            (team_name, mentor_id)
+        )
+        team_id = cursor.lastrowid
+        
+        # 2. Add the mentor to TeamMember
+        cursor.execute(
+            "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, 'mentor')",
+            (team_id, mentor_id)
+        )
+        
+        # 3. Add all mentees to TeamMember
+        mentee_data = [(team_id, mentee_id, 'mentee') for mentee_id in mentee_ids_list]
+        if mentee_data:
+            cursor.executemany(
+                "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)",
+                mentee_data
+            )
+        
+        conn.commit()
+        team_member_cache.invalidate(team_id)
+        return True
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error creating team") from e
+    finally:
+        conn.close()
+
+def add_member_to_team(team_id, student_id, role):
+    """Adds a single new member to a team."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)",
+            (team_id, student_id, role)
+        )
+        conn.commit()
+        team_member_cache.invalidate(team_id)
+        return True
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        # Handle duplicate entry gracefully
+        if _errno(e) == 1062: # Duplicate key
+            raise DuplicateEntryError("This student is already in the team.", "student_id") from e
+        raise _translate_error(e, "Error adding member") from e
+    finally:
+        conn.close()
+
+def delete_team(team_id):
+    """Deletes a team. TeamMembers are deleted by ON DELETE CASCADE."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM Team WHERE team_id = %s", (team_id,))
+        conn.commit()
+        team_member_cache.invalidate(team_id)
+        return True
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error deleting team") from e
+    finally:
+        conn.close()
+
+def create_teams_bulk(teams):
+    """
+    Creates many teams in one transaction. `teams` is a list of
+    (team_name, mentor_id, mentee_ids). Team names are unique, so a name
+    that is already taken (or repeated in the list) gets a " (2)", " (3)",
+    ... suffix. If a team cannot be created (e.g. its mentor or a mentee was
+    deleted meanwhile) the other teams still are.
+
+    Returns (team_ids, problems): team_ids[i] is the new id of teams[i], or
+    None if it was not created; problems is a list of (index, message) for
+    renamed and failed teams.
+    """
+    if not teams:
+        return [], []
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        names = _free_team_names(cursor, [name for name, _, _ in teams])
+        problems = [(i, f'Named "{new}" because "{old[0]}" is already taken.')
+                    for i, (old, new) in enumerate(zip(teams, names)) if new != old[0]]
+        teams = [(name, mentor_id, mentee_ids) for name, (_, mentor_id, mentee_ids) in zip(names, teams)]
+        try:
+            team_ids = _insert_teams(cursor, teams)
+            conn.commit()
+            team_member_cache.invalidate(*team_ids)
+            return team_ids, problems
+        except db_backend.DRIVER_ERRORS as e:
+            conn.rollback()
+            if _errno(e) not in _TEAM_ROW_ERRNOS:
+                raise _translate_error(e, "Error creating teams") from e
+
+        # A team broke the batch: create them one at a time to find it
+        team_ids = []
+        for index, (name, mentor_id, mentee_ids) in enumerate(teams):
+            team_id = None
+            try:
+                cursor.execute(_TEAM_INSERT, (name, mentor_id))
+                team_id = cursor.lastrowid
+                cursor.executemany(_TEAM_MEMBER_INSERT, _team_members(team_id, mentor_id, mentee_ids))
+                team_ids.append(team_id)
+            except db_backend.DRIVER_ERRORS as e:
+                if _errno(e) not in _TEAM_ROW_ERRNOS:
+                    conn.rollback()
+                    raise _translate_error(e, "Error creating teams") from e
+                if team_id is not None:
+                    cursor.execute("DELETE FROM Team WHERE team_id = %s", (team_id,))  # members cascade
+                team_ids.append(None)
+                reason = ("its mentor or a mentee no longer exists" if _errno(e) == 1452
+                          else str(_translate_error(e)).rstrip(".").lower())
+                problems.append((index, f'"{name}" was not created: {reason}.'))
+        conn.commit()
+        team_member_cache.invalidate(*(team_id for team_id in team_ids if team_id is not None))
+        problems.sort(key=lambda p: p[0])
+        return team_ids, problems
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error creating teams") from e
+    finally:
+        conn.close()
+
+# Per-team failures create_teams_bulk falls back on: name taken meanwhile (1062), student deleted (1452)
+_TEAM_ROW_ERRNOS = (1062, 1452)
+
+_TEAM_INSERT = "INSERT INTO Team (team_name, mentor_id, creation_date) VALUES (%s, %s, CURDATE())"
+_TEAM_MEMBER_INSERT = "INSERT INTO TeamMember (team_id, student_id, role) VALUES (%s, %s, %s)"
+
+def _free_team_names(cursor, names):
+    """`names` with a " (2)", " (3)", ... suffix added where a name is taken (case-insensitively) or repeated."""
+    result = list(names)
+    counters = [1] * len(names)
+    while True:
+        marks = ", ".join(["%s"] * len(result))
+        cursor.execute(f"SELECT team_name FROM Team WHERE team_name IN ({marks})", result)
+        taken = {row[0].lower() for row in cursor.fetchall()}
+        changed = False
+        for i, name in enumerate(result):
+            if name.lower() in taken:
+                counters[i] += 1
+                result[i] = f"{names[i]} ({counters[i]})"
+                changed = True
+            else:
+                taken.add(name.lower())  # a later repeat in the list counts as taken
+        if not changed:
+            return result
+
+def _insert_teams(cursor, teams):
+    """Inserts (team_name, mentor_id, mentee_ids) teams and their members. Returns the new team_ids."""
+    cursor.executemany(_TEAM_INSERT, [(name, mentor_id) for name, mentor_id, _ in teams])
+    # Look the new IDs up by (unique) name rather than trusting consecutive auto-increments
+    names = [name for name, _, _ in teams]
+    marks = ", ".join(["%s"] * len(names))
+    cursor.execute(f"SELECT team_name, team_id FROM Team WHERE team_name IN ({marks})", names)
+    ids = {name.lower(): team_id for name, team_id in cursor.fetchall()}
+
+    members = []
+    for name, mentor_id, mentee_ids in teams:
+        members += _team_members(ids[name.lower()], mentor_id, mentee_ids)
+    cursor.executemany(_TEAM_MEMBER_INSERT, members)
+    return [ids[name.lower()] for name in names]
+
+def _team_members(team_id, mentor_id, mentee_ids):
+    return [(team_id, mentor_id, 'mentor')] + [(team_id, mentee_id, 'mentee') for mentee_id in dict.fromkeys(mentee_ids)
+                                               if mentee_id != mentor_id]
+
+# --- Matching Data (used by matching.py) ---
+
+def fetch_matching_data():
+    """
+    Reads everything the matching engine needs on one connection:
+    students, (student_id, subject_id) pairs, mentees per mentor across their
+    teams, upcoming sessions per mentor, and the mentees already in a team.
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT student_id, name, role, dept, year FROM Student")
+        students = cursor.fetchall()
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT student_id, subject_id FROM StudentSubject")
+        subjects = cursor.fetchall()
+        cursor.execute("""
+        SELECT t.mentor_id, COUNT(DISTINCT tm.student_id)
+        FROM Team t
+        JOIN TeamMember tm ON tm.team_id = t.team_id AND tm.role = 'mentee'
+        WHERE t.mentor_id IS NOT NULL
+        GROUP BY t.mentor_id
+        """)
+        team_load = dict(cursor.fetchall())
+        cursor.execute("""
+        SELECT sp.student_id, COUNT(*)
+        FROM MentorshipSession ms
+        JOIN SessionParticipant sp ON sp.session_id = ms.session_id AND sp.role = 'mentor'
+        WHERE ms.status = 'scheduled'
+        GROUP BY sp.student_id
+        """)
+        session_load = dict(cursor.fetchall())
+        cursor.execute("SELECT DISTINCT student_id FROM TeamMember WHERE role = 'mentee'")
+        mentees_in_teams = {row[0] for row in cursor.fetchall()}
+
+        return {
+            "students": students,
+            "subjects": subjects,
+            "team_load": team_load,
+            "session_load": session_load,
+            "mentees_in_teams": mentees_in_teams,
+        }
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error loading matching data") from e
+    finally:
+        conn.close()
+
+# --- Mentorship Session Management Functions ---
+
+def fetch_sessions():
+    """Fetches all mentorship sessions with subject names."""
+    conn = get_db_connection()
+    query = """
+    SELECT ms.session_id, s.subject_name, ms.date_time, ms.duration, ms.status 
+    FROM MentorshipSession ms 
+    LEFT JOIN Subject s ON ms.subject_id = s.subject_id 
+    ORDER BY ms.date_time DESC
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query)
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching sessions") from e
+    finally:
+        conn.close()
+
+def fetch_sessions_page(after=None, limit=PAGE_SIZE):
+    """
+    Fetches the next `limit` sessions, newest first.
+    `after` is the (date_time, session_id) of the last row already shown, or None
+    for the first page. Sessions without a date come last, as in fetch_sessions().
+    """
+    conn = get_db_connection()
+    query = """
+    SELECT ms.session_id, s.subject_name, ms.date_time, ms.duration, ms.status 
+    FROM MentorshipSession ms 
+    LEFT JOIN Subject s ON ms.subject_id = s.subject_id 
+    {where}
+    ORDER BY ms.date_time DESC, ms.session_id DESC
+    LIMIT %s
+    """
+    where, params = _session_keyset(after)
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query.format(where=where), params + (limit,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching sessions") from e
+    finally:
+        conn.close()
+
+def _session_keyset(after):
+    """WHERE clause + params for the sessions after (date_time, session_id), newest first."""
+    if after is None:
+        return "", ()
+    if after[0] is None:
+        return "WHERE ms.date_time IS NULL AND ms.session_id < %s", (after[1],)
+    where = ("WHERE ms.date_time < %s OR (ms.date_time = %s AND ms.session_id < %s) "
+             "OR ms.date_time IS NULL")
+    return where, (after[0], after[0], after[1])
+
+def fetch_session_overview_page(after=None, limit=PAGE_SIZE, with_participants=True):
+    """
+    Like fetch_sessions_page(), plus per session: participant_count,
+    mentor_name, avg_rating and feedback_count, computed in one grouped query
+    over just this page. With with_participants=True each row also gets a
+    'participants' list (one extra IN query), so selecting a session needs no
+    further round trip.
+    """
+    conn = get_db_connection()
+    # Feedback rows repeat once per participant in the join; AVG is unaffected
+    # (every rating of a session repeats equally often) and the counts use DISTINCT.
+    query = """
+    SELECT ms.session_id, s.subject_name, ms.date_time, ms.duration, ms.status, ms.version,
+           COUNT(DISTINCT sp.student_id) AS participant_count,
+           MAX(CASE WHEN sp.role = 'mentor' THEN st.name END) AS mentor_name,
+           AVG(f.rating) AS avg_rating,
+           COUNT(DISTINCT f.feedback_id) AS feedback_count
+    FROM (
+        SELECT ms.session_id, ms.subject_id, ms.date_time, ms.duration, ms.status, ms.version
+        FROM MentorshipSession ms
+        {where}
+        ORDER BY ms.date_time DESC, ms.session_id DESC
+        LIMIT %s
+    ) ms
+    LEFT JOIN Subject s ON ms.subject_id = s.subject_id
+    LEFT JOIN SessionParticipant sp ON sp.session_id = ms.session_id
+    LEFT JOIN Student st ON st.student_id = sp.student_id AND sp.role = 'mentor'
+    LEFT JOIN Feedback f ON f.session_id = ms.session_id
+    GROUP BY ms.session_id, s.subject_name, ms.date_time, ms.duration, ms.status, ms.version
+    ORDER BY ms.date_time DESC, ms.session_id DESC
+    """
+    where, params = _session_keyset(after)
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query.format(where=where), params + (limit,))
+        sessions = cursor.fetchall()
+        for session in sessions:
+            if session['avg_rating'] is not None:
+                session['avg_rating'] = round(float(session['avg_rating']), 2)
+        if with_participants:
+            by_session = _participants_for(cursor, [s['session_id'] for s in sessions])
+            for session in sessions:
+                session['participants'] = by_session[session['session_id']]
+        return sessions
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching sessions") from e
+    finally:
+        conn.close()
+
+def count_sessions():
+    """Returns the total number of sessions."""
+    return _count_rows("MentorshipSession", "sessions")
+
+def fetch_session_participants(session_id):
+    """Fetches all participants for a specific session."""
+    conn = get_db_connection()
+    query = """
+    SELECT s.student_id, s.name, sp.role 
+    FROM SessionParticipant sp 
+    JOIN Student s ON sp.student_id = s.student_id 
+    WHERE sp.session_id = %s
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, (session_id,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching participants") from e
+    finally:
+        conn.close()
+
+def fetch_participants_for_sessions(session_ids):
+    """Returns {session_id: [participants]} for many sessions with one query."""
+    conn = get_db_connection()
+    try:
+        return _participants_for(conn.cursor(dictionary=True), session_ids)
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching participants") from e
+    finally:
+        conn.close()
+
+def _participants_for(cursor, session_ids):
+    result = {session_id: [] for session_id in session_ids}
+    if not result:
+        return result
+    marks = ", ".join(["%s"] * len(result))
+    cursor.execute(f"""
+    SELECT sp.session_id, s.student_id, s.name, sp.role
+    FROM SessionParticipant sp
+    JOIN Student s ON sp.student_id = s.student_id
+    WHERE sp.session_id IN ({marks})
+    ORDER BY sp.session_id, sp.role, s.name
+    """, list(result))
+    for row in cursor.fetchall():
+        result[row.pop('session_id')].append(row)
+    return result
+
+def schedule_session(subject_id, date_time, duration, mentor_id, mentee_ids):
+    """
+    Creates a session with its mentor and mentees in one transaction and
+    returns the new session_id.
+
+    mentee_ids is a list of student IDs (a comma-separated string, as the
+    AddMentorshipSession procedure takes, is also accepted). All participants
+    go in with a single multi-row INSERT, so the number of round trips does
+    not grow with the group size.
+    """
+    try:
+        mentor_id, mentee_ids = int(mentor_id), _parse_student_ids(mentee_ids)
+    except (TypeError, ValueError):
+        raise ValidationError("Mentor and mentee IDs must be whole numbers.") from None
+    # Drop repeats (and the mentor) so one bad pick can't fail the whole insert
+    mentee_ids = [m for m in dict.fromkeys(mentee_ids) if m != mentor_id]
+
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO MentorshipSession (subject_id, date_time, duration) VALUES (%s, %s, %s)",
+            (subject_id, date_time, duration)
+        )
+        session_id = cursor.lastrowid
+
+        participants = [(session_id, mentor_id, 'mentor')]
+        participants += [(session_id, mentee_id, 'mentee') for mentee_id in mentee_ids]
+        cursor.executemany(
+            "INSERT INTO SessionParticipant (session_id, student_id, role) VALUES (%s, %s, %s)",
+            participants
+        )
+        conn.commit()
+        return session_id
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error scheduling session") from e
+    finally:
+        conn.close()
+
+def _parse_student_ids(ids):
+    """A list of student IDs, or a comma-separated string of them, as ints. Raises ValueError."""
+    if isinstance(ids, str):
+        ids = [m for m in ids.split(",") if m.strip()]
+    return [int(m) for m in ids or []]
+
+# --- Session Status Sweep (replaces the update_session_status trigger) ---
+
+def complete_past_sessions(now=None, batch_size=SWEEP_BATCH_SIZE):
+    """
+    Marks every 'scheduled' session that started before `now` as 'completed'
+    and refreshes the affected mentors' MentorStats. Returns the number of
+    sessions updated.
+
+    The rows are found through the (status, date_time) index and updated by
+    primary key, batch_size at a time, each batch in its own short
+    transaction so a large backlog never holds locks for long.
+    """
+    cutoff = now or datetime.datetime.now()
+    total = 0
+    while True:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+            SELECT session_id FROM MentorshipSession
+            WHERE status = 'scheduled' AND date_time < %s
+            ORDER BY date_time
+            LIMIT %s
+            FOR UPDATE
+            """, (cutoff, batch_size))
+            session_ids = [row[0] for row in cursor.fetchall()]
+            if session_ids:
+                marks = ", ".join(["%s"] * len(session_ids))
+                cursor.execute(
+                    f"UPDATE MentorshipSession SET status = 'completed', version = version + 1 "
+                    f"WHERE session_id IN ({marks})",
+                    session_ids
+                )
+                _refresh_mentor_stats(cursor, _mentors_of_sessions(cursor, session_ids))
+            conn.commit()
+        except db_backend.DRIVER_ERRORS as e:
+            conn.rollback()
+            raise _translate_error(e, "Error completing past sessions") from e
+        finally:
+            conn.close()
+        total += len(session_ids)
+        if len(session_ids) < batch_size:
+            return total
+
+# Longest session the bulk scheduler accepts (minutes). It also bounds how far
+# back the conflict check has to look for sessions still running.
+MAX_SESSION_MINUTES = 24 * 60
+
+def _parse_session_request(request):
+    """Normalizes one bulk scheduling request. Returns (request, error message or None)."""
+    request = dict(request)
+    when = request.get("date_time")
+    if isinstance(when, str):
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+            try:
+                when = datetime.datetime.strptime(when.strip(), fmt)
+                break
+            except ValueError:
+                pass
+    if not isinstance(when, datetime.datetime):
+        return request, "Date/time must look like YYYY-MM-DD HH:MM:SS."
+    try:
+        duration = int(request.get("duration"))
+    except (TypeError, ValueError):
+        return request, "Duration must be a number of minutes."
+    if not 0 < duration <= MAX_SESSION_MINUTES:
+        return request, f"Duration must be between 1 and {MAX_SESSION_MINUTES} minutes."
+    if not request.get("mentor_id"):
+        return request, "A mentor is required."
+    try:
+        subject_id = int(request.get("subject_id"))
+    except (TypeError, ValueError):
+        return request, "Subject ID must be a whole number."
+    try:
+        mentor_id = int(request["mentor_id"])
+        mentee_ids = _parse_student_ids(request.get("mentee_ids"))
+    except (TypeError, ValueError):
+        return request, "Mentor and mentee IDs must be whole numbers."
+    request.update(
+        subject_id=subject_id, date_time=when, duration=duration, mentor_id=mentor_id,
+        mentee_ids=[m for m in dict.fromkeys(mentee_ids) if m != mentor_id],
+    )
+    return request, None
+
+def schedule_sessions_bulk(requests):
+    """
+    Schedules many sessions at once, refusing any that would double-book a
+    participant.
+
+    Each request is a dict with subject_id, date_time, duration, mentor_id
+    and mentee_ids (as for schedule_session). Existing sessions of every
+    participant in the batch's time window are read in one query into an
+    interval index; requests are then checked in order against it (and
+    against earlier requests of the same batch). Requests naming a student
+    or subject that does not exist are refused too. All remaining sessions
+    are inserted in one transaction.
+
+    The participants' Student rows are locked (FOR UPDATE) before their
+    schedules are read and stay locked until the inserts commit, so two
+    batches sharing a participant run one after the other and cannot both
+    pass the check.
+
+    Returns {"scheduled": [(index, session_id)], "conflicts": [report]} where
+    each report is {"index", "reason", "clashes": [(student_id, start, end, what)]}.
+    Cancelled sessions never conflict.
+    """
+    parsed, conflicts = [], []
+    for index, request in enumerate(requests):
+        request, error = _parse_session_request(request)
+        if error:
+            conflicts.append({"index": index, "reason": error, "clashes": []})
+        else:
+            parsed.append((index, request))
+    if not parsed:
+        return {"scheduled": [], "conflicts": conflicts}
+
+    students = sorted({sid for _, r in parsed for sid in [r["mentor_id"]] + r["mentee_ids"]})
+    window_start = min(r["date_time"] for _, r in parsed)
+    window_end = max(r["date_time"] + datetime.timedelta(minutes=r["duration"]) for _, r in parsed)
+    max_length = datetime.timedelta(minutes=MAX_SESSION_MINUTES)
+    busy = interval_index.IntervalIndex(max_length)
+
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        marks = ", ".join(["%s"] * len(students))
+        # Lock first (in key order, so concurrent batches can't deadlock); the
+        # schedule read below is the transaction's first plain read, so its
+        # snapshot already includes sessions committed by whoever held the locks.
+        cursor.execute(f"SELECT student_id FROM Student WHERE student_id IN ({marks}) "
+                       f"ORDER BY student_id FOR UPDATE", students)
+        known_students = {row[0] for row in cursor.fetchall()}
+        subjects = sorted({r["subject_id"] for _, r in parsed})
+        cursor.execute(f"SELECT subject_id FROM Subject WHERE subject_id IN ({', '.join(['%s'] * len(subjects))})",
+                       subjects)
+        known_subjects = {row[0] for row in cursor.fetchall()}
+        cursor.execute(f"""
+        SELECT sp.student_id, ms.session_id, ms.date_time, ms.duration
+        FROM SessionParticipant sp
+        JOIN MentorshipSession ms ON ms.session_id = sp.session_id
+        WHERE sp.student_id IN ({marks})
+          AND ms.status <> 'cancelled'
+          AND ms.date_time >= %s AND ms.date_time < %s
+        """, students + [window_start - max_length, window_end])
+        for student_id, session_id, start, duration in cursor.fetchall():
+            end = start + datetime.timedelta(minutes=min(duration or 0, MAX_SESSION_MINUTES))
+            busy.add(student_id, start, end, f"session {session_id}")
+
+        accepted = []
+        for position, request in parsed:
+            start = request["date_time"]
+            end = start + datetime.timedelta(minutes=request["duration"])
+            participants = [request["mentor_id"]] + request["mentee_ids"]
+            unknown = [sid for sid in participants if sid not in known_students]
+            if unknown:
+                conflicts.append({"index": position, "reason": f"Unknown student ID: {', '.join(map(str, unknown))}.",
+                                  "clashes": []})
+                continue
+            if request["subject_id"] not in known_subjects:
+                conflicts.append({"index": position, "reason": f"Unknown subject ID: {request['subject_id']}.",
+                                  "clashes": []})
+                continue
+            clashes = busy.conflicts(participants, start, end)
+            if clashes:
+                conflicts.append({"index": position, "reason": "Participant already booked at that time.",
+                                  "clashes": clashes})
+                continue
+            for student_id in participants:
+                busy.add(student_id, start, end, f"request {position}")
+            accepted.append((position, request))
+
+        scheduled, rows = [], []
+        for position, request in accepted:
+            cursor.execute(
+                "INSERT INTO MentorshipSession (subject_id, date_time, duration) VALUES (%s, %s, %s)",
+                (request["subject_id"], request["date_time"], request["duration"])
+            )
+            session_id = cursor.lastrowid
+            scheduled.append((position, session_id))
+            rows.append((session_id, request["mentor_id"], 'mentor'))
+            rows += [(session_id, mentee_id, 'mentee') for mentee_id in request["mentee_ids"]]
+        if rows:
+            cursor.executemany(
+                "INSERT INTO SessionParticipant (session_id, student_id, role) VALUES (%s, %s, %s)", rows
+            )
+        conn.commit()
+        conflicts.sort(key=lambda c: c["index"])
+        return {"scheduled": scheduled, "conflicts": conflicts}
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error scheduling sessions") from e
+    finally:
+        conn.close()
+
+def update_session_status(session_id, status, version=None):
+    """
+    Updates the status of a session (and its mentor's MentorStats row). With
+    the `version` the session was read at, the update only applies if the
+    session is unchanged since (otherwise ConcurrentUpdateError). Returns the
+    new version (True if no version was given).
+    """
+    conn = get_db_connection()
+    query = "UPDATE MentorshipSession SET status = %s, version = version + 1 WHERE session_id = %s"
+    try:
+        cursor = conn.cursor()
+        if version is None:
+            cursor.execute(query, (status, session_id))
+        else:
+            cursor.execute(query + " AND version = %s", (status, session_id, int(version)))
+            if cursor.rowcount == 0:
+                conn.rollback()
+                _raise_conflict(cursor, "MentorshipSession", "session_id", session_id, "session")
+        _refresh_mentor_stats(cursor, _mentors_of_sessions(cursor, [session_id]))
+        conn.commit()
+        return True if version is None else int(version) + 1
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error updating status") from e
+    finally:
+        conn.close()
+
+def _raise_conflict(cursor, table, key_column, key, noun):
+    """Raises ConcurrentUpdateError for a compare-and-set update that matched no row."""
+    cursor.execute(f"SELECT version FROM {table} WHERE {key_column} = %s", (key,))
+    row = cursor.fetchone()
+    if row is None:
+        raise ConcurrentUpdateError(f"This {noun} has been deleted by someone else.")
+    raise ConcurrentUpdateError(f"This {noun} was changed by someone else since you opened it. "
+                                f"Please reload it and try again.", row[0])
+
+def cancel_session(session_id):
+    """Deletes a session. Participants/Feedback are deleted by ON DELETE CASCADE."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        mentor_ids = _mentors_of_sessions(cursor, [session_id])  # before the cascade removes them
+        cursor.execute("DELETE FROM MentorshipSession WHERE session_id = %s", (session_id,))
+        _refresh_mentor_stats(cursor, mentor_ids)
+        conn.commit()
+        return True
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error cancelling session") from e
+    finally:
+        conn.close()
+
+# --- Feedback ---
+
+FEEDBACK_COLUMNS = ("session_id", "rating", "comment", "anonymous")
+
+# Longest comment kept (Feedback.comment is TEXT, 64 KB)
+MAX_COMMENT_LENGTH = 10_000
+
+# Per-row failures a feedback batch falls back on: unknown session (1452), rating CHECK (3819)
+_FEEDBACK_ROW_ERRNOS = (1452, 3819)
+
+def validate_feedback(data):
+    """
+    Python-side checks for one feedback dict (mirrors the table's constraints).
+    Returns an error message, or None if the data looks valid.
+    """
+    try:
+        if int(data.get("session_id")) <= 0:
+            return "Please select a session."
+    except (TypeError, ValueError):
+        return "Please select a session."
+    try:
+        if int(data.get("rating")) not in (1, 2, 3, 4, 5):
+            return "Rating must be between 1 and 5."
+    except (TypeError, ValueError):
+        return "Rating must be a number between 1 and 5."
+    if len(str(data.get("comment") or "")) > MAX_COMMENT_LENGTH:
+        return f"Comments are limited to {MAX_COMMENT_LENGTH} characters."
+    return None
+
+def make_feedback(session_id, rating, comment="", anonymous=False):
+    """Validates one submission and returns it as a row dict for insert_feedback_batch."""
+    data = {"session_id": session_id, "rating": rating, "comment": comment, "anonymous": anonymous}
+    error = validate_feedback(data)
+    if error:
+        raise ValidationError(error)
+    return {"session_id": int(session_id), "rating": int(rating),
+            "comment": str(comment or "").strip() or None, "anonymous": bool(anonymous)}
+
+def submit_feedback(session_id, rating, comment="", anonymous=False):
+    """
+    Stores one piece of feedback right away. Returns True. For bursts (every
+    mentee rating every session) queue through feedback_buffer instead.
+    """
+    inserted, errors = insert_feedback_batch([make_feedback(session_id, rating, comment, anonymous)])
+    if errors:
+        raise ValidationError(errors[0][1])
+    return inserted == 1
+
+def insert_feedback_batch(rows):
+    """
+    Inserts feedback dicts (see make_feedback) in one transaction with a single
+    multi-row INSERT, and refreshes the MentorStats rows of the sessions'
+    mentors. If the batch is rejected because of a bad row (a session deleted
+    in the meantime, a rating out of range), falls back to row-by-row inserts
+    so the good rows still go in.
+
+    Returns (inserted_count, errors) where errors is a list of (index, message).
+    Raises DatabaseError for anything else, e.g. ConnectionFailedError.
+    """
+    if not rows:
+        return 0, []
+    query = f"""
+    INSERT INTO Feedback ({", ".join(FEEDBACK_COLUMNS)})
+    VALUES ({", ".join(f"%({c})s" for c in FEEDBACK_COLUMNS)})
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(query, rows)
+            _refresh_mentor_stats(cursor, _mentors_of_sessions(cursor, {row['session_id'] for row in rows}))
+            conn.commit()
+            return len(rows), []
+        except db_backend.DRIVER_ERRORS as e:
+            conn.rollback()
+            if _errno(e) not in _FEEDBACK_ROW_ERRNOS:
+                raise _translate_error(e, "Error saving feedback") from e
+
+        inserted, errors, sessions = 0, [], set()
+        for index, row in enumerate(rows):
+            try:
+                cursor.execute(query, row)
+                inserted += 1
+                sessions.add(row['session_id'])
+            except db_backend.DRIVER_ERRORS as e:
+                if _errno(e) not in _FEEDBACK_ROW_ERRNOS:
+                    conn.rollback()
+                    raise _translate_error(e, "Error saving feedback") from e
+                message = "The session no longer exists." if _errno(e) == 1452 else str(_translate_error(e))
+                errors.append((index, message))
+        _refresh_mentor_stats(cursor, _mentors_of_sessions(cursor, sessions))
+        conn.commit()
+        return inserted, errors
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error saving feedback") from e
+    finally:
+        conn.close()
+
+def fetch_feedback_page(after_id=0, limit=PAGE_SIZE):
+    """
+    Fetches the next `limit` feedback rows with feedback_id greater than
+    after_id, in feedback_id order, as tuples (feedback_id, rating, session
+    date_time, mentor_id, mentor name, subject_id, subject_name, mentor dept)
+    -- the columns feedback_analytics folds in.
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+        SELECT f.feedback_id, f.rating, ms.date_time, sp.student_id, st.name,
+               ms.subject_id, s.subject_name, st.dept
+        FROM Feedback f
+        JOIN MentorshipSession ms ON ms.session_id = f.session_id
+        LEFT JOIN Subject s ON s.subject_id = ms.subject_id
+        LEFT JOIN SessionParticipant sp ON sp.session_id = f.session_id AND sp.role = 'mentor'
+        LEFT JOIN Student st ON st.student_id = sp.student_id
+        WHERE f.feedback_id > %s
+        ORDER BY f.feedback_id
+        LIMIT %s
+        """, (after_id or 0, limit))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching feedback") from e
+    finally:
+        conn.close()
+
+# --- Mentor Statistics (MentorStats, see migrations/002_mentor_stats.sql) ---
+
+# Per-mentor totals over completed sessions. Feedback is summed per session
+# first so a session's duration is not repeated once per rating.
+_MENTOR_STATS_INSERT = """
+INSERT INTO MentorStats (mentor_id, completed_sessions, total_minutes, rating_sum, rating_count, avg_rating)
+SELECT per.student_id,
+       COUNT(*),
+       COALESCE(SUM(per.duration), 0),
+       COALESCE(SUM(per.rating_sum), 0),
+       COALESCE(SUM(per.rating_count), 0),
+       ROUND(1.0 * SUM(per.rating_sum) / NULLIF(SUM(per.rating_count), 0), 2)
+FROM (
+    SELECT sp.student_id, ms.session_id, ms.duration,
+           SUM(f.rating) AS rating_sum, COUNT(f.rating) AS rating_count
+    FROM SessionParticipant sp
+    JOIN MentorshipSession ms ON ms.session_id = sp.session_id AND ms.status = 'completed'
+    LEFT JOIN Feedback f ON f.session_id = ms.session_id
+    WHERE sp.role = 'mentor' {mentor_filter}
+    GROUP BY sp.student_id, ms.session_id, ms.duration
+) per
+GROUP BY per.student_id
+"""
+
+def _mentors_of_sessions(cursor, session_ids):
+    """Student IDs of the mentors of the given sessions."""
+    if not session_ids:
+        return []
+    marks = ", ".join(["%s"] * len(session_ids))
+    cursor.execute(
+        f"SELECT DISTINCT student_id FROM SessionParticipant WHERE role = 'mentor' AND session_id IN ({marks})",
+        list(session_ids)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+def _refresh_mentor_stats(cursor, mentor_ids):
+    """
+    Recomputes the MentorStats rows of these mentors inside the caller's
+    transaction. Costs one indexed read of each mentor's sessions, and is
+    correct however the status changed (including complete_past_sessions,
+    the sweep that replaced the auto-complete trigger).
+    """
+    if not mentor_ids:
+        return
+    marks = ", ".join(["%s"] * len(mentor_ids))
+    cursor.execute(f"DELETE FROM MentorStats WHERE mentor_id IN ({marks})", list(mentor_ids))
+    cursor.execute(_MENTOR_STATS_INSERT.format(mentor_filter=f"AND sp.student_id IN ({marks})"),
+                   list(mentor_ids))
+
+def rebuild_mentor_stats():
+    """Recomputes MentorStats for every mentor. Returns the number of mentors with stats."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM MentorStats")
+        cursor.execute(_MENTOR_STATS_INSERT.format(mentor_filter=""))
+        conn.commit()
+        return cursor.rowcount
+    except db_backend.DRIVER_ERRORS as e:
+        conn.rollback()
+        raise _translate_error(e, "Error rebuilding mentor statistics") from e
+    finally:
+        conn.close()
+
+def fetch_mentor_leaderboard(limit=None):
+    """
+    Mentors ranked by completed sessions, then average rating: one read of
+    MentorStats in index order. Mentors with no completed session are not listed.
+    """
+    conn = get_db_connection()
+    query = """
+    SELECT m.mentor_id, s.name, s.dept, m.completed_sessions, m.total_minutes,
+           m.avg_rating, m.rating_count
+    FROM MentorStats m
+    JOIN Student s ON s.student_id = m.mentor_id
+    ORDER BY m.completed_sessions DESC, m.avg_rating DESC, m.mentor_id DESC
+    {limit}
+    """
+    try:
+        cursor = conn.cursor(dictionary=True)
+        if limit is None:
+            cursor.execute(query.format(limit=""))
+        else:
+            cursor.execute(query.format(limit="LIMIT %s"), (limit,))
+        return cursor.fetchall()
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, "Error fetching mentor leaderboard") from e
+    finally:
+        conn.close()
+
+# --- Export (used by export.py) ---
+
+# Tables that can be streamed out: columns, and the primary key they are read in.
+EXPORT_TABLES = {
+    "MentorshipSession": (("session_id", "subject_id", "date_time", "duration", "status"), "session_id"),
+    "SessionParticipant": (("session_id", "student_id", "role"), "session_id, student_id"),
+    "TeamMember": (("team_id", "student_id", "role"), "team_id, student_id"),
+    "Feedback": (("feedback_id", "session_id", "rating", "comment", "anonymous"), "feedback_id"),
+}
+
+def stream_table(table, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields all rows of an EXPORT_TABLES table as lists of up to chunk_size
+    tuples, in primary-key order. The rows come from an unbuffered cursor and
+    are read off the connection only as the chunks are consumed, so memory
+    holds one chunk however large the table is. The connection stays checked
+    out until the generator is exhausted or closed.
+
+    Closed early, the generator discards its connection (rows are still
+    unread on it); inside a UnitOfWork it reads the rest off the shared
+    connection instead, so the block's later calls can still use it.
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unknown export table: {table}")
+    columns, key = EXPORT_TABLES[table]
+    borrowed = getattr(_unit_of_work, "conn", None) is not None
+    conn = get_db_connection()
+    cursor = None
+    finished = False
+    try:
+        cursor = conn.cursor(buffered=False)
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY {key}")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                finished = True
+                return
+            yield rows
+    except db_backend.DRIVER_ERRORS as e:
+        raise _translate_error(e, f"Error exporting {table}") from e
+    finally:
+        if finished:
+            conn.close()
+        elif borrowed:
+            try:
+                while cursor is not None and cursor.fetchmany(chunk_size):
+                    pass
+            except db_backend.DRIVER_ERRORS:
+                pass  # reported by the block's next statement
+            conn.close()
+        else:
+            conn.discard()  # rows still unread on the wire; don't hand the connection to anyone else
@@ -0,0 +1,194 @@
+import threading
+import time
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection became free within the checkout timeout."""
+
+
+class PooledConnection:
+    """A checked-out connection. close() hands it back to the pool instead of closing it."""
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    def __getattr__(self, name):
+        # Everything else (cursor, commit, rollback, ...) goes to the real connection.
+        return getattr(self._raw, name)
+
+    def close(self):
+        """Returns the connection to the pool. Safe to call more than once."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._raw)
+
+    def discard(self):
+        """Closes the underlying connection for good (e.g. after a broken pipe)."""
+        if not self._released:
+            self._released = True
+            self._pool._discard(self._raw)
+
+
+class ConnectionPool:
+    """
+    A small fixed-size pool of database connections.
+
+    - At most `size` connections exist at once; callers wait (up to
+      `checkout_timeout` seconds) when all of them are in use.
+    - Idle connections older than `max_idle` seconds are closed.
+    - A connection that has been idle for more than `ping_after` seconds is
+      health-checked before it is handed out, and replaced if it is dead.
+    """
+
+    def __init__(self, connect, size=5, max_idle=300, ping_after=5,
+                 checkout_timeout=10, is_alive=None):
+        self._connect = connect
+        self._is_alive = is_alive or (lambda raw: raw.is_connected())
+        self.size = size
+        self.max_idle = max_idle
+        self.ping_after = ping_after
+        self.checkout_timeout = checkout_timeout
+
+        self._lock = threading.Condition()
+        self._idle = []          # list of (raw_connection, released_at), newest last
+        self._open = 0           # connections currently open (idle + in use)
+        self._closed = False
+
+        self.stats = {
+            "checkouts": 0,      # connections handed out
+            "waits": 0,          # checkouts that had to wait for a free connection
+            "handshakes": 0,     # brand-new connections opened
+            "reconnects": 0,     # dead connections replaced on checkout
+            "evictions": 0,      # idle connections closed for being too old
+            "failed_connects": 0,
+        }
+
+    # --- Checkout / Release ---
+
+    def get(self):
+        """Returns a healthy PooledConnection, opening a new one if needed."""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool has been closed.")
+                self._evict_idle_locked()
+                if self._idle:
+                    raw, released_at = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    raw, released_at = None, None
+                    self._open += 1  # reserve the slot before connecting outside the lock
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No database connection free after {self.checkout_timeout}s "
+                        f"(pool size {self.size})."
+                    )
+                if not waited:
+                    waited = True
+                    self.stats["waits"] += 1
+                self._lock.wait(remaining)
+
+        try:
+            if raw is None:
+                raw = self._open_new()
+            elif time.monotonic() - released_at > self.ping_after and not self._check(raw):
+                self._close_quietly(raw)
+                raw = self._open_new()
+                self._bump("reconnects")
+        except Exception:
+            with self._lock:
+                self._open -= 1
+                self._lock.notify()
+            raise
+
+        self._bump("checkouts")
+        return PooledConnection(self, raw)
+
+    def _release(self, raw):
+        # Never hand a half-finished transaction to the next caller.
+        try:
+            if getattr(raw, "in_transaction", False):
+                raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+
+        with self._lock:
+            if self._closed:
+                self._open -= 1
+                self._close_quietly(raw)
+            else:
+                self._idle.append((raw, time.monotonic()))
+            self._lock.notify()
+
+    def _discard(self, raw):
+        self._close_quietly(raw)
+        with self._lock:
+            self._open -= 1
+            self._lock.notify()
+
+    # --- Helpers ---
+
+    def _open_new(self):
+        try:
+            raw = self._connect()
+        except Exception:
+            self._bump("failed_connects")
+            raise
+        self._bump("handshakes")
+        return raw
+
+    def _check(self, raw):
+        try:
+            return self._is_alive(raw)
+        except Exception:
+            return False
+
+    def _evict_idle_locked(self):
+        if not self.max_idle:
+            return
+        cutoff = time.monotonic() - self.max_idle
+        # _idle is ordered oldest-first, so stale entries are at the front.
+        while self._idle and self._idle[0][1] < cutoff:
+            raw, _ = self._idle.pop(0)
+            self._open -= 1
+            self.stats["evictions"] += 1
+            self._close_quietly(raw)
+
+    def _bump(self, counter):
+        with self._lock:
+            self.stats[counter] += 1
+
+    @staticmethod
+    def _close_quietly(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    # --- Introspection / Shutdown ---
+
+    def snapshot(self):
+        """Returns a copy of the counters plus current in-use/idle numbers."""
+        with self._lock:
+            data = dict(self.stats)
+            data["idle"] = len(self._idle)
+            data["in_use"] = self._open - len(self._idle)
+            data["size"] = self.size
+        return data
+
+    def close_all(self):
+        """Closes every idle connection; in-use ones are closed when they come back."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                raw, _ = self._idle.pop()
+                self._open -= 1
+                self._close_quietly(raw)
+            self._lock.notify_all()
@@ -0,0 +1,311 @@
+"""
+Query-level tracing for db_manager.
+
+get_db_connection() wraps every connection it hands out in a TracedConnection,
+so all data functions are traced without changes of their own. For each call
+the tracer records:
+
+- connect: time spent checking a connection out of the pool (incl. handshakes)
+- execute: time in cursor.execute / executemany / callproc
+- fetch:   time in fetchone / fetchmany / fetchall, plus the rows returned
+- operation: checkout-to-close time of the db_manager function that used it
+
+Statements are grouped by fingerprint (literals and placeholders replaced by
+?), each with a rolling latency histogram. Statements slower than the
+threshold are appended to a slow-query log file.
+"""
+import bisect
+import collections
+import datetime
+import functools
+import re
+import threading
+import time
+
+# Histogram bucket upper bounds, in milliseconds (the last bucket is "more").
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+# --- Fingerprints ---
+
+_COMMENTS = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+_STRINGS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|\?|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint(sql):
+    """Normalizes a statement so calls that differ only in values group together."""
+    if isinstance(sql, bytes):
+        sql = sql.decode("utf-8", "replace")
+    text = _COMMENTS.sub(" ", sql)
+    text = _STRINGS.sub("?", text)
+    text = _PLACEHOLDERS.sub("?", text)
+    text = _IN_LISTS.sub("(?+)", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+# --- Histograms ---
+
+class Histogram:
+    """Bucketed counts over all samples plus a rolling window for percentiles."""
+
+    def __init__(self, window=500):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.recent = collections.deque(maxlen=window)
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.recent.append(ms)
+
+    def percentile(self, pct):
+        """pct-th percentile (ms) of the most recent samples, or None if empty."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 2) if self.count else None,
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "p99_ms": _round(self.percentile(99)),
+            "max_ms": round(self.max, 2),
+            "buckets": {label: n for label, n in zip(_bucket_labels(), self.buckets) if n},
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+def _bucket_labels():
+    return [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+
+
+# --- Tracer ---
+
+class Tracer:
+    """
+    Collects timings from TracedConnection/TracedCursor. Thread-safe; the
+    same tracer is shared by the UI thread and the background worker.
+    """
+
+    def __init__(self, slow_ms=200, slow_log=None, window=500):
+        self.enabled = True
+        self.slow_ms = slow_ms
+        self.slow_log = slow_log     # path of the slow-query log, or None to disable
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.totals = {kind: Histogram(self.window) for kind in ("connect", "execute", "fetch")}
+            self.statements = {}   # fingerprint -> {"execute": Histogram, "fetch_ms": ..., "rows": ...}
+            self.operations = {}   # db_manager function name -> Histogram
+            self.rows = 0
+            self.slow_queries = 0
+            self.errors = 0
+
+    def wrap(self, conn, connect_seconds, operation):
+        """Returns conn wrapped for tracing (or conn itself when tracing is off)."""
+        if not self.enabled:
+            return conn
+        with self._lock:
+            self.totals["connect"].add(connect_seconds)
+        return TracedConnection(conn, self, operation)
+
+    # --- Recording (called by the wrappers) ---
+
+    def _statement(self, fp):
+        stats = self.statements.get(fp)
+        if stats is None:
+            stats = self.statements[fp] = {"execute": Histogram(self.window), "fetch_ms": 0.0, "rows": 0}
+        return stats
+
+    def record_execute(self, fp, seconds, failed=False):
+        with self._lock:
+            self.totals["execute"].add(seconds)
+            self._statement(fp)["execute"].add(seconds)
+            if failed:
+                self.errors += 1
+
+    def record_fetch(self, fp, seconds, rows):
+        with self._lock:
+            self.totals["fetch"].add(seconds)
+            stats = self._statement(fp)
+            stats["fetch_ms"] += seconds * 1000
+            stats["rows"] += rows
+            self.rows += rows
+
+    def record_operation(self, operation, seconds):
+        with self._lock:
+            hist = self.operations.get(operation)
+            if hist is None:
+                hist = self.operations[operation] = Histogram(self.window)
+            hist.add(seconds)
+
+    def record_slow(self, operation, fp, seconds, rows):
+        with self._lock:
+            self.slow_queries += 1
+            if not self.slow_log:
+                return
+            line = (f"{datetime.datetime.now().isoformat(timespec='seconds')}\t"
+                    f"{seconds * 1000:.1f} ms\trows={rows}\top={operation}\t{fp}\n")
+            try:
+                with open(self.slow_log, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                pass  # diagnostics must never break a data call
+
+    # --- Reading ---
+
+    def summary(self):
+        """Small dict for the status bar."""
+        with self._lock:
+            execute = self.totals["execute"]
+            return {
+                "queries": execute.count,
+                "p95_ms": _round(execute.percentile(95)),
+                "connect_p95_ms": _round(self.totals["connect"].percentile(95)),
+                "slow": self.slow_queries,
+                "errors": self.errors,
+            }
+
+    def snapshot(self):
+        """Full copy of the collected stats (for the diagnostics window / benchmarks)."""
+        with self._lock:
+            statements = []
+            for fp, stats in self.statements.items():
+                entry = stats["execute"].snapshot()
+                entry.update(statement=fp, fetch_ms=round(stats["fetch_ms"], 2), rows=stats["rows"])
+                statements.append(entry)
+            statements.sort(key=lambda s: (s["avg_ms"] or 0) * s["count"], reverse=True)
+            return {
+                "totals": {kind: hist.snapshot() for kind, hist in self.totals.items()},
+                "operations": {name: hist.snapshot() for name, hist in self.operations.items()},
+                "statements": statements,
+                "rows": self.rows,
+                "slow_queries": self.slow_queries,
+                "errors": self.errors,
+                "slow_ms": self.slow_ms,
+                "slow_log": self.slow_log,
+            }
+
+
+# --- Wrappers ---
+
+class TracedConnection:
+    """Proxy for a (pooled) connection whose cursors are traced."""
+
+    def __init__(self, conn, tracer, operation):
+        self._conn = conn
+        self._tracer = tracer
+        self._operation = operation
+        self._opened = time.perf_counter()
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return TracedCursor(self._conn.cursor(*args, **kwargs), self._tracer, self._operation)
+
+    def close(self):
+        self._record()
+        self._conn.close()
+
+    def discard(self):
+        self._record()
+        self._conn.discard()
+
+    def _record(self):
+        if not self._closed:
+            self._closed = True
+            self._tracer.record_operation(self._operation, time.perf_counter() - self._opened)
+
+
+class TracedCursor:
+    """Proxy for a cursor that times execute/fetch calls and counts rows."""
+
+    def __init__(self, cursor, tracer, operation):
+        self._cursor = cursor
+        self._tracer = tracer
+        self._operation = operation
+        self._fp = None
+        self._elapsed = 0.0     # execute + fetch time of the current statement
+        self._rows = 0
+        self._logged = False
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _run(self, method, operation, *args, **kwargs):
+        self._fp = fingerprint(operation)
+        self._rows = 0
+        self._logged = False
+        started = time.perf_counter()
+        try:
+            result = method(operation, *args, **kwargs)
+        except Exception:
+            self._tracer.record_execute(self._fp, time.perf_counter() - started, failed=True)
+            raise
+        self._elapsed = time.perf_counter() - started
+        self._tracer.record_execute(self._fp, self._elapsed)
+        self._check_slow()
+        return result
+
+    def execute(self, operation, *args, **kwargs):
+        return self._run(self._cursor.execute, operation, *args, **kwargs)
+
+    def executemany(self, operation, *args, **kwargs):
+        return self._run(self._cursor.executemany, operation, *args, **kwargs)
+
+    def callproc(self, procname, *args, **kwargs):
+        return self._run(self._cursor.callproc, procname, *args, **kwargs)
+
+    def _fetch(self, method, *args):
+        started = time.perf_counter()
+        result = method(*args)
+        seconds = time.perf_counter() - started
+        if result is None:
+            rows = 0
+        elif isinstance(result, list):
+            rows = len(result)
+        else:
+            rows = 1
+        self._elapsed += seconds
+        self._rows += rows
+        self._tracer.record_fetch(self._fp or "?", seconds, rows)
+        self._check_slow()
+        return result
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._fetch(self._cursor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+    def _check_slow(self):
+        if self._logged or self._elapsed * 1000 < self._tracer.slow_ms:
+            return
+        self._logged = True
+        self._tracer.record_slow(self._operation, self._fp, self._elapsed, self._rows)
@@ -0,0 +1,119 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DbWorker:
+    """
+    Runs database calls off the Tk main loop.
+
+    Work is submitted to a thread pool; finished results are put on a queue
+    that the Tk thread drains every `poll_ms` milliseconds with after(), so
+    callbacks always run on the UI thread.
+
+    Calls submitted with a `key` supersede earlier calls with the same key:
+    when an older call finishes after a newer one was submitted its result is
+    dropped (e.g. clicking quickly through teams only shows the last team),
+    and if it has not started yet it is skipped altogether.
+    """
+
+    def __init__(self, root, max_workers=4, poll_ms=30, on_busy_change=None):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.on_busy_change = on_busy_change
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generations = {}   # key -> latest generation number submitted
+        self._in_flight = {}     # job id -> label, for the status bar
+        self._next_job = 0
+        self._closed = False
+        self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def submit(self, fn, *args, on_success=None, on_error=None, key=None, label=None, **kwargs):
+        """
+        Runs fn(*args, **kwargs) in the background.
+
+        on_success(result) / on_error(exception) are called on the Tk thread.
+        Returns the underlying Future.
+        """
+        with self._lock:
+            self._next_job += 1
+            job = self._next_job
+            generation = None
+            if key is not None:
+                generation = self._generations.get(key, 0) + 1
+                self._generations[key] = generation
+            self._in_flight[job] = label or getattr(fn, "__name__", "query")
+        self._notify_busy()
+
+        def run():
+            if key is not None and not self.is_current(key, generation):
+                outcome = (True, None)  # superseded while queued; _poll drops it
+            else:
+                try:
+                    outcome = (True, fn(*args, **kwargs))
+                except Exception as e:
+                    outcome = (False, e)
+            self._results.put((job, key, generation, outcome, on_success, on_error))
+
+        return self._executor.submit(run)
+
+    def is_current(self, key, generation):
+        """True if no newer call with the same key has been submitted."""
+        with self._lock:
+            return self._generations.get(key) == generation
+
+    def cancel(self, key):
+        """Marks any in-flight call with this key as stale."""
+        with self._lock:
+            if key in self._generations:
+                self._generations[key] += 1
+
+    @property
+    def busy(self):
+        with self._lock:
+            return list(self._in_flight.values())
+
+    def _poll(self):
+        while True:
+            try:
+                job, key, generation, (ok, value), on_success, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                self._in_flight.pop(job, None)
+            self._notify_busy()
+
+            if key is not None and not self.is_current(key, generation):
+                continue  # superseded by a newer request
+
+            callback = on_success if ok else on_error
+            try:
+                if callback is not None:
+                    callback(value)
+                elif not ok:
+                    raise value
+            except Exception as e:
+                # Report like any other Tk callback error, but keep polling.
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+
+        if not self._closed:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _notify_busy(self):
+        if self.on_busy_change is not None:
+            labels = self.busy
+            # Status updates must happen on the Tk thread.
+            if threading.current_thread() is threading.main_thread():
+                self.on_busy_change(labels)
+
+    def shutdown(self):
+        """Stops polling and waits for running calls to finish."""
+        self._closed = True
+        try:
+            self.root.after_cancel(self._poll_id)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,165 @@
+"""
+EXPLAIN-based check that db_manager's hot queries use indexes.
+
+Each read function below is called once with sample arguments; the SQL it
+actually sends is captured and run through EXPLAIN. A query fails the check
+if any table is read with a full scan (type ALL) or needs a filesort.
+
+Run it against a database with realistic row counts (e.g. one seeded by the
+benchmark harness) -- on a table of a dozen rows MySQL may rightly prefer a
+full scan even when a usable index exists.
+
+Usage:
+    python explain_check.py           # exit code 1 if any query fails
+"""
+import sys
+
+import db_manager
+
+# (label, function, args). Functions that return whole tables (fetch_students,
+# fetch_teams, fetch_sessions) are full reads by design and are not listed.
+CHECKS = [
+    ("fetch_students_page (first)", db_manager.fetch_students_page, (0, 200)),
+    ("fetch_students_page (next)", db_manager.fetch_students_page, (1000, 200)),
+    ("search_students (word prefix)", db_manager.search_students, ("mai",)),
+    ("search_students (short prefix)", db_manager.search_students, ("ma",)),
+    ("search_students (email)", db_manager.search_students, ("maitreyi@",)),
+    ("search_students (dept + year)", db_manager.search_students, ("", "CSE", 3)),
+    ("fetch_students_by_role mentor", db_manager.fetch_students_by_role, ("mentor",)),
+    ("fetch_students_by_role mentee", db_manager.fetch_students_by_role, ("mentee",)),
+    ("fetch_all_subjects", db_manager.fetch_all_subjects, ()),
+    ("fetch_feedback_page", db_manager.fetch_feedback_page, (0, 5000)),
+    ("fetch_teams_page (first)", db_manager.fetch_teams_page, (None, 200)),
+    ("fetch_teams_page (next)", db_manager.fetch_teams_page, ("M", 200)),
+    ("fetch_team_members", db_manager.fetch_team_members, (1,)),
+    ("fetch_members_for_teams", db_manager.fetch_members_for_teams, ([1, 2, 3],)),
+    ("fetch_sessions_page (first)", db_manager.fetch_sessions_page, (None, 200)),
+    ("fetch_sessions_page (next)", db_manager.fetch_sessions_page, (("2025-09-12 14:00:00", 9), 200)),
+    ("fetch_session_participants", db_manager.fetch_session_participants, (1,)),
+    ("fetch_session_overview_page", db_manager.fetch_session_overview_page, (None, 200)),
+    ("fetch_participants_for_sessions", db_manager.fetch_participants_for_sessions, ([1, 2, 3],)),
+    ("fetch_mentor_leaderboard", db_manager.fetch_mentor_leaderboard, (50,)),
+]
+
+# Queries that live in setup.sql or in write functions (which can't be run just to capture them).
+EXTRA_QUERIES = [
+    ("complete_past_sessions batch", """
+    SELECT session_id FROM MentorshipSession
+    WHERE status = 'scheduled' AND date_time < NOW()
+    ORDER BY date_time
+    LIMIT 5000
+    """),
+    ("MentorSessionCount body", """
+    SELECT completed_sessions
+    FROM MentorStats
+    WHERE mentor_id = 1
+    """),
+]
+
+
+class _RecordingCursor:
+    def __init__(self, cursor, sink):
+        self._cursor = cursor
+        self._sink = sink
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        result = self._cursor.execute(operation, params, *args, **kwargs)
+        statement = self._cursor.statement
+        if isinstance(statement, bytes):
+            statement = statement.decode("utf-8")
+        self._sink.append(statement)
+        return result
+
+
+class _RecordingConnection:
+    def __init__(self, conn, sink):
+        self._conn = conn
+        self._sink = sink
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return _RecordingCursor(self._conn.cursor(*args, **kwargs), self._sink)
+
+    def close(self):
+        self._conn.close()
+
+
+def capture_statements(fn, *args):
+    """Calls a db_manager read function and returns the SQL statements it executed."""
+    captured = []
+    original = db_manager.get_db_connection
+    db_manager.get_db_connection = lambda: _RecordingConnection(original(), captured)
+    try:
+        fn(*args)
+    finally:
+        db_manager.get_db_connection = original
+    return captured
+
+
+def explain(statement):
+    """Returns EXPLAIN rows (dicts) for one statement."""
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("EXPLAIN " + statement)
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def problems_in(plan):
+    """Returns human-readable problems found in an EXPLAIN plan."""
+    problems = []
+    for row in plan:
+        table = row.get("table") or "?"
+        if table.startswith("<"):
+            continue  # derived / union result, judged by its own rows
+        extra = row.get("Extra") or ""
+        if row.get("type") == "ALL":
+            problems.append(f"full table scan on {table}")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {table}")
+    return problems
+
+
+def run_checks(log=print):
+    """Runs every check. Returns a list of (label, statement, problems) for failures."""
+    failures = []
+    targets = [(label, capture_statements(fn, *args)) for label, fn, args in CHECKS]
+    targets += [(label, [sql]) for label, sql in EXTRA_QUERIES]
+    for label, statements in targets:
+        for statement in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            problems = problems_in(explain(statement))
+            log(f"{'FAIL' if problems else 'ok  '}  {label}" + (f": {', '.join(problems)}" if problems else ""))
+            if problems:
+                failures.append((label, statement, problems))
+    return failures
+
+
+def main():
+    if db_manager.backend.name != "mysql":
+        print(f"explain_check reads MySQL's EXPLAIN output; the configured backend is {db_manager.backend.label}.",
+              file=sys.stderr)
+        return 2
+    try:
+        failures = run_checks()
+    except db_manager.DatabaseError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if failures:
+        print(f"\n{len(failures)} quer{'y' if len(failures) == 1 else 'ies'} not using an index "
+              "(did you run `python migrate.py`?)")
+        return 1
+    print("\nAll checked queries use indexes.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Streaming export of sessions, participants, team members and feedback.
+
+Usage:
+    python export.py [--out-dir exports] [--format csv columnar parquet]
+                     [--tables MentorshipSession Feedback] [--chunk-size 5000]
+
+Each table is read with db_manager.stream_table -- an unbuffered cursor
+consumed chunk_size rows at a time -- and every chunk is written to all
+requested formats before the next one is fetched, so memory use depends on
+the chunk size, not on the size of the table. Files are written under a
+.part name and renamed when complete.
+
+Formats:
+    csv       <Table>.csv, with a header row.
+    columnar  <Table>.columns.jsonl.gz: gzip-compressed JSON lines. The first
+              line lists the columns and their types; every further line is
+              one chunk ("row group") holding one list of values per column.
+              Needs only the standard library; read it with read_columnar().
+    parquet   <Table>.parquet, one row group per chunk. Needs pyarrow
+              (pip install pyarrow).
+"""
+import argparse
+import csv
+import datetime
+import gzip
+import json
+import os
+import sys
+import time
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # only needed for the parquet format
+    pyarrow = None
+
+import db_manager
+
+FORMATS = ("csv", "columnar", "parquet")
+DEFAULT_FORMATS = ("csv", "columnar")
+DEFAULT_OUT_DIR = "exports"
+
+# Column types of the exported tables (db_manager.EXPORT_TABLES)
+COLUMN_TYPES = {
+    "session_id": "int", "subject_id": "int", "date_time": "datetime", "duration": "int",
+    "status": "str", "student_id": "int", "role": "str", "team_id": "int",
+    "feedback_id": "int", "rating": "int", "comment": "str", "anonymous": "bool",
+}
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# --- Writers ---
+
+class CsvWriter:
+    extension = ".csv"
+
+    def __init__(self, path, columns):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class ColumnarWriter:
+    extension = ".columns.jsonl.gz"
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        header = {"columns": list(columns), "types": [COLUMN_TYPES[c] for c in columns]}
+        self._file.write(json.dumps(header) + "\n")
+
+    def write(self, rows):
+        group = {"rows": len(rows), "columns": dict(zip(self.columns, map(list, zip(*rows))))}
+        self._file.write(json.dumps(group, default=_json_value) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    extension = ".parquet"
+
+    def __init__(self, path, columns):
+        if pyarrow is None:
+            raise ImportError("The parquet format needs pyarrow (pip install pyarrow); "
+                              "the columnar format needs nothing extra.")
+        types = {"int": pyarrow.int64(), "str": pyarrow.string(),
+                 "datetime": pyarrow.timestamp("s"), "bool": pyarrow.bool_()}
+        self.columns = columns
+        self._schema = pyarrow.schema([(c, types[COLUMN_TYPES[c]]) for c in columns])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        arrays = []
+        for field, values in zip(self._schema, zip(*rows)):
+            if field.type == pyarrow.bool_():
+                values = [None if v is None else bool(v) for v in values]  # stored as 0/1
+            arrays.append(pyarrow.array(values, type=field.type))
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "columnar": ColumnarWriter, "parquet": ParquetWriter}
+
+
+def _json_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.strftime(DATETIME_FORMAT)
+    return str(value)  # e.g. Decimal, date
+
+
+# --- Export ---
+
+def export_table(table, out_dir=DEFAULT_OUT_DIR, formats=DEFAULT_FORMATS, chunk_size=db_manager.EXPORT_CHUNK_SIZE):
+    """
+    Streams one table into one file per format in out_dir. Returns a dict:
+    table, rows, seconds and paths (format -> file).
+    """
+    columns = db_manager.EXPORT_TABLES[table][0]
+    paths = {fmt: os.path.join(out_dir, table + WRITERS[fmt].extension) for fmt in formats}
+    started = time.perf_counter()
+    writers = []
+    done = False
+    try:
+        for fmt in formats:
+            writers.append(WRITERS[fmt](paths[fmt] + ".part", columns))
+        rows = 0
+        for chunk in db_manager.stream_table(table, chunk_size):
+            for writer in writers:
+                writer.write(chunk)
+            rows += len(chunk)
+        done = True
+    finally:
+        for writer in writers:
+            writer.close()
+        for fmt in formats:
+            part = paths[fmt] + ".part"
+            if done:
+                os.replace(part, paths[fmt])
+            elif os.path.exists(part):
+                os.remove(part)
+    return {"table": table, "rows": rows, "seconds": round(time.perf_counter() - started, 2), "paths": paths}
+
+
+def export_tables(out_dir=DEFAULT_OUT_DIR, tables=None, formats=DEFAULT_FORMATS,
+                  chunk_size=db_manager.EXPORT_CHUNK_SIZE):
+    """Exports `tables` (default: all of db_manager.EXPORT_TABLES). Returns one export_table() dict per table."""
+    unknown = [f for f in formats if f not in WRITERS]
+    if unknown:
+        raise ValueError(f"Unknown export format: {', '.join(unknown)} (use {', '.join(FORMATS)})")
+    os.makedirs(out_dir, exist_ok=True)
+    return [export_table(table, out_dir, formats, chunk_size) for table in (tables or db_manager.EXPORT_TABLES)]
+
+
+# --- Reading back ---
+
+def read_columnar(path):
+    """Yields the rows of a .columns.jsonl.gz file as dicts, one row group at a time."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        columns = header["columns"]
+        datetimes = {c for c, t in zip(columns, header["types"]) if t == "datetime"}
+        for line in f:
+            group = json.loads(line)["columns"]
+            for c in datetimes:
+                group[c] = [datetime.datetime.strptime(v, DATETIME_FORMAT) if v else None for v in group[c]]
+            for values in zip(*(group[c] for c in columns)):
+                yield dict(zip(columns, values))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export sessions, team members and feedback to files.")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR, help=f"directory for the files (default {DEFAULT_OUT_DIR})")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(DEFAULT_FORMATS),
+                        help=f"file formats (default {' '.join(DEFAULT_FORMATS)})")
+    parser.add_argument("--tables", nargs="+", choices=list(db_manager.EXPORT_TABLES),
+                        help="tables to export (default all)")
+    parser.add_argument("--chunk-size", type=int, default=db_manager.EXPORT_CHUNK_SIZE,
+                        help=f"rows fetched and written at a time (default {db_manager.EXPORT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+
+    try:
+        results = export_tables(args.out_dir, args.tables, args.format, args.chunk_size)
+    except (db_manager.DatabaseError, ImportError) as e:
+        print(f"Export aborted: {e}", file=sys.stderr)
+        return 2
+    for result in results:
+        print(f"{result['table']}: {result['rows']} rows in {result['seconds']}s -> "
+              + ", ".join(result['paths'].values()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
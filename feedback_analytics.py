@@ -0,0 +1,198 @@
+"""
+Feedback analytics: rating distributions, moving averages and trends per
+mentor, subject and department.
+
+Feedback is read in feedback_id order, one keyset page at a time
+(db_manager.fetch_feedback_page), and folded into running aggregates as it
+streams past, so memory does not grow with the number of ratings. refresh()
+only reads feedback added since the previous call, so keeping the numbers
+current costs one small indexed query instead of a recomputation.
+
+Per dimension the aggregates are flat arrays indexed by group number (as in
+matching.py): rating count and sum, a 1-5 star histogram and the running sum
+of the moving-average window. Trends bucket ratings by the day of the rated
+session and compare the last `trend_days` days with the `trend_days` before.
+A student's department is the mentor's department.
+
+Feedback deleted from the database (e.g. with a cancelled session) only
+drops out of the numbers on reload().
+
+Usage from code:
+    analytics = feedback_analytics.FeedbackAnalytics()
+    analytics.refresh()                  # again later: only new feedback is read
+    for group in analytics.summary("mentor"):
+        print(group['label'], group['average'], group['moving_average'], group['trend'])
+"""
+import array
+import collections
+import threading
+
+import db_manager
+
+DIMENSIONS = ("mentor", "subject", "dept")
+
+# Ratings in each group's moving average (the most recent ones by feedback_id)
+MOVING_WINDOW = 20
+
+# Trend: average of the last TREND_DAYS days against the TREND_DAYS before them
+TREND_DAYS = 28
+
+# Feedback rows per query
+PAGE_SIZE = 5000
+
+
+class _Groups:
+    """Running aggregates for one dimension. Index i describes the i-th group seen."""
+
+    def __init__(self, window):
+        self.window = window
+        self.number = {}                    # group key -> index
+        self.keys = []
+        self.labels = []
+        self.counts = array.array("i")
+        self.sums = array.array("i")
+        self.stars = array.array("i")       # 5 per group: number of 1..5 star ratings
+        self.recent = []                    # per group: deque of the last `window` ratings
+        self.recent_sums = array.array("i")
+        self.days = []                      # per group: {day ordinal: [rating sum, count]}
+
+    def add(self, key, label, rating, day):
+        i = self.number.get(key)
+        if i is None:
+            i = self.number[key] = len(self.keys)
+            self.keys.append(key)
+            self.labels.append(label)
+            self.counts.append(0)
+            self.sums.append(0)
+            self.stars.extend((0, 0, 0, 0, 0))
+            self.recent.append(collections.deque(maxlen=self.window))
+            self.recent_sums.append(0)
+            self.days.append({})
+        else:
+            self.labels[i] = label  # names can change; show the latest
+
+        self.counts[i] += 1
+        self.sums[i] += rating
+        self.stars[i * 5 + rating - 1] += 1
+        recent = self.recent[i]
+        if len(recent) == self.window:
+            self.recent_sums[i] -= recent[0]  # about to fall out of the window
+        recent.append(rating)
+        self.recent_sums[i] += rating
+        if day is not None:
+            bucket = self.days[i].setdefault(day, [0, 0])
+            bucket[0] += rating
+            bucket[1] += 1
+
+    def trend(self, i, end_day, days):
+        """(average of the last `days` days up to end_day, average of the `days` before), None if empty."""
+        current, previous = [0, 0], [0, 0]
+        for day, (total, count) in self.days[i].items():
+            age = end_day - day
+            if 0 <= age < days:
+                current[0] += total
+                current[1] += count
+            elif days <= age < 2 * days:
+                previous[0] += total
+                previous[1] += count
+        average = lambda pair: round(pair[0] / pair[1], 2) if pair[1] else None
+        return average(current), average(previous)
+
+
+class FeedbackAnalytics:
+    """Incrementally maintained feedback statistics. Safe to refresh on a worker thread while reading."""
+
+    def __init__(self, window=MOVING_WINDOW, trend_days=TREND_DAYS):
+        self.window = window
+        self.trend_days = trend_days
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.last_id = 0            # highest feedback_id folded in
+        self.stars = array.array("i", (0, 0, 0, 0, 0))
+        self.latest_day = None      # newest rated session day (default end of the trend windows)
+        self.groups = {dimension: _Groups(self.window) for dimension in DIMENSIONS}
+
+    # --- Feeding ---
+
+    def add(self, feedback_id, rating, date_time, mentor_id, mentor_name, subject_id, subject_name, dept):
+        """
+        Folds in one feedback row (the columns of db_manager.fetch_feedback_page).
+        Rows at or below last_id were counted already and are ignored.
+        """
+        with self._lock:
+            self._add(feedback_id, rating, date_time, mentor_id, mentor_name, subject_id, subject_name, dept)
+
+    def _add(self, feedback_id, rating, date_time, mentor_id, mentor_name, subject_id, subject_name, dept):
+        if feedback_id <= self.last_id:
+            return
+        self.last_id = feedback_id
+        if rating is None or not 1 <= rating <= 5:
+            return
+        day = date_time.toordinal() if date_time is not None else None
+        if day is not None and (self.latest_day is None or day > self.latest_day):
+            self.latest_day = day
+        self.stars[rating - 1] += 1
+        self.groups["mentor"].add(mentor_id, mentor_name or "(no mentor)", rating, day)
+        self.groups["subject"].add(subject_id, subject_name or "(no subject)", rating, day)
+        self.groups["dept"].add((dept or "").strip().lower(), dept or "(no department)", rating, day)
+
+    def refresh(self, page_size=PAGE_SIZE):
+        """Reads the feedback added since the last call and folds it in. Returns the rows read."""
+        read = 0
+        while True:
+            rows = db_manager.fetch_feedback_page(self.last_id, page_size)
+            with self._lock:
+                for row in rows:
+                    self._add(*row)
+            read += len(rows)
+            if len(rows) < page_size:
+                return read
+
+    def reload(self, page_size=PAGE_SIZE):
+        """Forgets everything and reads all feedback again. Returns the rows read."""
+        with self._lock:
+            self._reset()
+        return self.refresh(page_size)
+
+    # --- Reading ---
+
+    def overall(self):
+        """Totals over all feedback: ratings, average and the 1-5 star histogram."""
+        with self._lock:
+            stars = list(self.stars)
+        count = sum(stars)
+        total = sum(star * n for star, n in enumerate(stars, start=1))
+        return {"ratings": count, "average": round(total / count, 2) if count else None, "stars": stars}
+
+    def summary(self, dimension, as_of=None, min_ratings=1):
+        """
+        One dict per group of `dimension` ("mentor", "subject" or "dept"), most
+        rated first: key, label, ratings, average, moving_average (last
+        `window` ratings), stars (1-5 histogram) and the trend windows --
+        trend_recent / trend_previous averages and trend (their difference).
+        The windows end at `as_of` (a date), by default the newest rated session.
+        """
+        with self._lock:
+            groups = self.groups[dimension]
+            end_day = as_of.toordinal() if as_of is not None else self.latest_day
+            result = []
+            for i, key in enumerate(groups.keys):
+                count = groups.counts[i]
+                if count < min_ratings:
+                    continue
+                recent, previous = groups.trend(i, end_day, self.trend_days) if end_day else (None, None)
+                result.append({
+                    "key": key,
+                    "label": groups.labels[i],
+                    "ratings": count,
+                    "average": round(groups.sums[i] / count, 2),
+                    "moving_average": round(groups.recent_sums[i] / len(groups.recent[i]), 2),
+                    "stars": list(groups.stars[i * 5:i * 5 + 5]),
+                    "trend_recent": recent,
+                    "trend_previous": previous,
+                    "trend": round(recent - previous, 2) if recent is not None and previous is not None else None,
+                })
+        result.sort(key=lambda g: (-g['ratings'], str(g['label'])))
+        return result
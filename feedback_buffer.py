@@ -0,0 +1,215 @@
+"""
+Write-behind buffer for feedback submissions.
+
+submit() only validates and queues; a background thread writes the queue
+with db_manager.insert_feedback_batch -- one multi-row INSERT and one commit
+per FLUSH_ROWS rows -- as soon as FLUSH_ROWS submissions are waiting, and
+otherwise every FLUSH_INTERVAL seconds. An end-of-semester burst where every
+mentee rates every session therefore costs a handful of transactions instead
+of one connection and commit per rating.
+
+If the database cannot be reached (ConnectionFailedError), the batch is
+appended to a local spool file (one JSON object per line, flushed to disk)
+and written ahead of newer submissions on a later flush, so accepted
+feedback survives an outage and an application restart. Rows the database
+refuses (e.g. their session was cancelled meanwhile) are dropped and kept in
+`rejected` for display; a chunk failing for any other reason would fail
+again on every retry, so it goes to the dead-letter file instead of the
+spool and later feedback keeps flowing.
+
+Usage from code:
+    buffer = feedback_buffer.FeedbackBuffer()
+    buffer.start()
+    buffer.submit(session_id=3, rating=5, comment="Very clear")
+    ...
+    buffer.close()      # final flush (or spool) on shutdown
+"""
+import collections
+import datetime
+import json
+import os
+import threading
+
+import db_manager
+
+# Write as soon as this many submissions are waiting (also the rows per INSERT)
+FLUSH_ROWS = 500
+
+# ... and otherwise at least this often (seconds)
+FLUSH_INTERVAL = 2.0
+
+# Feedback that could not be written yet (JSON lines)
+SPOOL_PATH = "feedback_spool.jsonl"
+
+# Feedback that failed for a non-connection reason, with the error (JSON lines)
+DEAD_LETTER_PATH = "feedback_rejected.jsonl"
+
+
+class FeedbackBuffer:
+    """Queues feedback in memory and writes it in batches on a background thread."""
+
+    def __init__(self, flush_rows=FLUSH_ROWS, flush_interval=FLUSH_INTERVAL, spool_path=SPOOL_PATH,
+                 dead_letter_path=DEAD_LETTER_PATH, insert=None):
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.spool_path = spool_path
+        self.dead_letter_path = dead_letter_path
+        self._insert = insert or db_manager.insert_feedback_batch
+        self._lock = threading.Lock()          # guards _pending and metrics
+        self._flush_lock = threading.Lock()    # one flush (and spool rewrite) at a time
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pending = []
+        self.rejected = collections.deque(maxlen=100)   # (row, message) the database refused
+        self.metrics = {
+            "submitted": 0,
+            "written": 0,
+            "rejected": 0,
+            "batches": 0,           # INSERT transactions
+            "spooled": len(self._read_spool()),   # rows waiting in the spool file
+            "dead_lettered": 0,     # rows moved to the dead-letter file
+            "last_flush_at": None,
+            "errors": 0,
+            "last_error": None,
+        }
+
+    # --- Submitting ---
+
+    def submit(self, session_id, rating, comment="", anonymous=False):
+        """
+        Queues one piece of feedback. Raises db_manager.ValidationError for bad
+        input; database problems never reach the caller. Returns the number of
+        submissions now waiting.
+        """
+        row = db_manager.make_feedback(session_id, rating, comment, anonymous)
+        with self._lock:
+            self._pending.append(row)
+            self.metrics["submitted"] += 1
+            waiting = len(self._pending)
+        if waiting >= self.flush_rows:
+            self._wake.set()
+        return waiting
+
+    def pending(self):
+        """Submissions queued in memory (not counting the spool file)."""
+        with self._lock:
+            return len(self._pending)
+
+    def snapshot(self):
+        with self._lock:
+            data = dict(self.metrics)
+            data["pending"] = len(self._pending)
+        return data
+
+    # --- Writing ---
+
+    def flush(self):
+        """
+        Writes the spool file and everything queued so far, oldest first.
+        Returns the number of rows written. If the database cannot be reached
+        part-way the unwritten rows go to the spool file; a chunk failing for
+        another reason goes to the dead-letter file. Errors are only recorded.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            spooled = self._read_spool()
+            rows = spooled + batch
+            written = 0
+            for start in range(0, len(rows), self.flush_rows):
+                chunk = rows[start:start + self.flush_rows]
+                try:
+                    inserted, errors = self._insert(chunk)
+                except db_manager.ConnectionFailedError as e:
+                    self._keep(rows[start:], rewrite=bool(spooled))
+                    self._record_error(e)
+                    return written
+                except db_manager.DatabaseError as e:
+                    # Not transient: retrying would fail again and hold up everything behind it
+                    self._dead_letter(chunk, str(e))
+                    self._record_error(e)
+                    continue
+                written += inserted
+                with self._lock:
+                    self.metrics["batches"] += 1
+                    self.metrics["written"] += inserted
+                    self.metrics["rejected"] += len(errors)
+                    for index, message in errors:
+                        self.rejected.append((chunk[index], message))
+            if spooled:
+                os.remove(self.spool_path)
+            with self._lock:
+                self.metrics["spooled"] = 0
+                self.metrics["last_flush_at"] = datetime.datetime.now().replace(microsecond=0)
+            return written
+
+    def _record_error(self, e):
+        with self._lock:
+            self.metrics["errors"] += 1
+            self.metrics["last_error"] = str(e)
+
+    # --- Spool and dead-letter files ---
+
+    def _read_spool(self):
+        if not os.path.exists(self.spool_path):
+            return []
+        rows = []
+        with open(self.spool_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        pass  # a line cut short by a crash mid-write
+        return rows
+
+    def _keep(self, rows, rewrite):
+        """Saves unwritten rows: appended to the spool, or replacing it when it was being replayed."""
+        path = self.spool_path + ".tmp" if rewrite else self.spool_path
+        with open(path, "w" if rewrite else "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if rewrite:
+            os.replace(path, self.spool_path)
+        with self._lock:
+            self.metrics["spooled"] = len(rows) if rewrite else self.metrics["spooled"] + len(rows)
+
+    def _dead_letter(self, rows, message):
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({"row": row, "error": message}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        with self._lock:
+            self.metrics["dead_lettered"] += len(rows)
+            self.rejected.extend((row, message) for row in rows)
+
+    # --- Background thread ---
+
+    def start(self):
+        """Flushes every `flush_interval` seconds (sooner when flush_rows are waiting) on a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="feedback-writer", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout=None):
+        """Stops the thread and writes (or spools) whatever is still queued."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                return  # close() does the last flush
+            if self.pending() or self.metrics["spooled"]:
+                self.flush()
@@ -0,0 +1,44 @@
+import bisect
+import collections
+
+
+class IntervalIndex:
+    """
+    Busy time per student, for double-booking checks.
+
+    Each student's intervals are kept sorted by start time, so finding the
+    ones that overlap [start, end) is a binary search plus a short scan.
+    `max_length` is the longest interval that will ever be added; it bounds
+    how far back the scan has to look.
+    """
+
+    def __init__(self, max_length):
+        self.max_length = max_length
+        self._starts = collections.defaultdict(list)    # student_id -> sorted start times
+        self._entries = collections.defaultdict(list)   # student_id -> (start, end, label), same order
+
+    def add(self, student_id, start, end, label):
+        if end - start > self.max_length:
+            raise ValueError("Interval longer than the index's max_length.")
+        starts = self._starts[student_id]
+        position = bisect.bisect_right(starts, start)
+        starts.insert(position, start)
+        self._entries[student_id].insert(position, (start, end, label))
+
+    def overlapping(self, student_id, start, end):
+        """Returns [(start, end, label)] of this student's intervals overlapping [start, end)."""
+        starts = self._starts.get(student_id)
+        if not starts:
+            return []
+        entries = self._entries[student_id]
+        first = bisect.bisect_right(starts, start - self.max_length)
+        last = bisect.bisect_left(starts, end)
+        return [entry for entry in entries[first:last] if entry[1] > start]
+
+    def conflicts(self, student_ids, start, end):
+        """Returns [(student_id, start, end, label)] for every overlap among these students."""
+        found = []
+        for student_id in student_ids:
+            for entry in self.overlapping(student_id, start, end):
+                found.append((student_id,) + entry)
+        return found
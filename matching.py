@@ -0,0 +1,198 @@
+"""
+Mentor-mentee matching engine.
+
+Proposes teams by pairing every mentee who is not in a team yet with a
+mentor, based on StudentSubject. A pair scores higher for each shared
+subject, a shared department and the mentor being in a later year, and lower
+the more mentees (and scheduled sessions) the mentor already has. Only pairs
+sharing at least one subject are considered.
+
+Students are packed into flat arrays (subjects as one integer bitmask per
+student), mentors are found through a subject -> mentors index, and mentees
+with the same subjects share one ranked candidate list, so each mentee only
+looks at the first few mentors that can still beat the best one found so far.
+Assignment is greedy: the most constrained mentees pick first, each taking
+the best-scoring mentor who still has room.
+
+Usage from code:
+    result = matching.propose_teams(capacity=5)
+    team_ids, problems = db_manager.create_teams_bulk(
+        [(t.team_name(), t.mentor_id, t.mentee_ids) for t in result.teams])
+"""
+import array
+import datetime
+import time
+
+import db_manager
+
+# Mentees per mentor, counting mentees already in that mentor's teams
+DEFAULT_CAPACITY = 5
+
+WEIGHTS = {
+    "subject": 10.0,   # per shared subject
+    "dept": 3.0,       # same department
+    "year": 1.0,       # mentor is in a later year than the mentee
+    "load": 4.0,       # subtracted in proportion to how full the mentor is
+    "sessions": 0.5,   # subtracted per upcoming session the mentor leads
+}
+
+# How many available mentors a mentee compares at most. Candidates are ranked
+# by shared subjects, so this only trims ties among equally good mentors and
+# keeps large pools fast.
+CANDIDATE_WINDOW = 64
+
+
+class ProposedTeam:
+    """One mentor with the mentees the engine assigned to them."""
+
+    def __init__(self, mentor_id, mentor_name):
+        self.mentor_id = mentor_id
+        self.mentor_name = mentor_name
+        self.mentees = []   # (student_id, name, score)
+
+    @property
+    def mentee_ids(self):
+        return [m[0] for m in self.mentees]
+
+    @property
+    def score(self):
+        """Average pair score of the team."""
+        return sum(m[2] for m in self.mentees) / len(self.mentees) if self.mentees else 0.0
+
+    def team_name(self, on=None):
+        on = on or datetime.date.today()
+        return f"{self.mentor_name} ({on.isoformat()} #{self.mentor_id})"
+
+
+class MatchResult:
+    def __init__(self, teams, unmatched, seconds):
+        self.teams = teams           # ProposedTeam list, best average score first
+        self.unmatched = unmatched   # (student_id, name) of mentees nobody could take
+        self.seconds = seconds
+
+    def summary(self):
+        matched = sum(len(t.mentees) for t in self.teams)
+        return (f"{matched} mentees matched into {len(self.teams)} teams, "
+                f"{len(self.unmatched)} unmatched ({self.seconds:.2f}s).")
+
+
+class _Pool:
+    """Column arrays for one role: index i describes the i-th student."""
+
+    def __init__(self):
+        self.ids = array.array("i")
+        self.names = []
+        self.subjects = []             # int bitmask per student
+        self.dept = array.array("i")   # small integer code per department
+        self.year = array.array("i")
+
+    def add(self, student, mask, dept_code):
+        self.ids.append(student['student_id'])
+        self.names.append(student['name'])
+        self.subjects.append(mask)
+        self.dept.append(dept_code)
+        self.year.append(student['year'] or 0)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def _build_pools(data, include_assigned):
+    subject_bit = {}
+    masks = {}
+    for student_id, subject_id in data['subjects']:
+        bit = subject_bit.setdefault(subject_id, len(subject_bit))
+        masks[student_id] = masks.get(student_id, 0) | (1 << bit)
+
+    dept_codes = {}
+    mentors, mentees = _Pool(), _Pool()
+    for s in data['students']:
+        sid = s['student_id']
+        dept = dept_codes.setdefault((s['dept'] or "").strip().lower(), len(dept_codes) + 1)
+        if s['role'] == 'mentor':
+            mentors.add(s, masks.get(sid, 0), dept)
+        elif include_assigned or sid not in data['mentees_in_teams']:
+            mentees.add(s, masks.get(sid, 0), dept)
+    return mentors, mentees, len(subject_bit)
+
+
+def propose_teams(data=None, capacity=DEFAULT_CAPACITY, weights=None, include_assigned=False):
+    """
+    Computes proposed teams. `data` is db_manager.fetch_matching_data() (read
+    here if not given). With include_assigned=True mentees who are already
+    in a team are matched again too. Returns a MatchResult.
+    """
+    started = time.perf_counter()
+    if data is None:
+        data = db_manager.fetch_matching_data()
+    w = dict(WEIGHTS, **(weights or {}))
+    mentors, mentees, subject_count = _build_pools(data, include_assigned)
+
+    # Mentor load: mentees already in their teams (counts toward capacity)
+    # plus a penalty for upcoming sessions they lead.
+    load = array.array("i", (data['team_load'].get(mid, 0) for mid in mentors.ids))
+    session_penalty = array.array("d", (w['sessions'] * data['session_load'].get(mid, 0)
+                                        for mid in mentors.ids))
+
+    # subject bit -> indexes of mentors teaching it
+    by_subject = [[] for _ in range(subject_count)]
+    for i, mask in enumerate(mentors.subjects):
+        while mask:
+            low = mask & -mask
+            by_subject[low.bit_length() - 1].append(i)
+            mask ^= low
+
+    # Mentees with the same subjects share one candidate list, ranked by the
+    # subject part of the score (dept/year bonuses are added per mentee).
+    groups = {}
+    for j in range(len(mentees)):
+        groups.setdefault(mentees.subjects[j], []).append(j)
+
+    scored = []
+    for mask, members in groups.items():
+        candidates = set()
+        bits = mask
+        while bits:
+            low = bits & -bits
+            candidates.update(by_subject[low.bit_length() - 1])
+            bits ^= low
+        ranked = sorted(((w['subject'] * (mentors.subjects[i] & mask).bit_count() - session_penalty[i], i)
+                         for i in candidates), reverse=True)
+        scored.append((ranked, members))
+
+    # Most constrained mentees (fewest possible mentors) choose first.
+    scored.sort(key=lambda entry: len(entry[0]))
+
+    max_bonus = w['dept'] + w['year']
+    assigned = {}     # mentor index -> ProposedTeam
+    unmatched = []
+    for ranked, members in scored:
+        for j in members:
+            dept, year = mentees.dept[j], mentees.year[j]
+            best, best_score, skipped, looked = None, None, 0, 0
+            for base, i in ranked:
+                if best_score is not None and (base + max_bonus <= best_score or looked == CANDIDATE_WINDOW):
+                    break  # nobody further down can score higher (or we have looked far enough)
+                if load[i] >= capacity:
+                    skipped += 1
+                    continue
+                looked += 1
+                score = (base
+                         + (w['dept'] if mentors.dept[i] == dept else 0.0)
+                         + (w['year'] if mentors.year[i] > year else 0.0)
+                         - w['load'] * load[i] / capacity)
+                if best_score is None or score > best_score:
+                    best, best_score = i, score
+            if skipped > 16:
+                ranked[:] = [c for c in ranked if load[c[1]] < capacity]  # drop full mentors
+            if best is None:
+                unmatched.append((mentees.ids[j], mentees.names[j]))
+                continue
+            load[best] += 1
+            team = assigned.get(best)
+            if team is None:
+                team = assigned[best] = ProposedTeam(mentors.ids[best], mentors.names[best])
+            team.mentees.append((mentees.ids[j], mentees.names[j], round(best_score, 2)))
+
+    teams = sorted(assigned.values(), key=lambda t: t.score, reverse=True)
+    return MatchResult(teams, unmatched, time.perf_counter() - started)
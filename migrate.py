@@ -0,0 +1,210 @@
+"""
+Versioned schema migrations.
+
+setup.sql creates the base schema; every later change lives in
+migrations/NNN_description.sql and is applied once, in order. Applied
+versions are recorded in the schema_migrations table.
+
+Usage:
+    python migrate.py            # apply all pending migrations
+    python migrate.py --status   # list applied / pending migrations
+    python migrate.py --to 3     # apply pending migrations up to version 3
+
+Migration files are plain MySQL scripts; DELIMITER lines are understood the
+same way the mysql client handles them, so triggers and procedures work.
+
+The embedded SQLite backend (db_backend) has its own copies of every
+migration in migrations/sqlite/, with the same version numbers. On SQLite,
+`python migrate.py` also creates a new database from schema_sqlite.sql
+(the setup.sql equivalent) first.
+"""
+import argparse
+import os
+import re
+import sys
+
+import db_manager
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+_FILE_PATTERN = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+
+def migrations_dir():
+    """The migrations directory for the configured backend."""
+    subdir = db_manager.backend.migrations_subdir
+    return os.path.join(MIGRATIONS_DIR, subdir) if subdir else MIGRATIONS_DIR
+
+
+def list_migrations(directory=None):
+    """Returns [(version, name, path)] for every migration file, in version order."""
+    directory = directory or migrations_dir()
+    found = []
+    for filename in os.listdir(directory):
+        match = _FILE_PATTERN.match(filename)
+        if match:
+            found.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    found.sort()
+    versions = [v for v, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration version in {directory}")
+    return found
+
+
+def split_statements(sql):
+    """
+    Splits a script into statements. Honors `DELIMITER xx` lines (as used in
+    setup.sql for triggers/procedures) and skips blank and comment-only chunks.
+    """
+    statements = []
+    delimiter = ";"
+    current = []
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if stripped.upper().startswith("DELIMITER "):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        current.append(line)
+        if stripped.endswith(delimiter):
+            text = "\n".join(current).rstrip()
+            text = text[: len(text) - len(delimiter)]
+            current = []
+            if _has_code(text):
+                statements.append(text.strip())
+    if current and _has_code("\n".join(current)):
+        statements.append("\n".join(current).strip())
+    return statements
+
+
+def _has_code(text):
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("--") and not line.startswith("#"):
+            return True
+    return False
+
+
+def _ensure_table(cursor):
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(200) NOT NULL,
+        applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+
+def applied_versions():
+    """Returns the set of migration versions already applied."""
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        _ensure_table(cursor)
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+
+def create_base_schema(sample_data=True):
+    """
+    Runs the backend's base schema script (schema_sqlite.sql) on an embedded
+    database that has no tables yet; with sample_data=False only the CREATE
+    statements. Returns True if the schema was created. MySQL databases are
+    set up with setup.sql in the mysql client instead.
+    """
+    if not db_manager.backend.embedded:
+        return False
+    with open(db_manager.backend.schema_file, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'Student'")
+        if cursor.fetchone()[0]:
+            return False
+        for statement in statements:
+            if sample_data or _code(statement).upper().startswith("CREATE"):
+                cursor.execute(statement)
+        conn.commit()
+        return True
+    except Exception as e:
+        conn.rollback()
+        raise db_manager.DatabaseError(f"Creating the base schema failed: {e}") from e
+    finally:
+        conn.close()
+
+
+def _code(statement):
+    return "\n".join(l for l in statement.splitlines() if not l.strip().startswith("--")).strip()
+
+
+def pending_migrations(target=None):
+    """Returns the migrations not applied yet (optionally only up to `target`)."""
+    done = applied_versions()
+    return [m for m in list_migrations()
+            if m[0] not in done and (target is None or m[0] <= target)]
+
+
+def apply_migration(version, name, path):
+    """
+    Runs one migration file and records it. MySQL commits DDL implicitly, so a
+    failing migration may be half-applied; it is not recorded and the error is
+    raised so it can be fixed and re-run.
+    """
+    with open(path, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+            if cursor.with_rows:
+                cursor.fetchall()
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name)
+        )
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        raise db_manager.DatabaseError(f"Migration {version:03d}_{name} failed: {e}") from e
+    finally:
+        conn.close()
+
+
+def migrate(target=None, log=print):
+    """Applies every pending migration in order. Returns the list of versions applied."""
+    if create_base_schema():
+        log(f"Created a new database ({db_manager.backend.describe()}) from {os.path.basename(db_manager.backend.schema_file)}.")
+    applied = []
+    for version, name, path in pending_migrations(target):
+        log(f"Applying {version:03d}_{name} ...")
+        apply_migration(version, name, path)
+        applied.append(version)
+    if not applied:
+        log("Database schema is up to date.")
+    return applied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations.")
+    parser.add_argument("--status", action="store_true", help="show applied and pending migrations")
+    parser.add_argument("--to", type=int, dest="target", help="only apply up to this version")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.status:
+            done = applied_versions()
+            for version, name, _ in list_migrations():
+                state = "applied" if version in done else "pending"
+                print(f"{version:03d}_{name}: {state}")
+        else:
+            migrate(args.target)
+    except db_manager.DatabaseError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+-- 001: secondary indexes for the hot query paths in db_manager.py
+--
+-- InnoDB secondary indexes carry the primary key, so each of these also
+-- covers the columns those queries select.
+
+-- fetch_students_by_role(): WHERE role = ? ORDER BY name  (selects student_id, name)
+CREATE INDEX idx_student_role_name ON Student (role, name);
+
+-- fetch_sessions() / fetch_sessions_page(): ORDER BY date_time DESC, session_id DESC
+CREATE INDEX idx_session_date_time ON MentorshipSession (date_time);
+
+-- Status filters, e.g. all past 'scheduled' sessions
+CREATE INDEX idx_session_status_date_time ON MentorshipSession (status, date_time);
+
+-- MentorSessionCount(): WHERE student_id = ? AND role = 'mentor', then joins on session_id
+CREATE INDEX idx_participant_student_role ON SessionParticipant (student_id, role, session_id);
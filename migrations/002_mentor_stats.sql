@@ -0,0 +1,60 @@
+-- 002: materialized per-mentor statistics
+--
+-- One row per mentor who has completed at least one session. db_manager
+-- recomputes a mentor's row (in the same transaction) whenever one of their
+-- sessions changes status or is cancelled, so the leaderboard is a single
+-- index scan instead of a join + count per mentor.
+
+CREATE TABLE MentorStats (
+    mentor_id INT PRIMARY KEY,
+    completed_sessions INT NOT NULL DEFAULT 0,
+    total_minutes INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_count INT NOT NULL DEFAULT 0,
+    avg_rating DECIMAL(3,2),
+    FOREIGN KEY (mentor_id) REFERENCES Student(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- fetch_mentor_leaderboard(): ORDER BY completed_sessions DESC, avg_rating DESC, mentor_id DESC (read backwards)
+CREATE INDEX idx_mentorstats_leaderboard ON MentorStats (completed_sessions, avg_rating, mentor_id);
+
+-- Backfill from the existing sessions
+INSERT INTO MentorStats (mentor_id, completed_sessions, total_minutes, rating_sum, rating_count, avg_rating)
+SELECT per.student_id,
+       COUNT(*),
+       COALESCE(SUM(per.duration), 0),
+       COALESCE(SUM(per.rating_sum), 0),
+       COALESCE(SUM(per.rating_count), 0),
+       SUM(per.rating_sum) / NULLIF(SUM(per.rating_count), 0)
+FROM (
+    SELECT sp.student_id, ms.session_id, ms.duration,
+           SUM(f.rating) AS rating_sum, COUNT(f.rating) AS rating_count
+    FROM SessionParticipant sp
+    JOIN MentorshipSession ms ON ms.session_id = sp.session_id AND ms.status = 'completed'
+    LEFT JOIN Feedback f ON f.session_id = ms.session_id
+    WHERE sp.role = 'mentor'
+    GROUP BY sp.student_id, ms.session_id, ms.duration
+) per
+GROUP BY per.student_id;
+
+-- MentorSessionCount() now reads the materialized count
+DROP FUNCTION IF EXISTS MentorSessionCount;
+
+DELIMITER //
+
+CREATE FUNCTION MentorSessionCount(p_mentor_id INT)
+RETURNS INT
+READS SQL DATA
+BEGIN
+    DECLARE total_sessions INT;
+
+    SELECT completed_sessions INTO total_sessions
+    FROM MentorStats
+    WHERE mentor_id = p_mentor_id;
+
+    RETURN IFNULL(total_sessions, 0);
+END;
+//
+
+DELIMITER ;
@@ -0,0 +1,8 @@
+-- 003: past sessions are completed by a periodic sweep instead of a trigger
+--
+-- The BEFORE UPDATE trigger only fixed a row's status when something else
+-- happened to update it, and ran on every update. db_manager's
+-- complete_past_sessions() (run by session_sweep.py / the app) now updates
+-- all past 'scheduled' sessions at once via idx_session_status_date_time.
+
+DROP TRIGGER IF EXISTS update_session_status;
@@ -0,0 +1,12 @@
+-- 004: indexes for search_students()
+--
+-- Word-prefix search on name and email (e.g. "vij" finds "Maitreyi Vijay").
+-- Words shorter than innodb_ft_min_token_size (3 by default) are searched
+-- with the prefix indexes below instead.
+CREATE FULLTEXT INDEX ft_student_name_email ON Student (name, email);
+
+-- name LIKE 'abc%'  (email LIKE 'abc%' uses the UNIQUE index on email)
+CREATE INDEX idx_student_name ON Student (name);
+
+-- Filters: dept, dept + year
+CREATE INDEX idx_student_dept_year ON Student (dept, year);
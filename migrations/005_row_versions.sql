@@ -0,0 +1,12 @@
+-- 005: row versions for optimistic concurrency
+--
+-- update_student() and update_session_status() take the version the editor
+-- last read and update with WHERE ... AND version = <that version>, bumping
+-- it by one. If someone else saved in between no row matches and
+-- db_manager raises ConcurrentUpdateError instead of overwriting their
+-- change; no locks are held while the form is open. Every other UPDATE of
+-- these tables (e.g. the status sweep) bumps the version as well.
+
+ALTER TABLE Student ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1;
+
+ALTER TABLE MentorshipSession ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1;
@@ -0,0 +1,42 @@
+-- 006: set-based AddMentorshipSession for databases created before it
+--
+-- setup.sql creates the procedure with one INSERT ... SELECT over
+-- JSON_TABLE (mentor plus all mentees at once). Databases set up from an
+-- older setup.sql still have the version that looped over the mentee list
+-- one INSERT at a time; this replaces it. Needs MySQL 8.0.4+ (JSON_TABLE).
+
+DROP PROCEDURE IF EXISTS AddMentorshipSession;
+
+DELIMITER //
+
+CREATE PROCEDURE AddMentorshipSession(
+    IN p_subject_id INT,
+    IN p_date_time DATETIME,
+    IN p_duration INT,
+    IN p_mentor_id INT,
+    IN p_mentee_ids TEXT    -- comma-separated mentee IDs
+)
+BEGIN
+    DECLARE last_session_id INT;
+
+    -- 1. Insert session
+    INSERT INTO MentorshipSession(subject_id, date_time, duration)
+    VALUES (p_subject_id, p_date_time, p_duration);
+
+    SET last_session_id = LAST_INSERT_ID();
+
+    -- 2. Add mentor and all mentees in one set-based insert:
+    --    '2,3' becomes the JSON array [2,3] and JSON_TABLE turns it into rows
+    INSERT INTO SessionParticipant(session_id, student_id, role)
+    SELECT last_session_id, p_mentor_id, 'mentor'
+    UNION
+    SELECT DISTINCT last_session_id, jt.mentee_id, 'mentee'
+    FROM JSON_TABLE(
+        CONCAT('[', p_mentee_ids, ']'), '$[*]'
+        COLUMNS (mentee_id INT PATH '$')
+    ) AS jt
+    WHERE jt.mentee_id <> p_mentor_id;
+END;
+//
+
+DELIMITER ;
@@ -0,0 +1,16 @@
+-- 001 (SQLite): secondary indexes for the hot query paths in db_manager.py
+--
+-- Same indexes as ../001_hot_path_indexes.sql. SQLite indexes also carry the
+-- rowid (the INTEGER PRIMARY KEY), so they cover the same queries.
+
+-- fetch_students_by_role(): WHERE role = ? ORDER BY name  (selects student_id, name)
+CREATE INDEX idx_student_role_name ON Student (role, name);
+
+-- fetch_sessions() / fetch_sessions_page(): ORDER BY date_time DESC, session_id DESC
+CREATE INDEX idx_session_date_time ON MentorshipSession (date_time);
+
+-- Status filters, e.g. all past 'scheduled' sessions
+CREATE INDEX idx_session_status_date_time ON MentorshipSession (status, date_time);
+
+-- MentorSessionCount(): WHERE student_id = ? AND role = 'mentor', then joins on session_id
+CREATE INDEX idx_participant_student_role ON SessionParticipant (student_id, role, session_id);
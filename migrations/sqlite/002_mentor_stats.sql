@@ -0,0 +1,38 @@
+-- 002 (SQLite): materialized per-mentor statistics
+--
+-- Same table as ../002_mentor_stats.sql, maintained by the same db_manager
+-- code. MentorSessionCount() is a Python function here (db_backend), so there
+-- is nothing to redefine.
+
+CREATE TABLE MentorStats (
+    mentor_id INT PRIMARY KEY,
+    completed_sessions INT NOT NULL DEFAULT 0,
+    total_minutes INT NOT NULL DEFAULT 0,
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_count INT NOT NULL DEFAULT 0,
+    avg_rating DECIMAL(3,2),
+    FOREIGN KEY (mentor_id) REFERENCES Student(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- fetch_mentor_leaderboard(): ORDER BY completed_sessions DESC, avg_rating DESC, mentor_id DESC
+CREATE INDEX idx_mentorstats_leaderboard ON MentorStats (completed_sessions, avg_rating, mentor_id);
+
+-- Backfill from the existing sessions (1.0 * ...: SQLite divides integers as integers)
+INSERT INTO MentorStats (mentor_id, completed_sessions, total_minutes, rating_sum, rating_count, avg_rating)
+SELECT per.student_id,
+       COUNT(*),
+       COALESCE(SUM(per.duration), 0),
+       COALESCE(SUM(per.rating_sum), 0),
+       COALESCE(SUM(per.rating_count), 0),
+       ROUND(1.0 * SUM(per.rating_sum) / NULLIF(SUM(per.rating_count), 0), 2)
+FROM (
+    SELECT sp.student_id, ms.session_id, ms.duration,
+           SUM(f.rating) AS rating_sum, COUNT(f.rating) AS rating_count
+    FROM SessionParticipant sp
+    JOIN MentorshipSession ms ON ms.session_id = sp.session_id AND ms.status = 'completed'
+    LEFT JOIN Feedback f ON f.session_id = ms.session_id
+    WHERE sp.role = 'mentor'
+    GROUP BY sp.student_id, ms.session_id, ms.duration
+) per
+GROUP BY per.student_id;
@@ -0,0 +1,5 @@
+-- 003 (SQLite): past sessions are completed by a periodic sweep instead of a trigger
+--
+-- See ../003_drop_status_trigger.sql.
+
+DROP TRIGGER IF EXISTS update_session_status;
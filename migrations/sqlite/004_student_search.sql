@@ -0,0 +1,41 @@
+-- 004 (SQLite): indexes for search_students()
+--
+-- Word-prefix search on name and email uses an FTS5 index over Student
+-- (the FULLTEXT index of ../004_student_search.sql). It stores no copy of the
+-- text (content='Student'); the triggers below keep it in step with the table.
+CREATE VIRTUAL TABLE StudentSearch USING fts5(
+    name, email, content='Student', content_rowid='student_id'
+);
+
+INSERT INTO StudentSearch (StudentSearch) VALUES ('rebuild');
+
+DELIMITER //
+
+CREATE TRIGGER student_search_insert AFTER INSERT ON Student
+BEGIN
+    INSERT INTO StudentSearch (rowid, name, email) VALUES (NEW.student_id, NEW.name, NEW.email);
+END;
+//
+
+CREATE TRIGGER student_search_delete AFTER DELETE ON Student
+BEGIN
+    INSERT INTO StudentSearch (StudentSearch, rowid, name, email)
+    VALUES ('delete', OLD.student_id, OLD.name, OLD.email);
+END;
+//
+
+CREATE TRIGGER student_search_update AFTER UPDATE OF name, email ON Student
+BEGIN
+    INSERT INTO StudentSearch (StudentSearch, rowid, name, email)
+    VALUES ('delete', OLD.student_id, OLD.name, OLD.email);
+    INSERT INTO StudentSearch (rowid, name, email) VALUES (NEW.student_id, NEW.name, NEW.email);
+END;
+//
+
+DELIMITER ;
+
+-- name LIKE 'abc%'  (SQLite only uses an index for LIKE on a NOCASE column)
+CREATE INDEX idx_student_name ON Student (name);
+
+-- Filters: dept, dept + year
+CREATE INDEX idx_student_dept_year ON Student (dept, year);
@@ -0,0 +1,7 @@
+-- 005 (SQLite): row versions for optimistic concurrency
+--
+-- See ../005_row_versions.sql.
+
+ALTER TABLE Student ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+
+ALTER TABLE MentorshipSession ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
@@ -0,0 +1,6 @@
+-- 006 (SQLite): set-based AddMentorshipSession
+--
+-- See ../006_add_session_procedure.sql. SQLite has no stored procedures;
+-- db_backend implements AddMentorshipSession in Python (one executemany for
+-- all participants), so there is nothing to change here. The file keeps the
+-- version numbers of both migration sets in step.
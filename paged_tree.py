@@ -0,0 +1,151 @@
+import tree_sync
+
+
+class PagedTreeLoader:
+    """
+    Fills a Treeview one page at a time as the user scrolls.
+
+    Only the first page is loaded up front; whenever the visible part of the
+    tree gets close to the last loaded row, the next page is fetched in the
+    background (keyset pagination via `page_key`). The total row count is
+    fetched separately so the status bar can say "showing X of Y".
+
+    Rows are inserted with the primary key as the Treeview item id, and all
+    widget changes go through a tree_sync.TreeSync, so refresh() and the
+    row_* methods only touch rows that actually changed.
+    """
+
+    def __init__(self, tree, worker, name, fetch_page, count, row_key, row_values,
+                 page_key, scrollbar=None, page_size=200, threshold=0.9, on_loaded=None,
+                 on_error=None, on_rows=None):
+        self.tree = tree
+        self.worker = worker
+        self.name = name
+        self.fetch_page = fetch_page     # fetch_page(after, limit) -> list of rows
+        self.count = count               # count() -> total rows
+        self.rows = tree_sync.TreeSync(tree, row_key, row_values)
+        self.page_key = page_key         # row -> keyset cursor for the next page
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self.threshold = threshold
+        self.on_loaded = on_loaded       # on_loaded(loaded, total)
+        self.on_error = on_error
+        self.on_rows = on_rows           # on_rows(rows, replaced): every fetched page, e.g. to keep extra row data
+
+        self.after = None
+        self.total = None
+        self.loaded = 0
+        self.loading = False
+        self.exhausted = False
+
+        self.tree.configure(yscrollcommand=self._on_scroll)
+
+    # --- Public API ---
+
+    def reload(self):
+        """Clears the tree and starts again from the first page."""
+        self.after = None
+        self.total = None
+        self.loaded = 0
+        self.loading = False
+        self.exhausted = False
+        self.rows.clear()
+        self._fetch_total()
+        self.load_more()
+
+    def refresh(self):
+        """
+        Re-reads the rows currently loaded and applies only the differences
+        (new, changed, removed or moved rows) to the tree.
+        """
+        limit = max(self.loaded, self.page_size)
+        self.loading = True
+        self._fetch_total()
+        self.worker.submit(self.fetch_page, None, limit,
+                           key=f"{self.name}_page", label=f"Refreshing {self.name}",
+                           on_success=lambda rows: self._replace_rows(rows, limit),
+                           on_error=self._page_failed)
+
+    def row_added(self, row, at_end=True):
+        """
+        Shows a row the caller has just inserted. Rows that sort at the end are
+        only shown once every earlier page is loaded; otherwise they will
+        arrive with a later page.
+        """
+        if self.total is not None:
+            self.total += 1
+        if at_end and self.exhausted:
+            if self.rows.upsert(row) == "inserted":
+                self.loaded += 1
+        self._report()
+
+    def row_changed(self, row):
+        """Updates a row in place if it is currently shown."""
+        if self.rows.row_key(row) in self.rows:
+            self.rows.upsert(row)
+
+    def row_removed(self, key):
+        """Removes a row the caller has just deleted."""
+        if self.rows.remove(key):
+            self.loaded -= 1
+        if self.total:
+            self.total -= 1
+        self._report()
+
+    def _fetch_total(self):
+        self.worker.submit(self.count, key=f"{self.name}_count", label=f"Counting {self.name}",
+                           on_success=self._set_total, on_error=self.on_error)
+
+    def load_more(self):
+        """Fetches the next page unless one is already on its way."""
+        if self.loading or self.exhausted:
+            return
+        self.loading = True
+        self.worker.submit(self.fetch_page, self.after, self.page_size,
+                           key=f"{self.name}_page", label=f"Loading {self.name}",
+                           on_success=self._append_page, on_error=self._page_failed)
+
+    # --- Callbacks ---
+
+    def _append_page(self, rows):
+        self.loading = False
+        self.loaded += self.rows.append(rows)
+        if self.on_rows is not None:
+            self.on_rows(rows, False)
+        if rows:
+            self.after = self.page_key(rows[-1])
+        if len(rows) < self.page_size:
+            self.exhausted = True
+        self._report()
+        # If the first page does not fill the view, the scroll callback will
+        # ask for more on the next redraw.
+
+    def _replace_rows(self, rows, limit):
+        self.loading = False
+        self.rows.sync(rows)
+        self.loaded = len(self.rows)
+        if self.on_rows is not None:
+            self.on_rows(rows, True)
+        self.after = self.page_key(rows[-1]) if rows else None
+        self.exhausted = len(rows) < limit
+        self._report()
+
+    def _page_failed(self, error):
+        self.loading = False
+        if self.on_error is None:
+            raise error
+        self.on_error(error)
+
+    def _set_total(self, total):
+        self.total = total
+        self._report()
+
+    def _report(self):
+        if self.on_loaded is not None:
+            self.on_loaded(self.loaded, self.total)
+
+    def _on_scroll(self, first, last):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        if float(last) >= self.threshold:
+            self.load_more()
@@ -0,0 +1,196 @@
+import collections
+import threading
+import time
+
+
+class TTLCache:
+    """
+    A small thread-safe cache for reference data (mentor/mentee lists, subjects).
+
+    get(key, loader) returns the cached value while it is younger than `ttl`
+    seconds, otherwise calls loader() once (other threads asking for the same
+    key wait for that load instead of querying again) and caches the result.
+    Writers call invalidate() so the next get() reloads.
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}      # key -> (value, loaded_at)
+        self._key_locks = {}    # key -> lock held while that key is loading
+        self._versions = {}     # key -> bumped on invalidate, to drop in-flight loads
+        self._generation = 0    # bumped by invalidate_all
+        self._listeners = []
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, key, loader):
+        """Returns the cached value for key, loading it with loader() if missing or expired."""
+        value = self._fresh(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have loaded it while we waited.
+            value = self._fresh(key)
+            if value is not None:
+                return value
+            with self._lock:
+                self.stats["misses"] += 1
+                version = self._versions.get(key, 0)
+                generation = self._generation
+            value = loader()
+            with self._lock:
+                # Skip storing if the key (or the whole cache) was invalidated mid-load.
+                if self._generation == generation and self._versions.get(key, 0) == version:
+                    self._entries[key] = (value, time.monotonic())
+            return value
+
+    def _fresh(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                self.stats["hits"] += 1
+                return entry[0]
+            return None
+
+    def invalidate(self, *keys):
+        """Drops the given keys and notifies listeners."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self.stats["invalidations"] += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(keys)
+
+    def invalidate_all(self):
+        """Drops every key, including values still being loaded, and notifies listeners."""
+        with self._lock:
+            keys = tuple(self._entries)
+            self._entries.clear()
+            self._generation += 1
+            self.stats["invalidations"] += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(keys)
+
+    def add_listener(self, callback):
+        """callback(keys) is called (on the invalidating thread) after keys are dropped."""
+        with self._lock:
+            self._listeners.append(callback)
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe cache for per-key data loaded in batches (e.g.
+    team members by team_id).
+
+    get_many(keys, loader) serves what it can from memory and loads all the
+    missing keys with one loader(missing_keys) call, which must return a dict
+    covering every key asked for. Once more than `maxsize` keys are cached,
+    the least recently used ones are dropped.
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, maxsize=500):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()   # key -> value, least recently used first
+        self._versions = {}     # key -> bumped on invalidate, to drop in-flight loads
+        self._generation = 0    # bumped by invalidate_all
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def peek(self, key, default=None):
+        """Returns the cached value without loading (still counts as a use)."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return self._entries[key]
+
+    def get_many(self, keys, loader):
+        """Returns {key: value} for keys, loading the missing ones in one loader() call."""
+        found, missing = {}, []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+                else:
+                    missing.append(key)
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(missing)
+            versions = {key: self._versions.get(key, 0) for key in missing}
+            generation = self._generation
+        if not missing:
+            return found
+
+        loaded = loader(missing)
+        with self._lock:
+            for key in missing:
+                found[key] = loaded[key]
+                # Skip storing keys invalidated while we were loading them.
+                if self._generation == generation and self._versions.get(key, 0) == versions[key]:
+                    self._entries[key] = loaded[key]
+                    self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return found
+
+    def get(self, key, loader):
+        """Single-key form of get_many(); loader still takes a list of keys."""
+        return self.get_many([key], loader)[key]
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self.stats["invalidations"] += 1
+
+    def invalidate_all(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.stats["invalidations"] += 1
+
+
+class Lookup:
+    """
+    Reference rows indexed for O(1) resolution: by ID and by the label shown
+    in comboboxes/listboxes. Unless names are unique (unique_names=True), the
+    label carries the ID ("Name (#12)"), so every label maps back to exactly
+    one row even when two students share a name.
+
+    Built once per cache load; treat it as read-only.
+    """
+
+    def __init__(self, rows, id_field, name_field, unique_names=False):
+        self.rows = rows
+        self.id_field = id_field
+        self.name_field = name_field
+        self.unique_names = unique_names
+        self.by_id = {row[id_field]: row for row in rows}
+        self.labels = [self.label(row) for row in rows]
+        self.by_label = dict(zip(self.labels, rows))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def label(self, row):
+        if self.unique_names:
+            return row[self.name_field]
+        return f"{row[self.name_field]} (#{row[self.id_field]})"
+
+    def id_for(self, label):
+        """The ID behind a label, or None if the label is unknown (e.g. stale)."""
+        row = self.by_label.get(label)
+        return None if row is None else row[self.id_field]
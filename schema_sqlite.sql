@@ -0,0 +1,310 @@
+-- SQLite version of setup.sql: the same base schema and sample data for the
+-- embedded backend (see db_backend.py). db_manager / migrate.py create it in
+-- a new database file; later changes live in migrations/sqlite/.
+--
+-- Differences from the MySQL script:
+-- - ENUMs are TEXT columns with a CHECK; text columns compare case-insensitively
+--   (COLLATE NOCASE) like MySQL's default collation.
+-- - CHECK constraints are named so errors say which column was wrong.
+-- - The status trigger is an AFTER UPDATE trigger (SQLite cannot assign NEW.*).
+-- - AddMentorshipSession and MentorSessionCount are Python functions registered
+--   on every connection by db_backend.SQLiteConnection.
+-- - DELIMITER lines work as in setup.sql (migrate.split_statements).
+
+-- TABLE DEFINITIONS
+
+CREATE TABLE Student (
+    student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) COLLATE NOCASE NOT NULL,
+    email VARCHAR(100) COLLATE NOCASE UNIQUE NOT NULL,
+    ph_no VARCHAR(15) UNIQUE,
+    role TEXT NOT NULL CONSTRAINT role_value CHECK (role IN ('mentor', 'mentee')),
+    dept VARCHAR(50) COLLATE NOCASE,
+    year INT CONSTRAINT year_range CHECK (year BETWEEN 1 AND 4)
+);
+
+CREATE TABLE Subject (
+    subject_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subject_name VARCHAR(100) COLLATE NOCASE UNIQUE NOT NULL,
+    description TEXT
+);
+
+CREATE TABLE Team (
+    team_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    team_name VARCHAR(100) COLLATE NOCASE UNIQUE NOT NULL,
+    mentor_id INT,
+    creation_date DATE,
+    FOREIGN KEY (mentor_id) REFERENCES Student(student_id)
+        ON DELETE SET NULL ON UPDATE CASCADE
+);
+
+-- Junction Table: connects teams ↔ students
+CREATE TABLE TeamMember (
+    team_id INT,
+    student_id INT,
+    role TEXT NOT NULL CONSTRAINT role_value CHECK (role IN ('mentor', 'mentee')),
+    PRIMARY KEY (team_id, student_id),
+    FOREIGN KEY (team_id) REFERENCES Team(team_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY (student_id) REFERENCES Student(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- Junction Table: connects students ↔ subjects
+CREATE TABLE StudentSubject (
+    student_id INT,
+    subject_id INT,
+    PRIMARY KEY (student_id, subject_id),
+    FOREIGN KEY (student_id) REFERENCES Student(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY (subject_id) REFERENCES Subject(subject_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+CREATE TABLE MentorshipSession (
+    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subject_id INT,
+    date_time DATETIME,
+    duration INT,
+    status TEXT DEFAULT 'scheduled'
+        CONSTRAINT status_value CHECK (status IN ('scheduled', 'completed', 'cancelled')),
+    FOREIGN KEY (subject_id) REFERENCES Subject(subject_id)
+        ON DELETE SET NULL ON UPDATE CASCADE
+);
+
+-- Junction Table: connects sessions ↔ students
+CREATE TABLE SessionParticipant (
+    session_id INT,
+    student_id INT,
+    role TEXT NOT NULL CONSTRAINT role_value CHECK (role IN ('mentor', 'mentee')),
+    PRIMARY KEY (session_id, student_id),
+    FOREIGN KEY (session_id) REFERENCES MentorshipSession(session_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY (student_id) REFERENCES Student(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+CREATE TABLE Feedback (
+    feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id INT,
+    rating INT CONSTRAINT rating_range CHECK (rating BETWEEN 1 AND 5),
+    comment TEXT,
+    anonymous BOOLEAN DEFAULT FALSE,
+    FOREIGN KEY (session_id) REFERENCES MentorshipSession(session_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- INSERTING DATA
+
+-- STUDENTS
+INSERT INTO Student (name, email, ph_no, role, dept, year) VALUES
+('Maitreyi Vijay', 'maitreyi@univ.edu', '9876543210', 'mentor', 'CSE', 4),
+('Mahith Das', 'mahithk@univ.edu', '9876501234', 'mentee', 'CSE', 2),
+('Aditya Kumar', 'adityak@univ.edu', '9876505678', 'mentee', 'CSE', 1),
+('Divya Singh', 'divyasingh@univ.edu', '8976512345', 'mentor', 'ECE', 4),
+('Esha Patel', 'eshapatel@univ.edu', '7762523456', 'mentee', 'ECE', 2),
+('Ravi Sharma', 'ravisharma@univ.edu', '9123456789', 'mentor', 'Physics', 4),
+('Neha Reddy', 'nehareddy@univ.edu', '9234567890', 'mentor', 'Chemistry', 4),
+('Arjun Mehta', 'arjunmehta@univ.edu', '9345678901', 'mentor', 'Mathematics', 4),
+('Kavya Iyer', 'kavyaiyer@univ.edu', '9456789012', 'mentee', 'Mathematics', 1),
+('Suresh Rao', 'sureshr@univ.edu', '9567890123', 'mentee', 'Physics', 2),
+('Pooja Sharma', 'pooja@univ.edu', '9678901234', 'mentee', 'CSE', 3),
+('Rahul Verma', 'rahulv@univ.edu', '9789012345', 'mentee', 'ECE', 1),
+('Ananya Gupta', 'ananyag@univ.edu', '9890123456', 'mentee', 'Physics', 1),
+('Karan Singh', 'karans@univ.edu', '9901234567', 'mentee', 'Chemistry', 3),
+('Simran Kaur', 'simrank@univ.edu', '9912345678', 'mentee', 'Mathematics', 2);
+
+-- SUBJECTS
+INSERT INTO Subject (subject_name, description) VALUES
+('Data Structures', 'Study of linear and non-linear data structures'),
+('Databases', 'Relational databases, SQL queries, normalization'),
+('Computer Networks', 'Networking protocols and communication'),
+('Digital Electronics', 'Logic gates, sequential circuits, combinational circuits'),
+('Microprocessors', 'Architecture and programming of microprocessors'),
+('Engineering Physics', 'Mechanics, waves, optics, and modern physics'),
+('Engineering Chemistry', 'Chemical bonding, electrochemistry, polymers, nanomaterials'),
+('Engineering Mathematics', 'Calculus, linear algebra, differential equations');
+
+-- TEAMS
+INSERT INTO Team (team_name, mentor_id, creation_date) VALUES
+('CSE Mentors', 1, '2025-09-01'),
+('ECE Mentors', 4, '2025-09-02'),
+('Physics Mentors', 6, '2025-09-03'),
+('Chemistry Mentors', 7, '2025-09-04'),
+('Math Mentors', 8, '2025-09-05'),
+('CSE Advanced Mentors', 1, '2025-09-06'),
+('ECE Beginners', 4, '2025-09-07');
+
+-- TEAM MEMBERS
+INSERT INTO TeamMember (team_id, student_id, role) VALUES
+-- CSE
+(1, 1, 'mentor'),
+(1, 2, 'mentee'),
+(1, 3, 'mentee'),
+
+-- ECE
+(2, 4, 'mentor'),
+(2, 5, 'mentee'),
+
+-- Physics
+(3, 6, 'mentor'),
+(3, 10, 'mentee'),
+
+-- Chemistry
+(4, 7, 'mentor'),
+(4, 5, 'mentee'),
+
+-- Math
+(5, 8, 'mentor'),
+(5, 9, 'mentee'),
+(5, 2, 'mentee'),
+
+-- CSE Advanced
+(6, 1, 'mentor'),
+(6, 11, 'mentee'),
+
+-- ECE Beginners
+(7, 4, 'mentor'),
+(7, 12, 'mentee');
+
+-- STUDENT SUBJECTS
+INSERT INTO StudentSubject (student_id, subject_id) VALUES
+(1, 1),  -- Maitreyi teaches Data Structures
+(2, 1),  -- Mahith learning DS
+(3, 2),  -- Aditya learning Databases
+(4, 4),  -- Divya teaches Digital Electronics
+(5, 5),  -- Esha learning Microprocessors
+(6, 6),  -- Ravi teaches Physics
+(7, 7),  -- Neha teaches Chemistry
+(8, 8),  -- Arjun teaches Math
+(9, 8),  -- Kavya learning Math
+(10, 6), -- Suresh learning Physics
+(11, 1), -- Pooja learning Data Structures
+(12, 4), -- Rahul learning Digital Electronics
+(13, 6), -- Ananya learning Physics
+(14, 7), -- Karan learning Chemistry
+         -- Simran learning Mathematics:
+(15, 8);
+
+-- MENTORSHIP SESSIONS
+INSERT INTO MentorshipSession (subject_id, date_time, duration, status) VALUES
+(1, '2025-09-10 10:00:00', 60, 'scheduled'),   -- DS session
+(2, '2025-09-11 11:00:00', 45, 'completed'),   -- DB session
+(4, '2025-09-12 14:00:00', 50, 'scheduled'),   -- Digital Electronics
+(6, '2025-09-13 09:00:00', 40, 'completed'),   -- Physics
+(7, '2025-09-14 16:00:00', 55, 'scheduled'),   -- Chemistry
+(8, '2025-09-15 17:00:00', 60, 'completed'),  -- Math
+(1, '2025-09-10 10:00:00', 60, 'scheduled'),
+(2, '2025-09-11 11:00:00', 45, 'completed'),
+(4, '2025-09-12 14:00:00', 50, 'scheduled'),
+(6, '2025-09-13 09:00:00', 40, 'completed'),
+(7, '2025-09-14 16:00:00', 55, 'scheduled'),
+(8, '2025-09-15 17:00:00', 60, 'completed'),
+(1, datetime('now', 'localtime', '+1 days'), 60, 'scheduled'),
+(4, datetime('now', 'localtime', '+2 days'), 45, 'scheduled'),
+(6, datetime('now', 'localtime', '+3 days'), 50, 'scheduled'),
+(7, datetime('now', 'localtime', '+4 days'), 55, 'scheduled'),
+(8, datetime('now', 'localtime', '+5 days'), 60, 'scheduled');
+
+-- SESSION PARTICIPANTS
+INSERT INTO SessionParticipant (session_id, student_id, role) VALUES
+-- Session 1: CSE DS
+(1, 1, 'mentor'),
+(1, 2, 'mentee'),
+
+-- Session 2: Databases
+(2, 1, 'mentor'),
+(2, 3, 'mentee'),
+
+-- Session 3: Digital Electronics
+(3, 4, 'mentor'),
+(3, 5, 'mentee'),
+
+-- Session 4: Physics
+(4, 6, 'mentor'),
+(4, 10, 'mentee'),
+
+-- Session 5: Chemistry
+(5, 7, 'mentor'),
+(5, 5, 'mentee'),
+
+-- Session 6: Mathematics
+(6, 8, 'mentor'),
+(6, 9, 'mentee'),
+(6, 2, 'mentee'),
+
+-- Session 7: CSE Advanced
+(7, 1, 'mentor'),
+(7, 11, 'mentee'),
+
+-- Session 8: ECE Beginners
+(8, 4, 'mentor'),
+(8, 12, 'mentee'),
+
+-- Session 9: Physics Extended
+(9, 6, 'mentor'),
+(9, 13, 'mentee'),
+
+-- Session 10: Chemistry Advanced
+(10, 7, 'mentor'),
+(10, 14, 'mentee'),
+
+-- Session 11: Math Advanced
+(11, 8, 'mentor'),
+(11, 15, 'mentee');
+
+-- FEEDBACK
+INSERT INTO Feedback (session_id, rating, comment, anonymous) VALUES
+(1, 5, 'Great explanation of linked lists!', FALSE),
+(2, 4, 'Good session but needed more examples.', TRUE),
+(3, 5, 'Really clear teaching style.', FALSE),
+(4, 4, 'Helped me understand mechanics better.', FALSE),
+(5, 3, 'Some parts were confusing.', TRUE),
+(6, 5, 'Excellent Math mentor!', FALSE),
+(1, 5, 'Great explanation of linked lists!', FALSE),
+(2, 4, 'Good session but needed more examples.', TRUE),
+(3, 5, 'Really clear teaching style.', FALSE),
+(4, 4, 'Helped me understand mechanics better.', FALSE),
+(5, 3, 'Some parts were confusing.', TRUE),
+(6, 5, 'Excellent Math mentor!', FALSE),
+(7, 5, 'DS session was very helpful!', FALSE),
+(8, 4, 'Clear explanation of circuits.', TRUE),
+(9, 5, 'Physics mentor is excellent!', FALSE),
+(10, 4, 'Chemistry session clarified doubts.', TRUE),
+(11, 5, 'Math mentor is great!', FALSE);
+
+-- 1. Trigger: a scheduled session in the past is completed when its row is updated
+
+DELIMITER //
+
+CREATE TRIGGER update_session_status
+AFTER UPDATE ON MentorshipSession
+FOR EACH ROW
+WHEN NEW.status = 'scheduled' AND NEW.date_time < NOW()
+BEGIN
+    UPDATE MentorshipSession SET status = 'completed' WHERE session_id = NEW.session_id;
+END;
+//
+
+DELIMITER ;
+
+-- Insert a session in the past, then update it to fire the trigger
+INSERT INTO MentorshipSession(subject_id, date_time, duration, status)
+VALUES (1, '2025-01-01 10:00:00', 60, 'scheduled');
+
+UPDATE MentorshipSession
+SET duration = 90
+WHERE session_id = last_insert_rowid();
+
+-- 2. AddMentorshipSession: what setup.sql's CALL creates (Databases, 2025-10-30
+--    14:00, 45 min, mentor 1, mentees 2 and 3)
+INSERT INTO MentorshipSession(subject_id, date_time, duration)
+VALUES (2, '2025-10-30 14:00:00', 45);
+
+INSERT INTO SessionParticipant(session_id, student_id, role) VALUES
+((SELECT MAX(session_id) FROM MentorshipSession), 1, 'mentor'),
+((SELECT MAX(session_id) FROM MentorshipSession), 2, 'mentee'),
+((SELECT MAX(session_id) FROM MentorshipSession), 3, 'mentee');
+
+-- 3. MentorSessionCount(p_mentor_id) is registered by db_backend; e.g.
+--    SELECT MentorSessionCount(1) AS TotalCompletedSessions;
@@ -0,0 +1,90 @@
+"""
+Periodic sweep that marks past 'scheduled' sessions as 'completed'.
+
+The app runs a sweep every db_manager.SWEEP_INTERVAL seconds on its
+background worker. Without the app (e.g. on a server) run:
+
+    python session_sweep.py              # sweep every SWEEP_INTERVAL seconds
+    python session_sweep.py --interval 300
+    python session_sweep.py --once       # one sweep, then exit
+"""
+import argparse
+import datetime
+import sys
+import threading
+import time
+
+import db_manager
+
+
+class SessionSweeper:
+    """Runs db_manager.complete_past_sessions() and keeps metrics about the runs."""
+
+    def __init__(self, interval=db_manager.SWEEP_INTERVAL, sweep=None):
+        self.interval = interval
+        self._sweep = sweep or db_manager.complete_past_sessions
+        self._lock = threading.Lock()
+        self.metrics = {
+            "runs": 0,
+            "rows_touched": 0,      # sessions completed over all runs
+            "last_rows": None,
+            "last_run_at": None,
+            "last_seconds": None,
+            "errors": 0,
+            "last_error": None,
+        }
+
+    def run_once(self):
+        """Runs one sweep now. Returns the number of sessions completed."""
+        started = time.perf_counter()
+        try:
+            rows = self._sweep()
+        except db_manager.DatabaseError as e:
+            with self._lock:
+                self.metrics["errors"] += 1
+                self.metrics["last_error"] = str(e)
+            raise
+        with self._lock:
+            self.metrics["runs"] += 1
+            self.metrics["rows_touched"] += rows
+            self.metrics["last_rows"] = rows
+            self.metrics["last_run_at"] = datetime.datetime.now().replace(microsecond=0)
+            self.metrics["last_seconds"] = round(time.perf_counter() - started, 3)
+        return rows
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.metrics)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mark past scheduled sessions as completed.")
+    parser.add_argument("--interval", type=float, default=db_manager.SWEEP_INTERVAL,
+                        help=f"seconds between sweeps (default {db_manager.SWEEP_INTERVAL})")
+    parser.add_argument("--once", action="store_true", help="run a single sweep and exit")
+    args = parser.parse_args(argv)
+
+    sweeper = SessionSweeper(interval=args.interval)
+    try:
+        if args.once:
+            print(f"{sweeper.run_once()} sessions completed.")
+            return 0
+        while True:
+            try:
+                rows = sweeper.run_once()
+                if rows:
+                    print(f"{datetime.datetime.now():%Y-%m-%d %H:%M:%S}  {rows} sessions completed")
+            except db_manager.DatabaseError as e:
+                print(f"{datetime.datetime.now():%Y-%m-%d %H:%M:%S}  sweep failed: {e}", file=sys.stderr)
+            time.sleep(args.interval)
+    except db_manager.DatabaseError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        db_manager.close_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import bisect
+import tkinter as tk
+
+
+class TreeSync:
+    """
+    Keeps a flat Treeview in step with a list of rows, keyed by primary key.
+
+    The Treeview item id of every row is str(row_key(row)), and the values last
+    written for each item are remembered, so an update only touches items that
+    were actually inserted, changed or removed instead of deleting and
+    re-inserting everything.
+    """
+
+    def __init__(self, tree, row_key, row_values):
+        self.tree = tree
+        self.row_key = row_key
+        self.row_values = row_values
+        self.shadow = {}   # item id -> values tuple currently shown
+
+    def __len__(self):
+        return len(self.shadow)
+
+    def __contains__(self, key):
+        return str(key) in self.shadow
+
+    def clear(self):
+        if self.shadow:
+            self.tree.delete(*self.shadow)
+        self.shadow = {}
+
+    def append(self, rows):
+        """Adds rows at the end (rows already shown are updated in place). Returns rows inserted."""
+        inserted = 0
+        for row in rows:
+            if self.upsert(row) == "inserted":
+                inserted += 1
+        return inserted
+
+    def upsert(self, row, index=tk.END):
+        """Inserts or updates a single row. Returns 'inserted', 'updated' or None (unchanged)."""
+        iid = str(self.row_key(row))
+        values = tuple(self.row_values(row))
+        old = self.shadow.get(iid)
+        if old is None:
+            self.tree.insert("", index, iid=iid, values=values)
+            self.shadow[iid] = values
+            return "inserted"
+        if old != values:
+            self.tree.item(iid, values=values)
+            self.shadow[iid] = values
+            return "updated"
+        return None
+
+    def remove(self, key):
+        """Removes the row with this primary key, if shown. Returns True if it was."""
+        iid = str(key)
+        if iid not in self.shadow:
+            return False
+        self.tree.delete(iid)
+        del self.shadow[iid]
+        return True
+
+    def sync(self, rows):
+        """
+        Makes the tree show exactly `rows`, in order.
+        Returns a dict with the number of inserted/updated/removed/moved items.
+        """
+        wanted = [str(self.row_key(row)) for row in rows]
+        wanted_set = set(wanted)
+        stats = {"inserted": 0, "updated": 0, "removed": 0, "moved": 0}
+
+        removed = [iid for iid in self.shadow if iid not in wanted_set]
+        if removed:
+            self.tree.delete(*removed)
+            for iid in removed:
+                del self.shadow[iid]
+            stats["removed"] = len(removed)
+
+        for index, row in enumerate(rows):
+            result = self.upsert(row, index=index)
+            if result:
+                stats[result] += 1
+
+        # Only reorder when the order actually changed (e.g. a renamed team),
+        # and then only move the items outside the longest run already in order.
+        current = self.tree.get_children()
+        if list(current) != wanted:
+            position = {iid: i for i, iid in enumerate(current)}
+            in_order = _increasing_subsequence([position[iid] for iid in wanted])
+            for index, iid in enumerate(wanted):
+                if index in in_order:
+                    continue
+                # Everything before `index` is in place by now; detach first so index() is exact.
+                self.tree.detach(iid)
+                self.tree.move(iid, "", self.tree.index(wanted[index - 1]) + 1 if index else 0)
+                stats["moved"] += 1
+        return stats
+
+
+def _increasing_subsequence(seq):
+    """Indexes into seq of one longest strictly increasing subsequence (O(n log n))."""
+    tails, tail_index = [], []      # smallest tail value / its index, per subsequence length
+    previous = [-1] * len(seq)
+    for i, value in enumerate(seq):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[length] = value
+            tail_index[length] = i
+        previous[i] = tail_index[length - 1] if length else -1
+    result = set()
+    i = tail_index[-1] if tail_index else -1
+    while i != -1:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+def sync_listbox(listbox, old_rows, new_rows, row_key, row_label):
+    """
+    Updates a Listbox showing old_rows so it shows new_rows, touching only the
+    entries that differ. Selections on unchanged entries are kept.
+
+    Entries are matched by key: the longest run of unchanged entries that is
+    still in order stays, everything else is deleted and re-inserted.
+    """
+    old = [(row_key(r), row_label(r)) for r in old_rows]
+    new = [(row_key(r), row_label(r)) for r in new_rows]
+    old_index = {entry: i for i, entry in enumerate(old)}
+    matched = [(j, old_index[entry]) for j, entry in enumerate(new) if entry in old_index]
+    kept_old, kept_new = set(), set()
+    for k in _increasing_subsequence([i for _, i in matched]):
+        kept_new.add(matched[k][0])
+        kept_old.add(matched[k][1])
+    # Delete from the end so earlier indices stay valid ...
+    for i in range(len(old) - 1, -1, -1):
+        if i not in kept_old:
+            listbox.delete(i)
+    # ... then insert front to back: entries before j are final by then.
+    for j, (_, label) in enumerate(new):
+        if j not in kept_new:
+            listbox.insert(j, label)